@@ -32,5 +32,5 @@ __epilog__ = 'Report bugs and feature requests to <{0}>.' \
 try:
     __license_text__ =\
         pkg_resources.resource_string(__name__, 'LICENSE').decode()
-except RuntimeError:
+except (OSError, RuntimeError):
     __license_text__ = ''
@@ -8,12 +8,17 @@
 # Built-in dependencies
 
 import argparse
+import os
+from concurrent import futures
+from typing import Iterator
 
 # Package dependencies
 
+from geodatabr import __meta__
 from geodatabr.commands import encode
-from geodatabr.core import commands, encoders, i18n, logging
-from geodatabr.core.utils import documentation, io
+from geodatabr.core import commands, datasets, encoders, i18n, logging
+from geodatabr.core.utils import compression, documentation, io, manifest
+from geodatabr.dataset import schema, serializers
 
 # Classes
 
@@ -34,7 +39,8 @@ class BuildCommand(commands.Command):
     @property
     def usage(self) -> str:
         """Gets the command usage syntax."""
-        return '%(prog)s [-l LOCALE] [-f FORMAT]'
+        return ('%(prog)s [-l LOCALE] [-f FORMAT] [-c CODEC [--level LEVEL]] '
+                '[-j JOBS] [--force]')
 
     def configure(self):
         """Defines the command arguments."""
@@ -57,6 +63,27 @@ class BuildCommand(commands.Command):
                          help=('File formats to build the dataset.\n'
                                'Options: %(choices)s\n'
                                'Defaults to all available.'))
+        self.addArgument('-c', '--compress',
+                         metavar='CODEC',
+                         choices=compression.names(),
+                         help=('Codec to compress the dataset files.\n'
+                               'Options: %(choices)s'))
+        self.addArgument('--level',
+                         metavar='LEVEL',
+                         type=int,
+                         help=('Compression level.\n'
+                               'Defaults to the codec default level.'))
+        self.addArgument('-j', '--jobs',
+                         metavar='JOBS',
+                         type=int,
+                         default=os.cpu_count() or 1,
+                         help=('Number of dataset files encoded in parallel\n'
+                               'processes.\n'
+                               'Default: %(default)s'))
+        self.addArgument('--force',
+                         action='store_true',
+                         help=('Build all dataset files, even those whose\n'
+                               'inputs have not changed since last built.'))
 
     def handle(self, args: argparse.Namespace):
         """
@@ -65,33 +92,262 @@ class BuildCommand(commands.Command):
         Args:
             args: The command arguments
         """
+        if args.jobs < 1:
+            self._parser.error('The number of jobs should be positive.')
+
+        if args.compress:
+            try:
+                compression.find(args.compress).checkLevel(args.level)
+            except ValueError as error:
+                self._parser.error(str(error))
+        elif args.level is not None:
+            self._parser.error(
+                'You need to give the codec you want to compress with.')
+
         try:
-            encoder = encode.EncodeCommand(self.application)
             logger = logging.logger()
+            manifests = {}
+            jobs = []
 
-            for locale in args.locales:
-                i18n.Translator.locale = locale
+            logger.info('Loading dataset...')
 
-                logger.info('> Building locale: %s', locale)
+            datasets.Database.configure('read')
+            BuildWorker.setup(datasets.ColumnarDataset())
+            tables = {entity.__table__.name:
+                      BuildWorker.dataset.checksum(entity)
+                      for entity in schema.ENTITIES}
 
+            for locale in args.locales:
                 dataset_dir = io.Directory(io.Path.DATA_DIR / locale)
                 dataset_dir.create(parents=True)
+                manifests[locale] = manifest.Manifest(dataset_dir)
+                manifests[locale].inputs = dict(
+                    tables=tables,
+                    translations=manifest.fingerprint(
+                        i18n.Translator.locales()[locale].translations))
+
+                for dataset_format in args.formats:
+                    job = (locale, dataset_format, args.compress, args.level)
+                    job_fingerprint = BuildWorker.fingerprint(
+                        manifests[locale].inputs, *job)
+
+                    if args.force or not manifests[locale].isFresh(
+                            dataset_format, job_fingerprint):
+                        jobs.append((job, job_fingerprint))
+
+            logger.info('Encoding %d of %d dataset formats with %d jobs...',
+                        len(jobs),
+                        len(args.locales) * len(args.formats),
+                        args.jobs)
 
-                with dataset_dir:
-                    for dataset_format in args.formats:
-                        encoder.configure()
-                        encoder.handle(encoder.parse([
-                            '--format', dataset_format,
-                            '--locale', locale]))
+            try:
+                for (locale, dataset_format, *_), job_fingerprint, filenames \
+                        in self._run(jobs, args.jobs):
+                    manifests[locale].update(dataset_format,
+                                             job_fingerprint,
+                                             filenames)
 
-                    logger.info('Generating dataset README file...')
+                for locale in args.locales:
+                    i18n.Translator.locale = locale
+                    dataset_dir = io.Directory(io.Path.DATA_DIR / locale)
+                    readme_fingerprint = manifest.fingerprint(
+                        manifests[locale].inputs,
+                        __meta__.__version__,
+                        sorted((dataset_file.name, dataset_file.size)
+                               for dataset_file in dataset_dir.files(
+                                   pattern=i18n._('dataset_name') + '*')))
 
-                    documentation.DatasetReadme(dataset_dir).write()
+                    if not args.force and manifests[locale].isFresh(
+                            'README', readme_fingerprint):
+                        continue
 
-            logger.info('Generating project README file...')
+                    logger.info('Generating dataset README file: %s', locale)
 
-            documentation.ProjectReadme().write()
+                    documentation.DatasetReadme(
+                        dataset_dir,
+                        serializers.MemorySerializer(BuildWorker.dataset)) \
+                        .write()
+                    manifests[locale].update('README',
+                                             readme_fingerprint,
+                                             ['README.md'])
+            finally:
+                for build_manifest in manifests.values():
+                    build_manifest.save()
+
+            # The project README is recorded next to the dataset files, so
+            # the working directory is left alone
+            data_dir = io.Directory(io.Path.DATA_DIR)
+            data_dir.create(parents=True)
+            project_manifest = manifest.Manifest(data_dir)
+            project_readme = os.path.relpath(
+                str(io.Path.CURRENT_DIR / 'README.md'), str(data_dir))
+            readme_fingerprint = manifest.fingerprint(
+                tables,
+                __meta__.__version__,
+                encoders.EncoderFormatRepository.listNames())
+
+            if args.force or not project_manifest.isFresh(
+                    'README', readme_fingerprint):
+                logger.info('Generating project README file...')
+
+                documentation.ProjectReadme().write()
+                project_manifest.update('README',
+                                        readme_fingerprint,
+                                        [project_readme])
+                project_manifest.save()
         except encoders.EncodeError:
             self._parser.error('Failed to build dataset.')
         except KeyboardInterrupt:
             self._parser.terminate('Building was canceled.')
+
+    @staticmethod
+    def _run(jobs: list, workers: int) -> Iterator[tuple]:
+        """
+        Runs the given build jobs, in parallel processes if needed.
+
+        Every job is run even if others fail, so the built ones are yielded
+        and can be recorded before the first error is raised.
+
+        Args:
+            jobs: The (job, fingerprint) tuples to run, each job being the
+                arguments of BuildWorker.build()
+            workers: The maximum number of worker processes
+
+        Yields:
+            A (job, fingerprint, filenames) tuple for each built job, in
+            completion order
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        error = None
+
+        if workers == 1 or len(jobs) < 2:
+            for job, job_fingerprint in jobs:
+                try:
+                    filenames = BuildWorker.build(*job)
+                except Exception as job_error:
+                    error = error or job_error
+                    continue
+
+                yield job, job_fingerprint, filenames
+
+            if error:
+                raise error
+
+            return
+
+        # The database connections are not shared with the workers
+        datasets.Database.dispose()
+
+        with futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=BuildWorker.setup,
+                initargs=(BuildWorker.dataset,)) as executor:
+            pending = {executor.submit(BuildWorker.build, *job):
+                       (job, job_fingerprint)
+                       for job, job_fingerprint in jobs}
+
+            for future in futures.as_completed(pending):
+                if future.exception():
+                    error = error or future.exception()
+                    continue
+
+                yield pending[future] + (future.result(),)
+
+        if error:
+            raise error
+
+
+class BuildWorker(object):
+    """
+    Dataset files builder, run by the build processes.
+
+    The raw dataset rows are loaded once by the main process and shared with
+    the worker processes, each one encoding a single file format of a single
+    locale at a time.
+
+    Attributes:
+        dataset (geodatabr.core.datasets.ColumnarDataset):
+            The in-memory raw dataset rows
+    """
+
+    dataset = None
+
+    @classmethod
+    def setup(cls, dataset: datasets.ColumnarDataset):
+        """
+        Setups the worker with the raw dataset rows.
+
+        Args:
+            dataset: The in-memory raw dataset rows
+        """
+        cls.dataset = dataset
+
+    @staticmethod
+    def fingerprint(inputs: dict,
+                    locale: str,
+                    dataset_format: str,
+                    codec: str = None,
+                    level: int = None) -> str:
+        """
+        Computes the fingerprint of the inputs of a build job.
+
+        Args:
+            inputs: The dataset inputs checksums
+            locale: The locale name
+            dataset_format: The encoder format name
+            codec: The compression codec name, if any
+            level: The compression level, defaults to the codec default level
+
+        Returns:
+            The build job fingerprint
+        """
+        encoder = encoders.EncoderFactory.fromFormat(dataset_format)
+
+        if codec and level is None:
+            level = compression.find(codec).defaultLevel
+
+        return manifest.fingerprint(
+            inputs,
+            locale,
+            dataset_format,
+            encoder.version,
+            encoder.options,
+            datasets.Serializer(**encoder.serializationOptions).options,
+            codec,
+            level if codec else None)
+
+    @classmethod
+    def build(cls,
+              locale: str,
+              dataset_format: str,
+              codec: str = None,
+              level: int = None) -> list:
+        """
+        Builds the dataset files of a given locale and format.
+
+        The locale is process-wide state, so a worker builds a single file
+        format at a time.
+
+        Args:
+            locale: The locale name
+            dataset_format: The encoder format name
+            codec: The compression codec name, if any
+            level: The compression level, defaults to the codec default level
+
+        Returns:
+            The written filenames, relative to the locale directory
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        return encode.encode_dataset(
+            dataset_format,
+            locale,
+            codec=codec,
+            level=level,
+            serializer=serializers.MemorySerializer(
+                cls.dataset,
+                **encoders.EncoderFactory.fromFormat(dataset_format)
+                .serializationOptions))
@@ -11,8 +11,8 @@ import argparse
 
 # Package dependencies
 
-from geodatabr.core import commands, encoders, i18n, logging
-from geodatabr.core.utils import io
+from geodatabr.core import commands, datasets, encoders, i18n, logging
+from geodatabr.core.utils import compression, io
 from geodatabr.dataset import schema, serializers
 
 # Classes
@@ -34,7 +34,8 @@ class EncodeCommand(commands.Command):
     @property
     def usage(self) -> str:
         """Gets the command usage syntax."""
-        return '%(prog)s -f FORMAT [-l LOCALE] [-t TABLES]'
+        return ('%(prog)s -f FORMAT [-l LOCALE] [-t TABLES] '
+                '[-c CODEC [--level LEVEL]]')
 
     def configure(self):
         """Defines the command arguments."""
@@ -58,6 +59,16 @@ class EncodeCommand(commands.Command):
                          help=('Dataset tables to encode.\n'
                                'Options: %(choices)s\n'
                                'Default: All tables'))
+        self.addArgument('-c', '--compress',
+                         metavar='CODEC',
+                         choices=compression.names(),
+                         help=('Codec to compress the encoded files.\n'
+                               'Options: %(choices)s'))
+        self.addArgument('--level',
+                         metavar='LEVEL',
+                         type=int,
+                         help=('Compression level.\n'
+                               'Defaults to the codec default level.'))
 
     def handle(self, args: argparse.Namespace):
         """
@@ -70,39 +81,98 @@ class EncodeCommand(commands.Command):
             self._parser.error(
                 'You need to give the output format you want to encode.')
 
-        i18n.Translator.locale = args.locale
-        logger = logging.logger()
+        if args.compress:
+            try:
+                compression.find(args.compress).checkLevel(args.level)
+            except ValueError as error:
+                self._parser.error(str(error))
+        elif args.level is not None:
+            self._parser.error(
+                'You need to give the codec you want to compress with.')
 
         try:
-            encoder = encoders.EncoderFactory.fromFormat(args.format)
-            serializer = serializers.Serializer(**encoder.serializationOptions)
-            entity_map = dict(zip(schema.TABLES, schema.ENTITIES))
-
-            logger.info('Encoding dataset to %s format...',
-                        encoder.format.friendlyName)
-
-            dataset_dir = io.Directory(io.Path.DATA_DIR / args.locale)
-            dataset_dir.create(parents=True)
-
-            with dataset_dir:
-                if encoder.format.isFlatFile:
-                    for table in args.tables:
-                        table_name = i18n._(table)
-                        entity = (entity_map.get(table),)
-                        encoder.encodeToFile(
-                            serializer.serialize(entity).get(table_name),
-                            '{dataset_name}-{table_name}{extension}'.format(
-                                dataset_name=i18n._('dataset_name'),
-                                table_name=table_name,
-                                extension=encoder.format.extension))
-
-                    return
-
-                encoder.encodeToFile(
-                    serializer.serialize(tuple(entity_map.get(table)
-                                               for table in args.tables)),
-                    i18n._('dataset_name') + encoder.format.extension)
+            encode_dataset(args.format,
+                           args.locale,
+                           args.tables,
+                           args.compress,
+                           args.level)
         except encoders.EncodeError:
             self._parser.error('Failed to encode dataset.')
         except KeyboardInterrupt:
             self._parser.terminate('Encoding was canceled.')
+
+
+# Functions
+
+
+def encode_dataset(dataset_format: str,
+                   locale: str = 'en',
+                   tables: list = None,
+                   codec: str = None,
+                   level: int = None,
+                   serializer: serializers.Serializer = None) -> list:
+    """
+    Encodes the dataset files of a given format into its locale directory.
+
+    Args:
+        dataset_format: The encoder format name
+        locale: The locale to encode the dataset
+        tables: The dataset tables to encode, defaults to all tables
+        codec: The compression codec name, if any
+        level: The compression level, defaults to the codec default level
+        serializer: The serializer to use, defaults to a new one with the
+            encoder serialization options
+
+    Returns:
+        The written filenames, relative to the locale directory
+
+    Raises:
+        geodatabr.core.encoders.EncodeError: If data fails to encode
+    """
+    i18n.Translator.locale = locale
+    datasets.Database.configure('read')
+    logger = logging.logger()
+
+    encoder = encoders.EncoderFactory.fromFormat(dataset_format)
+    serializer = serializer \
+        or serializers.Serializer(**encoder.serializationOptions)
+    entity_map = dict(zip(schema.TABLES, schema.ENTITIES))
+    extension = encoder.format.extension
+    filenames = []
+
+    if codec:
+        extension += compression.find(codec).extension
+
+    logger.info('Encoding dataset to %s format...',
+                encoder.format.friendlyName)
+
+    dataset_dir = io.Directory(io.Path.DATA_DIR / locale)
+    dataset_dir.create(parents=True)
+
+    with dataset_dir:
+        if encoder.format.isFlatFile:
+            for table in tables or schema.TABLES:
+                table_name = i18n._(table)
+                entity = (entity_map.get(table),)
+
+                for rows in serializer.stream(entity):
+                    filenames.append(
+                        '{dataset_name}-{table_name}{extension}'
+                        .format(dataset_name=i18n._('dataset_name'),
+                                table_name=table_name,
+                                extension=extension))
+                    encoder.encodeToFile(rows, filenames[-1], codec, level)
+
+            return filenames
+
+        entities = tuple(entity_map.get(table)
+                         for table in tables or schema.TABLES)
+        filenames.append(i18n._('dataset_name') + extension)
+        encoder.encodeToFile(serializer.streamDataset(entities)
+                             if encoder.acceptsStreams
+                             else serializer.serialize(entities),
+                             filenames[-1],
+                             codec,
+                             level)
+
+    return filenames
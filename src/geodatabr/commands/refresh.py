@@ -30,6 +30,17 @@ class RefreshCommand(commands.Command):
         """Gets the command description."""
         return 'Reset and re-run all datasets seeders'
 
+    @property
+    def usage(self) -> str:
+        """Gets the command usage syntax."""
+        return ('%(prog)s [-s STRATEGY] [-w WORKERS] [-r RATE] [-b BURST] [-a]'
+                ' [--offline | --revalidate] [--cache-dir DIR]')
+
+    def configure(self):
+        """Defines the command arguments."""
+        # Same arguments of the seed command, which handles the seeding
+        seed.SeedCommand.configure(self)
+
     def handle(self, args: argparse.Namespace):
         """
         Handles the command.
@@ -41,6 +52,7 @@ class RefreshCommand(commands.Command):
             logger = logging.logger()
 
             logger.info('> Clearing datasets...')
+            datasets.Database.configure('bulk')
             datasets.Database.clear()
 
             seed.SeedCommand(self.application).handle(args)
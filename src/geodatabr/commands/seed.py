@@ -12,7 +12,7 @@ import argparse
 # Package dependencies
 
 from geodatabr.core import commands, datasets, logging
-from geodatabr.dataset import schema, seeders
+from geodatabr.dataset import schema, seeders, services
 
 # Classes
 
@@ -30,6 +30,63 @@ class SeedCommand(commands.Command):
         """Gets the command description."""
         return 'Seed datasets with records'
 
+    @property
+    def usage(self) -> str:
+        """Gets the command usage syntax."""
+        return ('%(prog)s [-s STRATEGY] [-w WORKERS] [-r RATE] [-b BURST] [-a]'
+                ' [--offline | --revalidate] [--cache-dir DIR]')
+
+    def configure(self):
+        """Defines the command arguments."""
+        self.addArgument('-s', '--strategy',
+                         metavar='STRATEGY',
+                         choices=('bulk', 'crawl'),
+                         default='bulk',
+                         help=('Strategy to find the children territories:\n'
+                               'bulk: fetch whole levels and link children\n'
+                               '      to their parents by the code prefixes;\n'
+                               '      microregions and municipalities are\n'
+                               '      still crawled, as their codes are not\n'
+                               '      prefixed by their parent codes\n'
+                               'crawl: fetch the children of each parent\n'
+                               'Default: %(default)s'))
+        self.addArgument('-w', '--workers',
+                         metavar='WORKERS',
+                         type=int,
+                         default=1,
+                         help=('Number of concurrent SIDRA requests.\n'
+                               'Default: %(default)s'))
+        self.addArgument('-r', '--rate',
+                         metavar='RATE',
+                         type=float,
+                         default=1 / services.HTTP_THROTTLING_INTERVAL,
+                         help=('Maximum number of SIDRA requests per second.\n'
+                               'Default: %(default)s'))
+        self.addArgument('-b', '--burst',
+                         metavar='BURST',
+                         type=int,
+                         default=services.HTTP_THROTTLING_BURST,
+                         help=('Maximum number of SIDRA requests in a burst.\n'
+                               'Default: %(default)s'))
+        self.addArgument('-a', '--async',
+                         dest='asynchronous',
+                         action='store_true',
+                         help=('Send the SIDRA requests asynchronously, with\n'
+                               'WORKERS concurrent connections at most.'))
+        self.addArgument('--offline',
+                         action='store_true',
+                         help=('Serve all SIDRA requests from the response\n'
+                               'cache, failing on uncached ones.'))
+        self.addArgument('--revalidate',
+                         action='store_true',
+                         help=('Revalidate all cached SIDRA responses, even\n'
+                               'the fresh ones.'))
+        self.addArgument('--cache-dir',
+                         metavar='DIR',
+                         default=str(services.HTTP_CACHE_DIR),
+                         help=('Directory of the SIDRA response cache.\n'
+                               'Default: %(default)s'))
+
     def handle(self, args: argparse.Namespace):
         """
         Handles the command.
@@ -37,16 +94,45 @@ class SeedCommand(commands.Command):
         Args:
             args: The command arguments
         """
+        if args.workers < 1:
+            self._parser.error('The number of workers should be positive.')
+
+        if args.rate <= 0 or args.burst < 1:
+            self._parser.error('The request rate and burst should be '
+                               'positive.')
+
+        if args.offline and args.revalidate:
+            self._parser.error('The offline and revalidate modes are mutually '
+                               'exclusive.')
+
+        seeders.Seeder.strategy = args.strategy
+        seeders.Seeder.workers = args.workers
+        seeders.Seeder.asynchronous = args.asynchronous
+        services.HttpSession.limiter.configure(rate=args.rate,
+                                               capacity=args.burst)
+        services.HttpSession.cache = services.ResponseCache(
+            args.cache_dir,
+            mode=(services.CACHE_OFFLINE if args.offline
+                  else services.CACHE_REVALIDATE if args.revalidate
+                  else services.CACHE_DEFAULT))
+
         try:
             logger = logging.logger()
-            datasets.Database.create()
+            datasets.Database.configure('bulk')
+            datasets.Database.create(indexes=False)
 
             for entity in schema.ENTITIES:
                 logger.info('> Seeding dataset "%s"...', entity.__table__.name)
 
                 try:
-                    seeders.SeederFactory.fromEntity(entity).run()
+                    datasets.SeederFactory.fromEntity(entity).run()
                 except seeders.NothingToSeedError:
                     logger.warning('Nothing to seed.')
+
+            logger.info('> Creating indexes...')
+            datasets.Database.createIndexes()
+            datasets.Database.restoreJournalMode()
+        except services.CacheMissError as error:
+            self._parser.error('{} (offline mode)'.format(error))
         except KeyboardInterrupt:
             self._parser.terminate('Seeding was canceled.')
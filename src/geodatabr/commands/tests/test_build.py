@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Build command testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import argparse
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.commands import build
+from geodatabr.core import commands, datasets, encoders
+from geodatabr.core.utils import documentation, io
+
+# Functions
+
+
+def fake_build(locale: str, dataset_format: str, *_) -> list:
+    """Builds a fake dataset file, failing for the CSV format."""
+    if dataset_format == 'csv':
+        raise encoders.EncodeError
+
+    return ['{}.{}'.format(locale, dataset_format)]
+
+
+@pytest.fixture
+def command(engine, monkeypatch, tmp_path):
+    """Creates a build command over an in-memory database."""
+    monkeypatch.setattr(datasets.Database, 'configure', lambda profile: None)
+    monkeypatch.setattr(io.Path, 'CURRENT_DIR', tmp_path)
+    monkeypatch.setattr(io.Path, 'DATA_DIR', tmp_path / 'data')
+
+    return build.BuildCommand(commands.Application())
+
+
+# Classes
+
+
+class TestBuildCommand(object):
+    """Tests BuildCommand class methods."""
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def testRun(self, monkeypatch, workers):
+        """Tests if BuildCommand._run() yields the built jobs of a failure."""
+        monkeypatch.setattr(build.BuildWorker, 'build', fake_build)
+        monkeypatch.setattr(datasets.Database, 'dispose', lambda: None)
+        jobs = [(('en', dataset_format), dataset_format)
+                for dataset_format in ('csv', 'json', 'xml')]
+        built = []
+
+        with pytest.raises(encoders.EncodeError):
+            for job, job_fingerprint, filenames \
+                    in build.BuildCommand._run(jobs, workers):
+                built.append((job, job_fingerprint, filenames))
+
+        assert sorted(built) == [(('en', 'json'), 'json', ['en.json']),
+                                 (('en', 'xml'), 'xml', ['en.xml'])]
+
+    def testHandleProjectReadme(self, command, monkeypatch):
+        """Tests if BuildCommand.handle() writes the project README once."""
+        written = []
+
+        def write(self):
+            written.append(self)
+            (io.Path.CURRENT_DIR / 'README.md').write_text('')
+
+        monkeypatch.setattr(documentation.ProjectReadme, 'write', write)
+        args = argparse.Namespace(locales=[],
+                                  formats=[],
+                                  compress=None,
+                                  level=None,
+                                  jobs=1,
+                                  force=False)
+
+        command.handle(args)
+        command.handle(args)
+
+        assert len(written) == 1
+        assert (io.Path.DATA_DIR / '.manifest.json').is_file()
+        assert not (io.Path.CURRENT_DIR / '.manifest.json').exists()
+
+        args.force = True
+        command.handle(args)
+
+        assert len(written) == 2
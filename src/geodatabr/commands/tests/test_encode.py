@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Encode command testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import json
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.commands import encode
+from geodatabr.core import datasets, i18n
+from geodatabr.core.utils import io
+from geodatabr.dataset import serializers
+
+# Functions
+
+
+@pytest.fixture
+def database(states, monkeypatch, tmp_path):
+    """Points the dataset files to a temporary directory."""
+    monkeypatch.setattr(datasets.Database, 'configure', lambda profile: None)
+    monkeypatch.setattr(i18n.Translator, 'locale', i18n.Translator.locale)
+    # The translation keys are kept as they are
+    monkeypatch.setattr(i18n, '_', lambda key: key)
+    monkeypatch.setattr(io.Path, 'DATA_DIR', tmp_path)
+
+    return tmp_path
+
+
+# Classes
+
+
+class TestFunctions(object):
+    """Tests encode command functions."""
+
+    def testEncodeDataset(self, database, monkeypatch):
+        """Tests if encode_dataset() streams rows to capable encoders."""
+        def serialize(self, entities=None):
+            raise AssertionError('The dataset should not be materialized')
+
+        monkeypatch.setattr(serializers.Serializer, 'serialize', serialize)
+        filenames = encode.encode_dataset('json',
+                                          tables=['states', 'mesoregions'])
+
+        assert json.loads((database / 'en' / filenames[0])
+                          .read_text('utf-8')) \
+            == dict(states=[dict(id=11, name='Rondônia'),
+                            dict(id=35, name='São Paulo')])
+
+    def testEncodeDatasetMaterialized(self, database, monkeypatch):
+        """Tests if encode_dataset() serializes the whole dataset if needed."""
+        def stream_dataset(self, entities=None):
+            raise AssertionError('The dataset should be materialized')
+
+        monkeypatch.setattr(serializers.Serializer, 'streamDataset',
+                            stream_dataset)
+        filenames = encode.encode_dataset('gdbr', tables=['states'])
+
+        assert 'São Paulo'.encode('utf-8') \
+            in (database / 'en' / filenames[0]).read_bytes()
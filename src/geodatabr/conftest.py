@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Package testing fixtures module."""
+# pylint: disable=redefined-outer-name
+
+# Imports
+
+# External dependencies
+
+import pytest
+import sqlalchemy as db
+from sqlalchemy import orm as db_orm
+
+# Package dependencies
+
+from geodatabr.core import datasets
+from geodatabr.dataset import repositories, schema  # noqa: F401
+
+# Functions
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Builds an empty in-memory database bound to every repository."""
+    engine = db.create_engine('sqlite://')
+    datasets.Entity.metadata.create_all(engine)
+    session = db_orm.Session(bind=engine)
+
+    for repository in datasets.Repository.childs():
+        monkeypatch.setattr(repository, 'db', session)
+
+    yield engine
+
+    session.close()
+
+
+@pytest.fixture
+def states(engine):
+    """Builds an in-memory database with a few states."""
+    engine.execute(schema.State.__table__.insert(),
+                   [dict(id=11, name='Rondônia'),
+                    dict(id=35, name='São Paulo')])
+
+    return engine
@@ -11,8 +11,13 @@ This module provides the core classes to query and manage the database.
 
 # Built-in dependencies
 
+import array
 import contextlib
-from typing import Iterator
+from collections import abc as collections_abc
+import hashlib
+import itertools
+import threading
+from typing import Iterable, Iterator
 
 # External dependencies
 
@@ -20,47 +25,203 @@ import sqlalchemy as db
 from sqlalchemy import orm as db_orm
 from sqlalchemy.engine import base as db_engine
 from sqlalchemy.ext import declarative as db_declarative_api
-from sqlalchemy.orm import session as db_session
-from sqlalchemy.sql import schema as db_schema
+from sqlalchemy import event as db_event, pool as db_pool
+from sqlalchemy.orm import scoping as db_scoping, session as db_session
+from sqlalchemy.sql import ddl as db_ddl, schema as db_schema
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Package dependencies
 
 from geodatabr.core import decorators, i18n, types
-from geodatabr.core.utils import io
+from geodatabr.core.utils import io, text
+
+# Settings
+
+BULK_INSERT_SIZE = 1000
+SIMILARITY_CACHE_SIZE = 65536
+DATABASE_POOL_SIZE = 5
+DATABASE_POOL_OVERFLOW = 10
+DATABASE_POOL_TIMEOUT = 30
+DATABASE_POOL_RECYCLE = -1
+
+# Connection profiles, with the pragmas set on every new connection
+DATABASE_PROFILES = {
+    'default': dict(foreign_keys='OFF'),
+    # Bulk loading, trading durability for write throughput
+    'bulk': dict(foreign_keys='OFF',
+                 journal_mode='WAL',
+                 synchronous='OFF',
+                 cache_size=-64 * 1024,
+                 temp_store='MEMORY'),
+    # Read-mostly workloads, with connections sharing the same page cache
+    'read': dict(foreign_keys='OFF',
+                 mmap_size=256 * 1024 * 1024,
+                 cache_size=-64 * 1024,
+                 query_only='ON'),
+}
+
+# Connection profiles opening the database with a shared cache
+DATABASE_SHARED_CACHE_PROFILES = ('read',)
+
+# Journal mode of the database file, restored after bulk loadings
+DATABASE_JOURNAL_MODE = 'DELETE'
 
 # Classes
 
 
 class Database(object):
-    """Database service class."""
+    """
+    Database service class.
+
+    A single database engine, and so a single connection pool, is shared by
+    the whole process, while sessions are provided by a thread-local registry.
+    Its connections are set up by the current connection profile, one of the
+    DATABASE_PROFILES.
+    """
+
+    _lock = threading.RLock()
+    _engine = None
+    _profile = 'default'
+    _registry = db_scoping.scoped_session(db_orm.sessionmaker())
 
     @classmethod
     def engine(cls, **options) -> db_engine.Engine:
         """
-        Factories a new database engine.
+        Returns the process-wide database engine, creating it on first use.
 
         Args:
-            **options: The engine options
+            **options: The engine options, used only when creating the engine
 
         Returns:
             The database engine instance
         """
-        return db.create_engine(
-            'sqlite:///' + str(io.CacheFile('geodatabr.db')),
-            **options)
+        with cls._lock:
+            if cls._engine is None:
+                url = 'sqlite:///' + str(io.CacheFile('geodatabr.db'))
+
+                if cls._profile in DATABASE_SHARED_CACHE_PROFILES:
+                    url = 'sqlite:///file:{}?cache=shared&uri=true' \
+                        .format(io.CacheFile('geodatabr.db'))
+
+                engine = db.create_engine(
+                    url,
+                    **dict(dict(poolclass=db_pool.QueuePool,
+                                pool_size=DATABASE_POOL_SIZE,
+                                max_overflow=DATABASE_POOL_OVERFLOW,
+                                pool_timeout=DATABASE_POOL_TIMEOUT,
+                                pool_recycle=DATABASE_POOL_RECYCLE,
+                                connect_args={'check_same_thread': False}),
+                           **options))
+                db_event.listen(engine, 'connect', cls._connect)
+                cls._registry.configure(bind=engine)
+                cls._engine = engine
+
+        return cls._engine
+
+    @classmethod
+    def _connect(cls, connection, _):
+        """
+        Setups each new database connection with the current profile.
+
+        Args:
+            connection: The DBAPI connection
+        """
+        cursor = connection.cursor()
+
+        for pragma, value in DATABASE_PROFILES[cls._profile].items():
+            cursor.execute('PRAGMA {} = {}'.format(pragma, value))
+
+        cursor.close()
+
+    @classmethod
+    def configure(cls, profile: str):
+        """
+        Changes the database connection profile.
+
+        The current connections are closed, so the following ones are set up
+        by the new profile.
+
+        Args:
+            profile: The connection profile name
+
+        Raises:
+            ValueError: If a given connection profile is not found
+        """
+        if profile not in DATABASE_PROFILES:
+            raise ValueError(
+                'No connection profile found with this name: {}'
+                .format(profile))
+
+        with cls._lock:
+            if profile != cls._profile:
+                cls.dispose()
+                cls._profile = profile
+                cls.engine()
+
+    @classmethod
+    def registry(cls) -> db_scoping.scoped_session:
+        """
+        Returns the thread-local database session registry.
+
+        The registry proxies every session method to the session of the
+        calling thread, so it can be shared by concurrent threads.
+
+        Returns:
+            The database session registry
+        """
+        cls.engine()
+
+        return cls._registry
 
     @classmethod
     def session(cls) -> db_session.Session:
         """
-        Factories a new database session.
+        Returns the database session of the calling thread.
 
         Returns:
             The database session instance
         """
-        session = db_orm.sessionmaker(bind=cls.engine())()
-        session.execute('PRAGMA foreign_keys = OFF')
+        return cls.registry()()
+
+    @classmethod
+    def dispose(cls):
+        """
+        Closes all database sessions and pooled connections.
 
-        return session
+        The engine is dropped as well, so a new one is created on next use,
+        and processes forked from then on never share its connections.
+        """
+        with cls._lock:
+            cls._registry.remove()
+
+            if cls._engine is not None:
+                cls._engine.dispose()
+                cls._engine = None
+
+    @classmethod
+    def restoreJournalMode(cls):
+        """
+        Restores the database file journal mode.
+
+        Unlike the other pragmas, the WAL journal mode set by the bulk profile
+        persists in the database file, so it should be restored once the bulk
+        loading finishes. The WAL file is merged back into the database file
+        and removed.
+        """
+        with cls._lock:
+            # The journal mode can not be changed while other connections
+            # are open
+            cls.dispose()
+
+            with cls.engine().connect() as connection:
+                connection.execute('PRAGMA journal_mode = {}'
+                                   .format(DATABASE_JOURNAL_MODE))
+
+            cls.dispose()
 
     @classmethod
     @contextlib.contextmanager
@@ -85,10 +246,47 @@ class Database(object):
             session.close()
 
     @classmethod
-    def create(cls):
-        """Creates the database."""
+    def create(cls, indexes: bool = True):
+        """
+        Creates the database.
+
+        Args:
+            indexes: Whether the tables secondary indexes should be created
+                along with them or not, in which case they should be created
+                later by createIndexes(), once the tables are loaded
+        """
         io.Directory(io.Path.CACHE_DIR).create(parents=True)
-        Entity.metadata.create_all(cls.engine())
+
+        if indexes:
+            Entity.metadata.create_all(cls.engine())
+
+            return
+
+        with cls.engine().begin() as connection:
+            tables = db.inspect(connection).get_table_names()
+
+            for table in Entity.metadata.sorted_tables:
+                if table.name not in tables:
+                    connection.execute(db_ddl.CreateTable(table))
+
+    @classmethod
+    def createIndexes(cls):
+        """
+        Creates the missing tables secondary indexes in a single pass and
+        gathers the query planner statistics.
+        """
+        with cls.engine().begin() as connection:
+            inspector = db.inspect(connection)
+
+            for table in Entity.metadata.sorted_tables:
+                indexes = {index['name']
+                           for index in inspector.get_indexes(table.name)}
+
+                for index in table.indexes:
+                    if index.name not in indexes:
+                        index.create(connection)
+
+            connection.execute('ANALYZE')
 
     @classmethod
     def clear(cls):
@@ -98,6 +296,7 @@ class Database(object):
     @classmethod
     def delete(cls):
         """Removes the database."""
+        cls.dispose()
         io.CacheFile('geodatabr.db').unlink()
 
     @classmethod
@@ -147,11 +346,12 @@ class Repository(types.AbstractClass):
     Base repository class.
 
     Attributes:
-        db (sqlalchemy.orm.session.Session): The database session instance
+        db (sqlalchemy.orm.scoping.scoped_session):
+            The database session registry
         entity (geodatabr.core.datasets.Entity): The entity class
     """
 
-    db = Database.session()
+    db = Database.registry()
     entity = Entity
 
     @classmethod
@@ -164,6 +364,25 @@ class Repository(types.AbstractClass):
         """
         cls.db.add(instance)
 
+    @classmethod
+    def addMany(cls, rows: Iterable[dict]):
+        """
+        Saves many entity rows at once.
+
+        The rows are inserted in batches of BULK_INSERT_SIZE rows, bypassing
+        the session unit of work and its identity map.
+
+        Args:
+            rows: The entity rows to save, as column/value mappings
+        """
+        rows = iter(rows)
+        statement = cls.entity.__table__.insert()
+
+        for batch in iter(lambda: list(itertools.islice(rows,
+                                                        BULK_INSERT_SIZE)),
+                          []):
+            cls.db.execute(statement, batch)
+
     @classmethod
     def count(cls) -> int:
         """
@@ -232,6 +451,161 @@ class Repository(types.AbstractClass):
             .filter(cls.entity.name == name) \
             .first()
 
+    @classmethod
+    def findSimilar(cls,
+                    name: str,
+                    max_distance: int = 2,
+                    limit: int = 5) -> types.List:
+        """
+        Retrieves the entity items with names similar to a given name.
+
+        The names are compared regardless of their case, accents and
+        punctuation, through an n-gram index of all entity item names built
+        on the first call.
+
+        Args:
+            name: The name to match
+            max_distance: The maximum edit distance between the names
+            limit: The maximum number of entity items
+
+        Returns:
+            A list with the ID, name and edit distance of the most similar
+            entity items, from the most similar one
+        """
+        return types.List(types.Map(id=_id,
+                                    name=similar_name,
+                                    distance=distance)
+                          for _id, similar_name, distance
+                          in cls._findSimilar(text.normalize(name),
+                                              max_distance,
+                                              limit))
+
+    @classmethod
+    @decorators.cachedmethod(maxsize=SIMILARITY_CACHE_SIZE)
+    def _findSimilar(cls, name: str, max_distance: int, limit: int) -> tuple:
+        """
+        Retrieves the entity items with names similar to a normalized name.
+
+        Args:
+            name: The normalized name to match
+            max_distance: The maximum edit distance between the names
+            limit: The maximum number of entity items
+
+        Returns:
+            An (ID, name, edit distance) tuple of each one of the most similar
+            entity items, so the memoized results are immutable
+        """
+        ids, names, index = cls._similarityIndex()
+
+        return tuple((ids[position], names[position], distance)
+                     for distance, position
+                     in index.find(name, max_distance)[:limit])
+
+    @classmethod
+    @decorators.cachedmethod()
+    def _similarityIndex(cls) -> tuple:
+        """
+        Builds the n-gram index of all entity item names.
+
+        Returns:
+            The entity items IDs and names, and the index of their normalized
+            names, all in the same order
+        """
+        rows = cls.db.query(cls.entity.id, cls.entity.name) \
+            .order_by(cls.entity.id) \
+            .all()
+        ids = [_id for _id, _ in rows]
+        names = [name for _, name in rows]
+
+        return ids, names, text.NGramIndex(text.normalize(name)
+                                           for name in names)
+
+    @classmethod
+    def resolveMany(cls, ids: Iterable[int]) -> types.OrderedMap:
+        """
+        Resolves the names and parent IDs of many entity items at once.
+
+        The IDs are looked up on columns of all entity items loaded on the
+        first call, through a vectorized binary search over the sorted IDs if
+        NumPy is available, or a hash lookup otherwise, so millions of IDs
+        are resolved without hitting the database.
+
+        Args:
+            ids: The entity items IDs to resolve, as any sequence or array
+
+        Returns:
+            The name and parent ID columns, by column name, with the values of
+            each given ID in the same order. The columns are NumPy arrays if
+            NumPy is available, or lists of names and arrays of parent IDs
+            otherwise. Unknown IDs resolve to None names and zero parent IDs.
+        """
+        columns, lookup = cls._resolutionTable()
+        resolved = types.OrderedMap()
+
+        if numpy is not None:
+            ids = numpy.fromiter(ids, numpy.int64) \
+                if isinstance(ids, Iterator) \
+                else numpy.asarray(ids, numpy.int64)
+            positions = numpy.searchsorted(columns['id'], ids)
+            # Unknown IDs point to the sentinel row at the end of the columns
+            positions[columns['id'][positions] != ids] = len(columns['id']) - 1
+        else:
+            sentinel = len(columns['id']) - 1
+            positions = [lookup.get(_id, sentinel) for _id in ids]
+
+        for column, values in columns.items():
+            if column == 'id':
+                continue
+
+            if numpy is not None:
+                resolved[column] = values[positions]
+            elif column == 'name':
+                resolved[column] = [values[position] for position in positions]
+            else:
+                resolved[column] = array.array(
+                    'q', (values[position] for position in positions))
+
+        return resolved
+
+    @classmethod
+    @decorators.cachedmethod()
+    def _resolutionTable(cls) -> tuple:
+        """
+        Loads the columns of all entity items, sorted by ID.
+
+        A sentinel row, with the greatest ID, a None name and zero parent IDs,
+        is appended to the columns to resolve the unknown IDs.
+
+        Returns:
+            The entity items columns, by column name, and a mapping of their
+            row positions by ID, if NumPy is not available
+        """
+        table = cls.entity.__table__
+        rows = cls.db.execute(db.select([table]).order_by(table.c.id))
+        columns = types.OrderedMap(
+            (column.name,
+             [] if column.name == 'name' else array.array('q'))
+            for column in table.columns)
+
+        for row in itertools.chain(rows, [None]):
+            for column, values in columns.items():
+                if row is not None:
+                    values.append(row[column])
+                elif column == 'id':
+                    values.append(2 ** 63 - 1)
+                else:
+                    values.append(None if column == 'name' else 0)
+
+        if numpy is None:
+            return columns, {_id: position
+                             for position, _id in enumerate(columns['id'])}
+
+        return types.OrderedMap(
+            (column,
+             numpy.array(values, object) if column == 'name'
+             else numpy.frombuffer(values, numpy.int64))
+            for column, values in columns.items()), None
+
     @classmethod
     def delete(cls):
         """Removes all entity items."""
@@ -276,6 +650,223 @@ class Seeder(types.AbstractClass):
         raise NotImplementedError
 
 
+class TableStream(object):
+    """
+    Lazy stream of the serialized rows of a dataset table.
+
+    The rows are fetched from the database cursor as they are iterated, so
+    the stream can be consumed only once.
+
+    Attributes:
+        table (sqlalchemy.sql.schema.Table): The table element
+        name (str): The table name
+        columns (list): The table column names
+    """
+
+    def __init__(self,
+                 table: db_schema.Table,
+                 name: str,
+                 columns: list,
+                 rows: Iterator[types.OrderedMap]):
+        """
+        Creates a new table stream.
+
+        Args:
+            table: The table element
+            name: The table name
+            columns: The table column names
+            rows: The serialized table rows
+        """
+        self.table = table
+        self.name = name
+        self.columns = columns
+        self._rows = rows
+
+    def __iter__(self) -> Iterator[types.OrderedMap]:
+        """
+        Iterates over the serialized table rows.
+
+        Returns:
+            The serialized table rows iterator
+        """
+        return self._rows
+
+
+class DatasetStream(collections_abc.Mapping):
+    """
+    Lazy mapping of the rows streams of the serialized dataset tables.
+
+    Its keys, the names of the non-empty tables, are looked up on first use.
+    Each table stream is only created when it is accessed, so encoders
+    iterating over the mapping items fetch and hold a single row at a time.
+    As the table streams, it can be consumed only once.
+    """
+
+    def __init__(self, serializer: 'Serializer', entities: Iterable[Entity]):
+        """
+        Creates a new dataset stream.
+
+        Args:
+            serializer: The serializer of the table rows
+            entities: The list of entities to serialize
+        """
+        self._serializer = serializer
+        self._entities = tuple(entities)
+        self._tables = None
+
+    def _entitiesByName(self) -> types.OrderedMap:
+        """
+        Looks up the non-empty tables entities, only once.
+
+        Returns:
+            The entities of the non-empty tables, by table name
+        """
+        if self._tables is None:
+            self._tables = types.OrderedMap(
+                (self._serializer.tableName(entity), entity)
+                for entity in self._entities
+                if self._serializer.hasRows(entity))
+
+        return self._tables
+
+    def __getitem__(self, name: str) -> TableStream:
+        """
+        Creates the rows stream of a given table.
+
+        Args:
+            name: The table name
+
+        Returns:
+            The table rows stream
+
+        Raises:
+            KeyError: If a given table is not found or is empty
+        """
+        return next(self._serializer.stream((self._entitiesByName()[name],)))
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the non-empty table names.
+
+        Returns:
+            The table names iterator
+        """
+        return iter(self._entitiesByName())
+
+    def __len__(self) -> int:
+        """
+        Counts the non-empty tables.
+
+        Returns:
+            The number of non-empty tables
+        """
+        return len(self._entitiesByName())
+
+
+class ColumnarDataset(object):
+    """
+    In-memory columnar copy of the raw dataset rows.
+
+    The rows of each table are loaded once, with a single query, and stored
+    column by column, the integer columns into compact arrays and the other
+    ones into lists. The values are neither localized nor coerced, so a single
+    copy can be serialized for every locale and serialization options.
+    """
+
+    def __init__(self):
+        """Creates a new empty columnar dataset."""
+        self._tables = {}
+
+    def load(self, entities: Iterable[Entity]):
+        """
+        Loads the rows of the given entities tables, if not loaded yet.
+
+        Args:
+            entities: The list of entities to load
+        """
+        for entity in entities:
+            if entity in self._tables:
+                continue
+
+            table = entity.__table__
+            columns = [array.array('q')
+                       if (isinstance(column.type, db.Integer)
+                           and not column.nullable)
+                       else []
+                       for column in table.columns]
+            repository = RepositoryFactory.fromEntity(entity)
+
+            for row in repository.db.execute(
+                    db.select([table]).execution_options(stream_results=True)):
+                for values, value in zip(columns, row):
+                    values.append(value)
+
+            self._tables[entity] = columns
+
+    def checksum(self, entity: Entity) -> str:
+        """
+        Computes the content checksum of a given entity table.
+
+        Args:
+            entity: The entity to checksum
+
+        Returns:
+            The SHA-256 hex digest of the table column names and values
+        """
+        self.load((entity,))
+        digest = hashlib.sha256()
+
+        for column, values in zip(entity.__table__.columns,
+                                  self._tables[entity]):
+            digest.update(str(column.name).encode('utf-8') + b'\0')
+            digest.update(values.tobytes()
+                          if isinstance(values, array.array)
+                          else repr(values).encode('utf-8'))
+            digest.update(b'\0')
+
+        return digest.hexdigest()
+
+    def count(self, entity: Entity) -> int:
+        """
+        Counts the rows of a given entity table.
+
+        Args:
+            entity: The entity to count
+
+        Returns:
+            The number of rows
+        """
+        self.load((entity,))
+
+        return len(self._tables[entity][0])
+
+    def rows(self, entity: Entity) -> Iterator[tuple]:
+        """
+        Iterates over the rows of a given entity table.
+
+        Args:
+            entity: The entity to iterate
+
+        Returns:
+            The table rows iterator, with values in the table columns order
+        """
+        return zip(*self.columns(entity))
+
+    def columns(self, entity: Entity) -> list:
+        """
+        Gets the column values of a given entity table.
+
+        Args:
+            entity: The entity to get
+
+        Returns:
+            The values of each column, in the table columns order
+        """
+        self.load((entity,))
+
+        return self._tables[entity]
+
+
 class Serializer(object):
     """Dataset serializer class."""
 
@@ -293,8 +884,12 @@ class Serializer(object):
             forceStr=bool(options.get('forceStr', False)),
         )
 
-    @decorators.cachedmethod()
-    def serialize(self, entities: Iterator[Entity]) -> types.OrderedMap:
+    @property
+    def options(self) -> types.OrderedMap:
+        """Gets the serialization options."""
+        return self._options
+
+    def serialize(self, entities: Iterable[Entity]) -> types.OrderedMap:
         """
         Serializes the dataset rows.
 
@@ -304,36 +899,132 @@ class Serializer(object):
         Returns:
             The serialized dataset rows mapping
         """
-        rows = types.OrderedMap()
+        return types.OrderedMap((table.name, types.List(table))
+                                for table in self.stream(entities))
+
+    def streamDataset(self, entities: Iterable[Entity]) -> DatasetStream:
+        """
+        Serializes the dataset rows lazily into a mapping of table streams.
+
+        Unlike serialize(), the rows are fetched as the encoders consume them.
+
+        Args:
+            entities: The list of entities to serialize
+
+        Returns:
+            The lazy mapping of the non-empty tables rows streams
+        """
+        return DatasetStream(self, entities)
 
+    def tableName(self, entity: Entity) -> str:
+        """
+        Gets the serialized table name of a given entity.
+
+        Args:
+            entity: The entity class
+
+        Returns:
+            The table name, localized if enabled
+        """
+        table_name = str(entity.__table__.name)
+
+        return i18n._(table_name) if self._options.localize else table_name
+
+    def columnNames(self, entity: Entity) -> list:
+        """
+        Gets the serialized column names of a given entity.
+
+        Args:
+            entity: The entity class
+
+        Returns:
+            The column names, localized if enabled
+        """
+        columns = [str(column.name) for column in entity.__table__.columns]
+
+        if self._options.localize:
+            columns = [i18n._(column) for column in columns]
+
+        return columns
+
+    def hasRows(self, entity: Entity) -> bool:
+        """
+        Tells whether a given entity table has rows or not.
+
+        Args:
+            entity: The entity class
+
+        Returns:
+            Whether the table has rows or not
+        """
+        repository = RepositoryFactory.fromEntity(entity)
+
+        return repository.db.execute(
+            db.select([entity.__table__]).limit(1)).first() is not None
+
+    def stream(self, entities: Iterable[Entity]) -> Iterator[TableStream]:
+        """
+        Serializes the dataset rows lazily, without loading entity instances.
+
+        Args:
+            entities: The list of entities to serialize
+
+        Yields:
+            A rows stream of each non-empty table
+        """
         for entity in entities:
-            table_name = str(entity.__table__.name)
-            repository = RepositoryFactory.fromEntity(entity)
-            _rows = repository.findAll()
+            table = entity.__table__
+            rows = self._fetchRows(entity)
+            first_row = next(rows, None)
 
-            if not _rows:
+            if first_row is None:
                 continue
 
-            if self._options.localize:
-                table_name = i18n._(table_name)
+            columns = self.columnNames(entity)
+
+            yield TableStream(table,
+                              self.tableName(entity),
+                              columns,
+                              self._serializeRows(
+                                  columns,
+                                  itertools.chain([first_row], rows)))
 
-            rows[table_name] = types.List()
+    def _fetchRows(self, entity: Entity) -> Iterator[tuple]:
+        """
+        Fetches the raw rows of a given entity table from the database.
+
+        Args:
+            entity: The entity to fetch
 
-            for _row in _rows:
-                row = types.OrderedMap()
+        Returns:
+            The table rows iterator, with values in the table columns order
+        """
+        repository = RepositoryFactory.fromEntity(entity)
 
-                for column, value in _row.serialize().items():
-                    if self._options.localize:
-                        column = i18n._(column)
+        return iter(repository.db.execute(
+            db.select([entity.__table__])
+            .execution_options(stream_results=True)))
 
-                    if self._options.forceStr or column == 'name':
-                        value = str(value)
+    def _serializeRows(self,
+                       columns: list,
+                       rows: Iterable[tuple]) -> Iterator[types.OrderedMap]:
+        """
+        Serializes the given table rows.
 
-                    row[column] = value
+        Args:
+            columns: The table column names
+            rows: The table rows, with values in the table columns order
 
-                rows[table_name].append(row)
+        Yields:
+            The serialized table rows
+        """
+        coerce = [self._options.forceStr or column == 'name'
+                  for column in columns]
 
-        return rows
+        for row in rows:
+            yield types.OrderedMap(
+                (column, str(value) if coerced else value)
+                for column, coerced, value in zip(columns, coerce, row))
 
 
 class RepositoryFactory(object):
@@ -380,10 +1071,17 @@ class SeederFactory(object):
             geodatabr.core.datasets.UnknownEntityError:
                 If a given entity is not supported
         """
-        for seeder in Seeder.childs():
+        seeders = Seeder.childs()
+
+        # Concrete seeders may extend an intermediate base seeder class
+        while seeders:
+            seeder = seeders.pop(0)
+
             if seeder.entity is entity:
                 return seeder()
 
+            seeders.extend(seeder.childs())
+
         raise UnknownEntityError(
             'No seeder for entity "{}"'.format(entity.__name__))
 
@@ -13,11 +13,23 @@ This module provides the dataset encoders base functionality.
 
 import abc
 import itertools
+import os
+import shutil
+import tempfile
+from typing import BinaryIO
 
 # Package dependencies
 
+from geodatabr import __meta__
 from geodatabr.core import decorators, types
-from geodatabr.core.utils import io
+from geodatabr.core.utils import compression, io
+
+# Constants
+
+# The process file mode creation mask, read once at import time, since it can
+# only be read by changing it, which would race with other threads
+UMASK = os.umask(0)
+os.umask(UMASK)
 
 # Classes
 
@@ -69,6 +81,11 @@ class EncoderFormat(types.AbstractClass, metaclass=_EncoderFormat):
         """Tells whether the encoder format is a flat file or not."""
         return False
 
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the encoder format dependencies are installed."""
+        return True
+
     def __repr__(self) -> str:
         """
         Returns the canonical string representation of the object.
@@ -164,18 +181,23 @@ class EncoderFormatRepository(object):
         """
         Returns a list with all encoder format names.
 
+        Formats whose optional dependencies are not installed are left out.
+
         Returns:
             A list with all encoder format names
         """
         return types.List(sorted([encoder.format.name
                                   for encoder in Encoder.childs()
-                                  if getattr(encoder, 'format')]))
+                                  if getattr(encoder, 'format')
+                                  and encoder.format.isAvailable]))
 
     @classmethod
     def groupByType(cls) -> types.List:
         """
         Returns a list with all encoder formats grouped by their type.
 
+        Formats whose optional dependencies are not installed are left out.
+
         Returns:
             A list with all encoder formats grouped by their type
         """
@@ -186,7 +208,8 @@ class EncoderFormatRepository(object):
                            for format_type, formats in itertools.groupby(
                                sorted([encoder.format()
                                        for encoder in Encoder.childs()
-                                       if getattr(encoder, 'format')],
+                                       if getattr(encoder, 'format')
+                                       and encoder.format.isAvailable],
                                       key=lambda _format: _format.type),
                                key=lambda _format: _format.type)])
 
@@ -227,10 +250,39 @@ class Encoder(types.AbstractClass):
         """Gets the encoder serialization options."""
         return {}
 
+    @property
+    def version(self) -> str:
+        """
+        Gets the encoder version, defaults to the package version.
+
+        Encoders may extend it whenever their output changes between package
+        releases, so the files built by their former versions are rebuilt.
+        """
+        return __meta__.__version__
+
+    @property
+    def isStreamable(self) -> bool:
+        """Tells whether the encoder writes its output sequentially or not."""
+        return True
+
+    @property
+    def acceptsStreams(self) -> bool:
+        """
+        Tells whether the encoder accepts lazy table rows streams or not.
+
+        Encoders accepting them are given a lazy mapping of the table rows
+        streams, consumed while the rows are fetched. The other ones are given
+        the whole serialized dataset, as they need random access to it.
+        """
+        return False
+
     def encode(self, data, **options) -> io.BinaryFileStream:
         """
         Encodes the data into a file-like stream.
 
+        Encoders must implement at least one of encode() and encodeStream(),
+        each one defaults to the other.
+
         Args:
             data: The data to encode
             **options: The encoding options
@@ -241,22 +293,82 @@ class Encoder(types.AbstractClass):
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
-        raise NotImplementedError
+        stream = io.BinaryFileStream()
+        self.encodeStream(data, stream, **options)
+        stream.seek(0)
+
+        return stream
+
+    def encodeStream(self, data, fileobj: BinaryIO, **options):
+        """
+        Encodes the data into a writable binary file.
+
+        Encoders whose backends can write incrementally write straight to the
+        file, without holding the whole encoded data in memory.
 
-    def encodeToFile(self, data, filename: str, **options):
+        Args:
+            data: The data to encode
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        shutil.copyfileobj(self.encode(data, **options), fileobj)
+
+    def encodeToFile(self,
+                     data,
+                     filename: str,
+                     codec: str = None,
+                     level: int = None,
+                     **options):
         """
         Encodes the data into a file.
 
+        The data is encoded into a temporary file in the same directory, which
+        then atomically replaces the given file, so it is never left partially
+        written. When a compression codec is given, the encoded data is
+        compressed while it is written, or right after it when the encoder
+        needs to seek on its output.
+
         Args:
             data: The data to encode
             filename: The filename to write
+            codec: The compression codec name, if any
+            level: The compression level, defaults to the codec default level
             **options: The encoding options
 
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
+            ValueError: If the compression codec or level is not supported
         """
-        with open(filename, 'wb') as output_file:
-            output_file.write(self.encode(data, **options).read())
+        codec = compression.find(codec) if codec else None
+        directory, basename = os.path.split(os.path.abspath(str(filename)))
+        temp_file = tempfile.NamedTemporaryFile(dir=directory,
+                                                prefix='.{}.'.format(basename),
+                                                suffix='.tmp',
+                                                delete=False)
+
+        try:
+            with temp_file:
+                if codec and self.isStreamable:
+                    with codec.writer(temp_file, level) as writer:
+                        self.encodeStream(data, writer, **options)
+                elif codec:
+                    with tempfile.TemporaryFile(dir=directory) as raw_file, \
+                            codec.writer(temp_file, level) as writer:
+                        self.encodeStream(data, raw_file, **options)
+                        raw_file.seek(0)
+                        shutil.copyfileobj(raw_file, writer)
+                else:
+                    self.encodeStream(data, temp_file, **options)
+
+            # Temporary files are only readable by their owner
+            os.chmod(temp_file.name, 0o666 & ~UMASK)
+            os.replace(temp_file.name, str(filename))
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
 
 
 class EncoderFactory(object):
@@ -278,7 +390,8 @@ class EncoderFactory(object):
                 If a given encoder format is not supported
         """
         for encoder in Encoder.childs():
-            if (encoder.format and encoder.format.name == name):
+            if (encoder.format and encoder.format.name == name
+                    and encoder.format.isAvailable):
                 return encoder()
 
         raise UnknownEncoderError('Unsupported encoder format')
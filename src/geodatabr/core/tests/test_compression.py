@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core compression helpers testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Built-in dependencies
+
+import io
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core.utils import compression
+
+# Classes
+
+
+class TestCodec(object):
+    """Tests Codec class methods."""
+
+    @pytest.mark.parametrize('name', compression.names())
+    def testWriter(self, name):
+        """Tests if Codec.writer() works as expected."""
+        codec = compression.find(name)
+        data = 'São Paulo\n'.encode('utf-8') * 1000
+        fileobj = io.BytesIO()
+
+        with codec.writer(fileobj) as writer:
+            writer.write(data)
+
+        assert not fileobj.closed
+        assert len(fileobj.getvalue()) < len(data)
+
+        fileobj.seek(0)
+
+        with codec.reader(fileobj) as reader:
+            assert reader.read() == data
+
+        fileobj.seek(0)
+
+        assert compression.uncompressed_size(fileobj, codec) == len(data)
+
+    def testWriterLevel(self):
+        """Tests if Codec.writer() checks the compression level."""
+        codec = compression.find('xz')
+
+        with pytest.raises(ValueError):
+            codec.writer(io.BytesIO(), 10)
+
+
+class TestFunctions(object):
+    """Tests compression helper functions."""
+
+    def testFind(self):
+        """Tests if find() function works as expected."""
+        assert compression.find('gzip').extension == '.gz'
+
+        with pytest.raises(ValueError):
+            compression.find('rar')
+
+    def testFindByExtension(self):
+        """Tests if find_by_extension() function works as expected."""
+        assert compression.find_by_extension('.bz2').name == 'bz2'
+        assert compression.find_by_extension('.json') is None
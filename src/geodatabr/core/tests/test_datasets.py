@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core datasets testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import threading
+
+# External dependencies
+
+import pytest
+import sqlalchemy as db
+
+# Package dependencies
+
+from geodatabr.core import datasets
+from geodatabr.core.utils import io
+from geodatabr.dataset import schema
+
+# Functions
+
+
+@pytest.fixture
+def database(monkeypatch, tmp_path):
+    """Points the database to a temporary cache directory."""
+    datasets.Database.dispose()
+    monkeypatch.setattr(io.Path, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(datasets.Database, '_profile', 'default')
+
+    yield datasets.Database
+
+    datasets.Database.dispose()
+
+
+# Classes
+
+
+class TestDatabase(object):
+    """Tests Database class methods."""
+
+    def testRegistry(self, database):
+        """Tests if Database.registry() shares sessions by thread."""
+        sessions = []
+
+        thread = threading.Thread(
+            target=lambda: sessions.append(database.session()))
+        thread.start()
+        thread.join()
+
+        assert database.engine() is database.engine()
+        assert database.registry() is datasets.Repository.db
+        assert database.session() is database.session()
+        assert database.session() is not sessions[0]
+        assert database.session().bind is database.engine()
+        assert database.engine().url.database \
+            == str(io.CacheFile('geodatabr.db'))
+
+    def testDispose(self, database):
+        """Tests if Database.dispose() resets the engine."""
+        engine = database.engine()
+        session = database.session()
+        session.execute('SELECT 1')
+
+        assert engine.pool.checkedout() == 1
+
+        database.dispose()
+
+        assert engine.pool.checkedout() == 0
+        assert database.engine() is not engine
+        assert database.session() is not session
+        assert database.session().bind is database.engine()
+        assert database.session().execute('SELECT 1').scalar() == 1
+
+    @pytest.mark.parametrize('profile', sorted(datasets.DATABASE_PROFILES))
+    def testConfigure(self, database, profile):
+        """Tests if Database.configure() sets the profile pragmas."""
+        database.create()
+        database.configure(profile)
+
+        with database.engine().connect() as connection:
+            pragmas = {pragma: connection.execute('PRAGMA ' + pragma).scalar()
+                       for pragma in datasets.DATABASE_PROFILES[profile]}
+
+        assert pragmas == dict(
+            default=dict(foreign_keys=0),
+            bulk=dict(foreign_keys=0,
+                      journal_mode='wal',
+                      synchronous=0,
+                      cache_size=-64 * 1024,
+                      temp_store=2),
+            read=dict(foreign_keys=0,
+                      mmap_size=256 * 1024 * 1024,
+                      cache_size=-64 * 1024,
+                      query_only=1),
+        )[profile]
+
+        with pytest.raises(ValueError):
+            database.configure('unknown')
+
+    def testRestoreJournalMode(self, database):
+        """Tests if Database.restoreJournalMode() leaves the WAL mode."""
+        database.configure('bulk')
+        database.create()
+        database.session().execute('SELECT 1')
+        database.restoreJournalMode()
+
+        assert not (io.Path.CACHE_DIR / 'geodatabr.db-wal').exists()
+
+        database.configure('read')
+
+        assert database.session() \
+            .execute('PRAGMA journal_mode').scalar() == 'delete'
+
+    def testCreateIndexes(self, database):
+        """Tests if Database.createIndexes() works as expected."""
+        database.create(indexes=False)
+        inspector = db.inspect(database.engine())
+
+        assert inspector.get_table_names() \
+            == sorted(table.name
+                      for table in datasets.Entity.metadata.sorted_tables)
+        assert [index
+                for table in inspector.get_table_names()
+                for index in inspector.get_indexes(table)] == []
+
+        database.engine().execute(schema.State.__table__.insert(),
+                                  [dict(id=11, name='Rondônia'),
+                                   dict(id=35, name='São Paulo')])
+        database.createIndexes()
+        database.createIndexes()
+        inspector = db.inspect(database.engine())
+
+        for table in datasets.Entity.metadata.sorted_tables:
+            assert sorted(index['name']
+                          for index in inspector.get_indexes(table.name)) \
+                == sorted(index.name for index in table.indexes)
+
+        assert ('states', 'ix_states_name', '2 1') \
+            in database.engine() \
+            .execute('SELECT tbl, idx, stat FROM sqlite_stat1') \
+            .fetchall()
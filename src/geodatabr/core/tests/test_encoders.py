@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core encoders testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Built-in dependencies
+
+import gzip
+import os
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import encoders
+from geodatabr.encoders import json
+
+# Classes
+
+
+class TestEncoder(object):
+    """Tests Encoder class methods."""
+
+    def testEncode(self):
+        """Tests if Encoder.encode() works as expected."""
+        assert json.JsonEncoder().encode({'name': 'São Paulo'}).read() \
+            == '{\n  "name": "São Paulo"\n}'.encode('utf-8')
+
+    def testEncodeToFile(self, tmp_path):
+        """Tests if Encoder.encodeToFile() works as expected."""
+        encoder = json.JsonEncoder()
+        filename = tmp_path / 'dataset.json'
+        encoder.encodeToFile({'id': 35}, str(filename))
+
+        with pytest.raises(encoders.EncodeError):
+            encoder.encodeToFile({'id': object()}, str(filename))
+
+        assert filename.read_text() == '{\n  "id": 35\n}'
+        assert [path.name for path in tmp_path.iterdir()] == ['dataset.json']
+
+    def testEncodeToFileMode(self, tmp_path, monkeypatch):
+        """Tests if Encoder.encodeToFile() honors the process umask."""
+        def umask(mask):
+            raise AssertionError('The umask should not be changed')
+
+        monkeypatch.setattr(encoders, 'UMASK', 0o027)
+        monkeypatch.setattr(os, 'umask', umask)
+        filename = tmp_path / 'dataset.json'
+        json.JsonEncoder().encodeToFile({'id': 35}, str(filename))
+
+        assert filename.stat().st_mode & 0o777 == 0o640
+
+    def testEncodeToFileCompressed(self, tmp_path):
+        """Tests if Encoder.encodeToFile() compresses as expected."""
+        encoder = json.JsonEncoder()
+        filename = tmp_path / 'dataset.json.gz'
+        encoder.encodeToFile({'id': 35}, str(filename), 'gzip', 1)
+
+        with pytest.raises(ValueError):
+            encoder.encodeToFile({'id': 35}, str(filename), 'gzip', 10)
+
+        assert gzip.decompress(filename.read_bytes()) \
+            == b'{\n  "id": 35\n}'
+        assert [path.name for path in tmp_path.iterdir()] \
+            == ['dataset.json.gz']
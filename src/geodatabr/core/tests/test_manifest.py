@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core build manifest helpers testing module."""
+# pylint: disable=no-self-use
+
+# Package dependencies
+
+from geodatabr.core import encoders
+from geodatabr.core.utils import io, manifest
+
+# Classes
+
+
+class TestManifest(object):
+    """Tests Manifest class methods."""
+
+    def testIsFresh(self, tmp_path):
+        """Tests if Manifest.isFresh() works as expected."""
+        directory = io.Directory(str(tmp_path))
+        build_manifest = manifest.Manifest(directory)
+        fingerprint = manifest.fingerprint('json', dict(localize=True))
+
+        assert not build_manifest.isFresh('json', fingerprint)
+
+        (tmp_path / 'brazil.json').write_text('{}')
+        build_manifest.update('json', fingerprint, ['brazil.json'])
+        build_manifest.save()
+        build_manifest = manifest.Manifest(directory)
+
+        assert build_manifest.isFresh('json', fingerprint)
+        assert not build_manifest.isFresh(
+            'json', manifest.fingerprint('json', dict(localize=False)))
+
+        (tmp_path / 'brazil.json').unlink()
+
+        assert not build_manifest.isFresh('json', fingerprint)
+
+    def testUpdate(self, tmp_path):
+        """Tests if Manifest.update() works as expected."""
+        directory = io.Directory(str(tmp_path))
+        build_manifest = manifest.Manifest(directory)
+        (tmp_path / 'brazil.json').write_text('{}')
+        build_manifest.update('json', 'a', ['brazil.json'])
+        (tmp_path / 'brazil.json.gz').write_bytes(b'')
+        build_manifest.update('json', 'b', ['brazil.json.gz'])
+
+        assert build_manifest.files('json') == ['brazil.json.gz']
+        assert sorted(path.name for path in tmp_path.iterdir()) \
+            == ['brazil.json.gz']
+
+    def testSave(self, tmp_path, monkeypatch):
+        """Tests if Manifest.save() honors the process umask."""
+        monkeypatch.setattr(encoders, 'UMASK', 0o027)
+        manifest.Manifest(io.Directory(str(tmp_path))).save()
+
+        assert [(path.name, path.stat().st_mode & 0o777)
+                for path in tmp_path.iterdir()] \
+            == [(manifest.MANIFEST_NAME, 0o640)]
+
+
+class TestFunctions(object):
+    """Tests build manifest helper functions."""
+
+    def testFingerprint(self):
+        """Tests if fingerprint() function works as expected."""
+        assert manifest.fingerprint(dict(a=1, b=2)) \
+            == manifest.fingerprint(dict(b=2, a=1))
+        assert manifest.fingerprint('gzip', 9) \
+            != manifest.fingerprint('gzip', 1)
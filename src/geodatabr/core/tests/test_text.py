@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core text helpers testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Package dependencies
+
+from geodatabr.core.utils import text
+
+# Classes
+
+
+class TestFunctions(object):
+    """Tests text helper functions."""
+
+    def testNormalize(self):
+        """Tests if normalize() function works as expected."""
+        assert text.normalize('São Paulo') == 'sao paulo'
+        assert text.normalize("  Estrela D'Oeste ") == 'estrela doeste'
+        assert text.normalize('Embu-Guaçu') == 'embu guacu'
+        assert text.normalize('MOGI  MIRIM') == 'mogi mirim'
+
+    def testDistance(self):
+        """Tests if distance() function works as expected."""
+        assert text.distance('', '') == 0
+        assert text.distance('', 'jales') == 5
+        assert text.distance('jales', '') == 5
+        assert text.distance('jales', 'jales') == 0
+        assert text.distance('jales', 'gales') == 1
+        assert text.distance('jales', 'jale') == 1
+        assert text.distance('kitten', 'sitting') == 3
+        assert text.distance('a' * 70, 'a' * 68 + 'bb') == 2
+
+
+class TestNGramIndex(object):
+    """Tests NGramIndex class methods."""
+
+    def testFind(self):
+        """Tests if NGramIndex.find() works as expected."""
+        index = text.NGramIndex(['porto velho', 'porto alegre', 'jales',
+                                 'sales', 'porto velho'])
+
+        assert index.find('porto velho', 0) == [(0, 0), (0, 4)]
+        assert index.find('prto velo') == [(2, 0), (2, 4)]
+        assert index.find('porto alegre', 1) == [(0, 1)]
+        assert index.find('jale', 1) == [(1, 2)]
+        assert index.find('gales') == [(1, 2), (1, 3)]
+        assert index.find('curitiba') == []
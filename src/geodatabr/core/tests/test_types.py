@@ -46,6 +46,25 @@ class TestAbstractClass(object):
         assert Foo.childs()[0] == Bar
 
 
+class TestBytes(object):
+    """Tests Bytes type methods."""
+
+    def testReadWrite(self):
+        """Tests if Bytes read/write methods work as expected."""
+        data = types.Bytes()
+        data.writeByte(ord('q'))
+        data.writeBoolean(True)
+        data.writeInt(-35)
+        data.writeString('São Paulo')
+        data.seek(0)
+
+        assert data.readByte() == ord('q')
+        assert data.readBoolean()
+        assert data.readInt() == -35
+        assert data.readString() == 'São Paulo'
+        assert data.tell() == len(data)
+
+
 class TestList(object):
     """Tests List type methods."""
 
@@ -132,14 +132,14 @@ class Bytes(io.BytesIO):
 
     def readString(self) -> str:
         """
-        Reads a string value.
+        Reads a string value, prefixed by its UTF-8 encoded length.
 
         Returns:
             The string value
         """
-        length = self._unpack('i', 4)
+        length = self.readInt()
 
-        return self._unpack('{:d}s'.format(length), length)
+        return self._unpack('{:d}s'.format(length), length).decode('utf-8')
 
     def writeByte(self, value: int):
         """
@@ -179,15 +179,15 @@ class Bytes(io.BytesIO):
 
     def writeString(self, value: str):
         """
-        Writes a string value.
+        Writes a string value, prefixed by its UTF-8 encoded length.
 
         Args:
             value: The string value
         """
-        length = len(value)
+        value = value.encode('utf-8')
 
-        self._pack('i', length)
-        self._pack('{:d}s'.format(length), value)
+        self.writeInt(len(value))
+        self._pack('{:d}s'.format(len(value)), value)
 
     def __repr__(self) -> str:
         """
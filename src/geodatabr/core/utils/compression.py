@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Compression helper module.
+
+This module provides the codecs used to compress the encoded dataset files
+while they are written.
+"""
+# Imports
+
+# Built-in dependencies
+
+import bz2
+import gzip
+import lzma
+from typing import BinaryIO
+
+# External dependencies
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Package dependencies
+
+from geodatabr.core import types
+
+# Constants
+
+CHUNK_SIZE = 1024 * 1024
+
+# Classes
+
+
+class Codec(types.AbstractClass):
+    """Base compression codec class."""
+
+    @property
+    def name(self) -> str:
+        """Gets the codec name."""
+        raise NotImplementedError
+
+    @property
+    def extension(self) -> str:
+        """Gets the codec file extension."""
+        raise NotImplementedError
+
+    @property
+    def levels(self) -> range:
+        """Gets the codec compression levels."""
+        raise NotImplementedError
+
+    @property
+    def defaultLevel(self) -> int:
+        """Gets the codec default compression level."""
+        raise NotImplementedError
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the codec dependencies are installed."""
+        return True
+
+    def writer(self, fileobj: BinaryIO, level: int = None) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        Closing the returned file object flushes the compressed stream but
+        leaves the given file object open.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level, defaults to the codec default level
+
+        Returns:
+            The compressing file object
+
+        Raises:
+            ValueError: If the compression level is not supported
+        """
+        if level is None:
+            level = self.defaultLevel
+
+        self.checkLevel(level)
+
+        return self._writer(fileobj, level)
+
+    def checkLevel(self, level: int = None):
+        """
+        Checks whether a given compression level is supported or not.
+
+        Args:
+            level: The compression level, if any
+
+        Raises:
+            ValueError: If the compression level is not supported
+        """
+        if level is not None and level not in self.levels:
+            raise ValueError(
+                'The {} compression level must be between {} and {}.'
+                .format(self.name, self.levels[0], self.levels[-1]))
+
+    def reader(self, fileobj: BinaryIO) -> BinaryIO:
+        """
+        Wraps a binary file object to decompress everything read from it.
+
+        Args:
+            fileobj: The binary file object to read
+
+        Returns:
+            The decompressing file object
+        """
+        raise NotImplementedError
+
+    def _writer(self, fileobj: BinaryIO, level: int) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level
+
+        Returns:
+            The compressing file object
+        """
+        raise NotImplementedError
+
+
+class GzipCodec(Codec):
+    """Gzip compression codec."""
+
+    name = 'gzip'
+    extension = '.gz'
+    levels = range(1, 10)
+    defaultLevel = 9
+
+    def reader(self, fileobj: BinaryIO) -> BinaryIO:
+        """
+        Wraps a binary file object to decompress everything read from it.
+
+        Args:
+            fileobj: The binary file object to read
+
+        Returns:
+            The decompressing file object
+        """
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+
+    def _writer(self, fileobj: BinaryIO, level: int) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        The original file name and modification time are left out of the
+        header, so the same data always compresses to the same bytes.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level
+
+        Returns:
+            The compressing file object
+        """
+        return gzip.GzipFile(filename='',
+                             fileobj=fileobj,
+                             mode='wb',
+                             compresslevel=level,
+                             mtime=0)
+
+
+class Bzip2Codec(Codec):
+    """Bzip2 compression codec."""
+
+    name = 'bz2'
+    extension = '.bz2'
+    levels = range(1, 10)
+    defaultLevel = 9
+
+    def reader(self, fileobj: BinaryIO) -> BinaryIO:
+        """
+        Wraps a binary file object to decompress everything read from it.
+
+        Args:
+            fileobj: The binary file object to read
+
+        Returns:
+            The decompressing file object
+        """
+        return bz2.BZ2File(fileobj, mode='rb')
+
+    def _writer(self, fileobj: BinaryIO, level: int) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level
+
+        Returns:
+            The compressing file object
+        """
+        return bz2.BZ2File(fileobj, mode='wb', compresslevel=level)
+
+
+class XzCodec(Codec):
+    """XZ compression codec."""
+
+    name = 'xz'
+    extension = '.xz'
+    levels = range(0, 10)
+    defaultLevel = 6
+
+    def reader(self, fileobj: BinaryIO) -> BinaryIO:
+        """
+        Wraps a binary file object to decompress everything read from it.
+
+        Args:
+            fileobj: The binary file object to read
+
+        Returns:
+            The decompressing file object
+        """
+        return lzma.LZMAFile(fileobj, mode='rb')
+
+    def _writer(self, fileobj: BinaryIO, level: int) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level
+
+        Returns:
+            The compressing file object
+        """
+        return lzma.LZMAFile(fileobj, mode='wb', preset=level)
+
+
+class ZstdCodec(Codec):
+    """Zstandard compression codec."""
+
+    name = 'zstd'
+    extension = '.zst'
+    levels = range(1, 23)
+    defaultLevel = 19
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the codec dependencies are installed."""
+        return zstandard is not None
+
+    def reader(self, fileobj: BinaryIO) -> BinaryIO:
+        """
+        Wraps a binary file object to decompress everything read from it.
+
+        Args:
+            fileobj: The binary file object to read
+
+        Returns:
+            The decompressing file object
+        """
+        return zstandard.ZstdDecompressor().stream_reader(fileobj,
+                                                          closefd=False)
+
+    def _writer(self, fileobj: BinaryIO, level: int) -> BinaryIO:
+        """
+        Wraps a binary file object to compress everything written to it.
+
+        Args:
+            fileobj: The binary file object to write
+            level: The compression level
+
+        Returns:
+            The compressing file object
+        """
+        return zstandard.ZstdCompressor(level=level, write_checksum=True) \
+            .stream_writer(fileobj, closefd=False)
+
+
+# Functions
+
+
+def names() -> types.List:
+    """
+    Returns a list with the names of all available codecs.
+
+    Returns:
+        The names of the available codecs
+    """
+    return types.List([codec().name
+                       for codec in Codec.childs()
+                       if codec().isAvailable])
+
+
+def find(name: str) -> Codec:
+    """
+    Finds an available codec by its name.
+
+    Args:
+        name: The codec name
+
+    Returns:
+        The codec instance
+
+    Raises:
+        ValueError: If the codec is not supported
+    """
+    for codec in Codec.childs():
+        if codec.name == name and codec().isAvailable:
+            return codec()
+
+    raise ValueError('Unsupported compression codec: {}'.format(name))
+
+
+def find_by_extension(extension: str) -> Codec:
+    """
+    Finds a codec by its file extension.
+
+    Args:
+        extension: The codec file extension
+
+    Returns:
+        The codec instance, if any
+    """
+    for codec in Codec.childs():
+        if codec.extension == extension:
+            return codec()
+
+    return None
+
+
+def uncompressed_size(fileobj: BinaryIO, codec: Codec) -> int:
+    """
+    Computes the uncompressed size of a compressed file.
+
+    The file is decompressed in chunks, so it is never loaded into memory.
+
+    Args:
+        fileobj: The compressed binary file object
+        codec: The codec the file is compressed with
+
+    Returns:
+        The uncompressed size in bytes
+    """
+    size = 0
+
+    with codec.reader(fileobj) as reader:
+        for chunk in iter(lambda: reader.read(CHUNK_SIZE), b''):
+            size += len(chunk)
+
+    return size
@@ -119,12 +119,16 @@ class ProjectReadme(Readme):
 class DatasetReadme(Readme):
     """A dataset README documentation file."""
 
-    def __init__(self, dataset_dir: io.Directory):
+    def __init__(self,
+                 dataset_dir: io.Directory,
+                 serializer: serializers.Serializer = None):
         """
         Creates a new dataset README documentation file instance.
 
         Args:
             dataset_dir: The dataset directory
+            serializer: The serializer to count the dataset records, defaults
+                to a new one
         """
         readme_file = io.File(dataset_dir / 'README.md')
         stub_file = io.File(io.Path.PKG_STUB_DIR / 'BASE_README.stub.md')
@@ -132,6 +136,7 @@ class DatasetReadme(Readme):
         super().__init__(readme_file, stub_file)
 
         self._dataset_dir = dataset_dir
+        self._serializer = serializer or serializers.Serializer()
 
     def render(self) -> str:
         """
@@ -153,11 +158,10 @@ class DatasetReadme(Readme):
         """
         headers = ['Table/Collection', 'Records']
         alignment = ['>', '>']
-        dataset = serializers.Serializer().serialize()
         data = [
-            [self._markdown.code(entity),
-             '{:,d}'.format(len(dataset[entity]))]
-            for entity in dataset
+            [self._markdown.code(table.name),
+             '{:,d}'.format(sum(1 for _ in table))]
+            for table in self._serializer.stream()
         ]
 
         return self._markdown.table([headers] + data, alignment)
@@ -166,14 +170,17 @@ class DatasetReadme(Readme):
         """
         Renders the dataset files info.
 
+        Compressed files are listed with both their raw and compressed sizes.
+
         Returns:
             The dataset files info
         """
         files = list(self._dataset_dir.files(
             pattern=i18n._('dataset_name') + '*'))
         grouped_files = itertools.groupby(
-            sorted(files, key=lambda file: file.format.type),
+            sorted(files, key=lambda file: (file.format.type, file.name)),
             key=lambda file: file.format.type)
+        compressed = any(file.compression for file in files)
         listing = []
 
         for dataset_type, dataset_files in grouped_files:
@@ -182,6 +189,10 @@ class DatasetReadme(Readme):
             alignment = ['<', '^', '>']
             rows = []
 
+            if compressed:
+                headers.append('Compressed size')
+                alignment.append('>')
+
             for dataset_file in dataset_files:
                 dataset_format = '-'
 
@@ -190,14 +201,34 @@ class DatasetReadme(Readme):
                         dataset_file.format.info,
                         dataset_file.format.friendlyName)
 
-                rows.append([self._markdown.code(dataset_file.name),
-                             dataset_format,
-                             '{:9,d}'.format(dataset_file.size)])
+                row = [self._markdown.code(dataset_file.name),
+                       dataset_format,
+                       self.renderFileSize(dataset_file.rawSize)]
+
+                if compressed:
+                    row.append(self.renderFileSize(
+                        dataset_file.size if dataset_file.compression
+                        else None))
+
+                rows.append(row)
 
             listing.append(self._markdown.table([headers] + rows, alignment))
 
         return '\n'.join(listing)
 
+    @staticmethod
+    def renderFileSize(size: int = None) -> str:
+        """
+        Renders a file size.
+
+        Args:
+            size: The file size in bytes, if it is known
+
+        Returns:
+            The file size
+        """
+        return '-' if size is None else '{:9,d}'.format(size)
+
 
 class Badge(types.AbstractClass, types.Map):
     """An abstract badge image."""
@@ -280,17 +280,45 @@ class File(Path):
 
     # Properties
 
+    @property
+    def compression(self):
+        """Gets the file compression codec, if any."""
+        from geodatabr.core.utils import compression
+
+        return compression.find_by_extension(self.suffix)
+
     @property
     def format(self):
-        """Gets the file format."""
+        """Gets the file format, looking through its compression."""
         from geodatabr.core.encoders import \
             EncoderFormatRepository, UnknownEncoderFormatError
 
+        extension = self.extension
+
+        if self.compression:
+            extension = ''.join(self.suffixes[-2:-1])
+
         try:
-            return EncoderFormatRepository.findByExtension(self.extension)
+            return EncoderFormatRepository.findByExtension(extension)
         except UnknownEncoderFormatError:
             return None
 
+    @property
+    def rawSize(self) -> int:
+        """Gets the file uncompressed size in bytes, if it can be known."""
+        from geodatabr.core.utils import compression
+
+        codec = self.compression
+
+        if not codec:
+            return self.size
+
+        if not codec.isAvailable:
+            return None
+
+        with self.open(mode='rb') as file_:
+            return compression.uncompressed_size(file_, codec)
+
     # Property aliases
 
     extension = Path.suffix
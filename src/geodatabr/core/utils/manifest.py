@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Build manifest helper module.
+
+This module provides the manifest used to skip rebuilding the files whose
+inputs have not changed since they were last built.
+"""
+# Imports
+
+# Built-in dependencies
+
+import hashlib
+import json
+import os
+import tempfile
+
+# Package dependencies
+
+from geodatabr.core import encoders, types
+from geodatabr.core.utils import io
+
+# Constants
+
+MANIFEST_NAME = '.manifest.json'
+MANIFEST_VERSION = 1
+
+# Functions
+
+
+def fingerprint(*inputs) -> str:
+    """
+    Computes the content fingerprint of the given inputs.
+
+    Args:
+        *inputs: The inputs, as JSON serializable values
+
+    Returns:
+        The SHA-256 hex digest of the canonical JSON of the inputs
+    """
+    return hashlib.sha256(
+        json.dumps(inputs,
+                   sort_keys=True,
+                   separators=(',', ':'),
+                   default=str).encode('utf-8')).hexdigest()
+
+
+# Classes
+
+
+class Manifest(object):
+    """
+    Build manifest of a directory.
+
+    It records the fingerprint of the inputs of each artifact built into the
+    directory, along with the files written for it, so an artifact is built
+    again only if its inputs changed or any of its files is missing.
+    """
+
+    def __init__(self, directory: io.Directory):
+        """
+        Loads the build manifest of a given directory.
+
+        A missing, unreadable or outdated manifest is loaded as an empty one.
+
+        Args:
+            directory: The build directory
+        """
+        self._directory = directory
+        self._file = io.File(directory / MANIFEST_NAME)
+        self._manifest = dict(version=MANIFEST_VERSION,
+                              inputs={},
+                              artifacts={})
+
+        try:
+            manifest = json.loads(self._file.read(encoding='utf-8'))
+
+            if manifest.get('version') == MANIFEST_VERSION:
+                self._manifest.update(manifest)
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def inputs(self) -> dict:
+        """Gets the recorded build inputs."""
+        return self._manifest['inputs']
+
+    @inputs.setter
+    def inputs(self, inputs: dict):
+        """Sets the recorded build inputs."""
+        self._manifest['inputs'] = inputs
+
+    def files(self, name: str) -> types.List:
+        """
+        Returns the files written for a given artifact.
+
+        Args:
+            name: The artifact name
+
+        Returns:
+            The artifact filenames, relative to the build directory
+        """
+        artifact = self._manifest['artifacts'].get(name, {})
+
+        return types.List(artifact.get('files', []))
+
+    def isFresh(self, name: str, artifact_fingerprint: str) -> bool:
+        """
+        Tells whether an artifact is built from the given inputs or not.
+
+        Args:
+            name: The artifact name
+            artifact_fingerprint: The fingerprint of the artifact inputs
+
+        Returns:
+            Whether the artifact files exist and were built from the same
+            inputs or not
+        """
+        artifact = self._manifest['artifacts'].get(name)
+
+        return bool(artifact
+                    and artifact['fingerprint'] == artifact_fingerprint
+                    and artifact['files']
+                    and all((self._directory / filename).is_file()
+                            for filename in artifact['files']))
+
+    def update(self, name: str, artifact_fingerprint: str, files: list):
+        """
+        Records a built artifact.
+
+        The files previously written for the artifact and not written again
+        are removed, so outputs of outdated options are not left behind.
+
+        Args:
+            name: The artifact name
+            artifact_fingerprint: The fingerprint of the artifact inputs
+            files: The artifact filenames, relative to the build directory
+        """
+        for filename in set(self.files(name)) - set(files):
+            try:
+                os.unlink(str(self._directory / filename))
+            except FileNotFoundError:
+                pass
+
+        self._manifest['artifacts'][name] = dict(
+            fingerprint=artifact_fingerprint,
+            files=sorted(files))
+
+    def save(self):
+        """Writes the manifest atomically into the build directory."""
+        with tempfile.NamedTemporaryFile(mode='w',
+                                         encoding='utf-8',
+                                         dir=str(self._directory),
+                                         prefix=MANIFEST_NAME + '.',
+                                         suffix='.tmp',
+                                         delete=False) as temp_file:
+            json.dump(self._manifest, temp_file, indent=2, sort_keys=True)
+            temp_file.write('\n')
+
+        # Temporary files are only readable by their owner
+        os.chmod(temp_file.name, 0o666 & ~encoders.UMASK)
+        os.replace(temp_file.name, str(self._file))
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Text helper module."""
+# Imports
+
+# Built-in dependencies
+
+import collections
+import re
+import unicodedata
+from typing import Iterable
+
+# Constants
+
+APOSTROPHES = re.compile('[\'‘’`´]')
+SEPARATORS = re.compile(r'[\W_]+')
+
+# Functions
+
+
+def normalize(text: str) -> str:
+    """
+    Normalizes a given text for case and accent insensitive comparisons.
+
+    The text is case folded and stripped from diacritics, apostrophes are
+    removed and any other punctuation is collapsed into single spaces, so
+    "Estrela D'Oeste" and "estrela doeste" are both normalized to the same
+    "estrela doeste" text.
+
+    Args:
+        text: The text to normalize
+
+    Returns:
+        The normalized text
+    """
+    text = ''.join(char for char in unicodedata.normalize('NFKD', text)
+                   if not unicodedata.combining(char))
+    text = APOSTROPHES.sub('', text.casefold())
+
+    return SEPARATORS.sub(' ', text).strip()
+
+
+def ngrams(text: str, size: int = 3) -> collections.Counter:
+    """
+    Counts the n-grams of a given text, padded with spaces on both ends.
+
+    Args:
+        text: The text to split
+        size: The n-gram size
+
+    Returns:
+        The count of each n-gram of the text
+    """
+    padding = ' ' * (size - 1)
+    text = padding + text + padding
+
+    return collections.Counter(text[index:index + size]
+                               for index in range(len(text) - size + 1))
+
+
+def distance(source: str, target: str) -> int:
+    """
+    Computes the Levenshtein edit distance between two texts.
+
+    It uses the Myers/Hyyrö bit-parallel algorithm, which handles a whole
+    column of the edit matrix at once on the bits of an integer.
+
+    Args:
+        source: The source text
+        target: The target text
+
+    Returns:
+        The edit distance
+    """
+    return _distance(source, _bitmasks(source), target)
+
+
+def _bitmasks(text: str) -> dict:
+    """
+    Maps each character of a given text to the bitmask of its positions.
+
+    Args:
+        text: The text
+
+    Returns:
+        The positions bitmask of each character
+    """
+    bitmasks = collections.defaultdict(int)
+
+    for index, char in enumerate(text):
+        bitmasks[char] |= 1 << index
+
+    return dict(bitmasks)
+
+
+def _distance(source: str, bitmasks: dict, target: str) -> int:
+    """
+    Computes the Levenshtein edit distance with the Myers/Hyyrö algorithm.
+
+    Args:
+        source: The source text
+        bitmasks: The positions bitmask of each character of the source text
+        target: The target text
+
+    Returns:
+        The edit distance
+    """
+    if not source:
+        return len(target)
+
+    mask = (1 << len(source)) - 1
+    last = 1 << (len(source) - 1)
+    positive, negative = mask, 0
+    score = len(source)
+
+    for char in target:
+        equal = bitmasks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        positive_horizontal = negative | ~(horizontal | positive)
+        negative_horizontal = positive & horizontal
+
+        if positive_horizontal & last:
+            score += 1
+        elif negative_horizontal & last:
+            score -= 1
+
+        positive_horizontal = (positive_horizontal << 1) | 1
+        negative_horizontal = negative_horizontal << 1
+        positive = (negative_horizontal
+                    | ~(vertical | positive_horizontal)) & mask
+        negative = positive_horizontal & vertical & mask
+
+    return score
+
+
+# Classes
+
+
+class NGramIndex(object):
+    """
+    Inverted n-gram index for approximate text matching.
+
+    Each edit changes at most N n-grams of a text, so texts within the maximum
+    edit distance of a query share a minimum number of n-grams with it, and
+    thus at least one of its rarest n-grams. Only the texts holding those are
+    candidates, and the edit distance is verified for a few texts only.
+    """
+
+    def __init__(self, texts: Iterable[str], size: int = 3):
+        """
+        Creates a new n-gram index.
+
+        Args:
+            texts: The texts to index, normalized by the caller if needed
+            size: The n-gram size
+        """
+        self._size = size
+        self._texts = []
+        self._positions = collections.defaultdict(list)
+        self._lengths = collections.defaultdict(list)
+        self._postings = collections.defaultdict(list)
+        self._ngrams = {}
+        self._counts = {}
+
+        for text in texts:
+            self._positions[text].append(len(self._texts))
+            self._texts.append(text)
+
+        for position, text in enumerate(self._texts):
+            if self._positions[text][0] != position:
+                continue
+
+            self._lengths[len(text)].append(position)
+            self._ngrams[position] = frozenset(ngrams(text, size))
+            self._counts[position] = len(text) + size - 1
+
+            for ngram in self._ngrams[position]:
+                self._postings[ngram].append(position)
+
+    def find(self, query: str, max_distance: int = 2) -> list:
+        """
+        Finds the indexed texts within a maximum edit distance of a query.
+
+        Args:
+            query: The query text
+            max_distance: The maximum edit distance
+
+        Returns:
+            A list of (distance, position) tuples, sorted by distance, with
+            the positions of all matching indexed texts
+        """
+        query_ngrams = ngrams(query, self._size)
+        query_count = len(query) + self._size - 1
+        query_set = frozenset(query_ngrams)
+        query_repeats = query_count - len(query_set)
+        lengths = range(max(0, len(query) - max_distance),
+                        len(query) + max_distance + 1)
+
+        # Count filter: the minimum number of n-grams shared with the query by
+        # the texts within the maximum edit distance
+        minimum = query_count - max_distance * self._size
+
+        if minimum > 0:
+            # Prefix filter: those texts share at least one of the rarest
+            # n-grams of the query, so only their postings are looked up
+            rarest = sorted(query_ngrams.elements(),
+                            key=lambda ngram: len(self._postings.get(ngram,
+                                                                     ())))
+            candidates = {position
+                          for ngram in set(rarest[:query_count - minimum + 1])
+                          for position in self._postings.get(ngram, ())}
+            # The distinct shared n-grams, plus the repeated ones of the
+            # query, bound the number of shared n-grams from above
+            candidates = [
+                position for position in candidates
+                if (abs(self._counts[position] - query_count) <= max_distance
+                    and (len(query_set & self._ngrams[position])
+                         + query_repeats)
+                    >= (max(query_count, self._counts[position])
+                        - max_distance * self._size))]
+        else:
+            # Too short queries can match texts sharing no n-grams at all
+            candidates = [position
+                          for length in lengths
+                          for position in self._lengths.get(length, ())]
+
+        bitmasks = _bitmasks(query)
+        matches = []
+
+        for position in candidates:
+            text_distance = _distance(query, bitmasks, self._texts[position])
+
+            if text_distance <= max_distance:
+                matches.extend((text_distance, _position)
+                               for _position
+                               in self._positions[self._texts[position]])
+
+        return sorted(matches)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Datasets indexes module.
+
+This module provides in-memory indexes used to query the datasets without
+hitting the database.
+"""
+# Imports
+
+# Built-in dependencies
+
+import array
+import collections
+from typing import Iterable, Iterator
+
+# External dependencies
+
+import sqlalchemy as db
+
+# Package dependencies
+
+from geodatabr.core import datasets, decorators, types
+from geodatabr.core.utils import text
+from geodatabr.dataset import schema
+
+# Classes
+
+
+class _TerritoryTable(object):
+    """
+    Array-backed table of the territories of a single entity.
+
+    Attributes:
+        entity (geodatabr.core.datasets.Entity): The entity class
+        columns (list): The table column names
+        parent_columns (list): The parent territories ID column names
+        ids (array.array): The territories IDs, in ascending order
+        names (list): The territories names
+        parents (dict): The parent territories IDs arrays, by column name
+        positions (dict): The territories row positions, by ID
+        name_positions (dict): The territories row positions, by their
+            normalized name
+        children (dict): The children territories offset tables, by entity
+    """
+
+    def __init__(self, entity: datasets.Entity, rows: Iterable[tuple]):
+        """
+        Creates a new territory table.
+
+        Args:
+            entity: The entity class
+            rows: The entity rows, with values in the table columns order and
+                sorted by ID
+        """
+        self.entity = entity
+        self.columns = [column.name for column in entity.__table__.columns]
+        self.parent_columns = [column for column in self.columns
+                               if column.endswith('_id')]
+        self.ids = array.array('q')
+        self.names = []
+        self.parents = {column: array.array('q')
+                        for column in self.parent_columns}
+        self.positions = {}
+        self.name_positions = collections.defaultdict(list)
+        self.children = {}
+
+        id_index = self.columns.index('id')
+        name_index = self.columns.index('name')
+        parent_indexes = [(self.parents[column], self.columns.index(column))
+                          for column in self.parent_columns]
+
+        for position, row in enumerate(rows):
+            self.ids.append(row[id_index])
+            self.names.append(row[name_index])
+            self.positions[row[id_index]] = position
+            self.name_positions[text.normalize(row[name_index])] \
+                .append(position)
+
+            for values, index in parent_indexes:
+                values.append(row[index])
+
+        self.name_positions = {name: tuple(positions)
+                               for name, positions
+                               in self.name_positions.items()}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of territories.
+
+        Returns:
+            The number of territories
+        """
+        return len(self.ids)
+
+    def record(self, position: int) -> types.Map:
+        """
+        Builds the record of the territory at the given row position.
+
+        Args:
+            position: The territory row position
+
+        Returns:
+            The territory record
+        """
+        record = types.Map()
+
+        for column in self.columns:
+            if column == 'id':
+                record[column] = self.ids[position]
+            elif column == 'name':
+                record[column] = self.names[position]
+            else:
+                record[column] = self.parents[column][position]
+
+        return record
+
+    def link(self, parent: '_TerritoryTable', column: str):
+        """
+        Builds the offset table of the territories of each parent territory.
+
+        The children row positions of the parent territory at row position N
+        are stored from children[offsets[N]] to children[offsets[N + 1]].
+
+        Args:
+            parent: The parent territory table
+            column: The parent territories ID column name
+        """
+        counts = [0] * (len(parent) + 1)
+        parent_positions = [parent.positions.get(parent_id)
+                            for parent_id in self.parents[column]]
+
+        for parent_position in parent_positions:
+            if parent_position is not None:
+                counts[parent_position + 1] += 1
+
+        offsets = array.array('l', counts)
+
+        for position in range(1, len(offsets)):
+            offsets[position] += offsets[position - 1]
+
+        children = array.array('l', bytes(offsets[-1] * offsets.itemsize))
+        cursors = offsets[:-1]
+
+        for position, parent_position in enumerate(parent_positions):
+            if parent_position is not None:
+                children[cursors[parent_position]] = position
+                cursors[parent_position] += 1
+
+        parent.children[self.entity] = (offsets, children)
+
+
+class TerritoryIndex(object):
+    """
+    In-memory index of the dataset territories.
+
+    The territories of each entity are kept on compact arrays, along with
+    mappings of their row positions by ID and by normalized name, and offset
+    tables with the row positions of the descendant territories of each
+    territory, so lookups never touch the database once the index is built.
+    """
+
+    def __init__(self, rows: dict):
+        """
+        Creates a new territory index.
+
+        Args:
+            rows: The rows of each entity class, with values in the table
+                columns order and sorted by ID
+        """
+        self._tables = collections.OrderedDict(
+            (entity, _TerritoryTable(entity, rows.get(entity, ())))
+            for entity in schema.ENTITIES)
+        self._parent_entities = {'{}_id'.format(entity._name): entity
+                                 for entity in schema.ENTITIES}
+
+        for table in self._tables.values():
+            for column in table.parent_columns:
+                table.link(self._tables[self._parent_entities[column]],
+                           column)
+
+    @classmethod
+    @decorators.cachedmethod()
+    def load(cls) -> 'TerritoryIndex':
+        """
+        Loads the territory index from the database, only once.
+
+        Returns:
+            The territory index instance
+        """
+        rows = {}
+
+        for entity in schema.ENTITIES:
+            table = entity.__table__
+            rows[entity] = datasets.Repository.db.execute(
+                db.select([table]).order_by(table.c.id)).fetchall()
+
+        return cls(rows)
+
+    def count(self, entity: datasets.Entity) -> int:
+        """
+        Returns the total territories count of a given entity.
+
+        Args:
+            entity: The entity class
+
+        Returns:
+            The total territories count
+        """
+        return len(self._tables[entity])
+
+    def records(self, entity: datasets.Entity) -> Iterator[types.Map]:
+        """
+        Yields all territories of a given entity.
+
+        Args:
+            entity: The entity class
+
+        Yields:
+            The territory records, sorted by ID
+        """
+        table = self._tables[entity]
+
+        for position in range(len(table)):
+            yield table.record(position)
+
+    def findById(self, entity: datasets.Entity, _id: int) -> types.Map:
+        """
+        Retrieves a single territory by ID.
+
+        Args:
+            entity: The entity class
+            _id: The territory ID
+
+        Returns:
+            The territory record, or None if it is not found
+        """
+        table = self._tables[entity]
+        position = table.positions.get(_id)
+
+        return table.record(position) if position is not None else None
+
+    def findByName(self, entity: datasets.Entity, name: str) -> types.List:
+        """
+        Retrieves all territories with a given name, regardless of its case,
+        accents and punctuation.
+
+        Args:
+            entity: The entity class
+            name: The territory name
+
+        Returns:
+            A list with all matching territory records
+        """
+        table = self._tables[entity]
+
+        return types.List(
+            table.record(position)
+            for position in table.name_positions.get(text.normalize(name),
+                                                     ()))
+
+    def findAncestors(self,
+                      entity: datasets.Entity,
+                      _id: int) -> types.OrderedMap:
+        """
+        Retrieves the ancestor territories of a given territory.
+
+        Args:
+            entity: The entity class
+            _id: The territory ID
+
+        Returns:
+            The ancestor territory records by entity class, from the topmost
+            one, or None if the territory is not found
+        """
+        table = self._tables[entity]
+        position = table.positions.get(_id)
+
+        if position is None:
+            return None
+
+        ancestors = types.OrderedMap()
+
+        for ancestor in schema.ENTITIES:
+            column = '{}_id'.format(ancestor._name)
+
+            if column in table.parents:
+                ancestors[ancestor] = self.findById(
+                    ancestor, table.parents[column][position])
+
+        return ancestors
+
+    def findDescendants(self,
+                        entity: datasets.Entity,
+                        _id: int,
+                        descendant: datasets.Entity) -> types.List:
+        """
+        Retrieves the descendant territories of a given territory.
+
+        Args:
+            entity: The entity class
+            _id: The territory ID
+            descendant: The descendant entity class
+
+        Returns:
+            A list with the descendant territory records, sorted by ID
+        """
+        table = self._tables[entity]
+        position = table.positions.get(_id)
+
+        if position is None or descendant not in table.children:
+            return types.List()
+
+        descendants = self._tables[descendant]
+        offsets, children = table.children[descendant]
+
+        return types.List(
+            descendants.record(child)
+            for child in children[offsets[position]:offsets[position + 1]])
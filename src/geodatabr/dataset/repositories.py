@@ -540,3 +540,57 @@ class SubdistrictRepository(datasets.Repository):
     def delete(cls):
         """Removes all subdistricts."""
         super().delete()
+
+
+class CheckpointRepository(datasets.Repository):
+    """
+    Implementation of seeding checkpoints repository.
+
+    Attributes:
+        entity (geodatabr.dataset.schema.Checkpoint):
+            The repository entity class
+    """
+
+    entity = schema.Checkpoint
+
+    @classmethod
+    def add(cls, instance: schema.Checkpoint):
+        """
+        Saves a Checkpoint instance.
+
+        Args:
+            instance: The Checkpoint instance to save
+        """
+        super().add(instance)
+
+    @classmethod
+    def findParentIds(cls, table_name: str) -> set:
+        """
+        Retrieves the IDs of the parents already expanded into a table.
+
+        Args:
+            table_name: The seeded table name
+
+        Returns:
+            A set with the expanded parent IDs
+        """
+        return {parent_id
+                for (parent_id,) in cls.db.query(cls.entity.parent_id)
+                .filter(cls.entity.table_name == table_name)}
+
+    @classmethod
+    def deleteByTableName(cls, table_name: str):
+        """
+        Removes the checkpoints of a table.
+
+        Args:
+            table_name: The seeded table name
+        """
+        cls.db.query(cls.entity) \
+            .filter(cls.entity.table_name == table_name) \
+            .delete()
+
+    @classmethod
+    def delete(cls):
+        """Removes all checkpoints."""
+        super().delete()
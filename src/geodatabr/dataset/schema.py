@@ -257,6 +257,24 @@ class Subdistrict(datasets.Entity):
     district = orm.relationship('District', back_populates='subdistricts')
 
 
+class Checkpoint(datasets.Entity):
+    """Entity class for seeding checkpoints."""
+
+    _name = 'checkpoint'
+
+    __table__ = schema.Table(
+        'checkpoints',
+        datasets.Entity.metadata,
+        schema.Column('table_name',
+                      types.String(32),
+                      nullable=False,
+                      primary_key=True),
+        schema.Column('parent_id',
+                      types.BigInteger,
+                      nullable=False,
+                      primary_key=True))
+
+
 # Constants
 
 ENTITIES = (State, Mesoregion, Microregion, Municipality, District, Subdistrict)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Datasets search module.
+
+This module provides the name search of the dataset territories.
+"""
+# Imports
+
+# Built-in dependencies
+
+import bisect
+import functools
+import heapq
+from typing import Iterable
+
+# Package dependencies
+
+from geodatabr.core import datasets, decorators, types
+from geodatabr.core.utils import text
+from geodatabr.dataset import indexes, schema
+
+# Settings
+
+SEARCH_CACHE_SIZE = 4096
+
+# Constants
+
+# Match kinds, from the best ranked one
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_WORD = 2
+MATCH_WORD_PREFIX = 3
+
+# Classes
+
+
+class TerritorySearch(object):
+    """
+    Name search of the dataset territories.
+
+    The normalized names of all territories are kept on a sorted array, along
+    with their suffixes starting at each word, so a prefix query is answered
+    by a binary search followed by a scan of the matching keys only. Results
+    are ranked by how the query matches the name (whole name, name prefix,
+    whole words or word prefix), then by the entity level, from the states
+    down to the subdistricts, and then by the number of words in the name.
+    """
+
+    def __init__(self, index: indexes.TerritoryIndex):
+        """
+        Creates a new territory search.
+
+        Args:
+            index: The territory index to search
+        """
+        entries = []
+
+        for level, entity in enumerate(schema.ENTITIES):
+            for record in index.records(entity):
+                words = text.normalize(record.name).split(' ')
+                state_id = record.get('state_id', record.id)
+
+                for word in range(len(words)):
+                    entries.append((' '.join(words[word:]),
+                                    word > 0,
+                                    len(words),
+                                    level,
+                                    state_id,
+                                    record.id))
+
+        entries.sort()
+
+        self._index = index
+        self._keys = [entry[0] for entry in entries]
+        self._entries = [entry[1:] for entry in entries]
+        self._search = functools.lru_cache(SEARCH_CACHE_SIZE)(self._search)
+
+    @classmethod
+    @decorators.cachedmethod()
+    def load(cls) -> 'TerritorySearch':
+        """
+        Loads the territory search over the loaded territory index, only once.
+
+        Returns:
+            The territory search instance
+        """
+        return cls(indexes.TerritoryIndex.load())
+
+    def search(self,
+               query: str,
+               entities: Iterable[datasets.Entity] = None,
+               state: int = None,
+               limit: int = 10) -> types.List:
+        """
+        Searches the territories whose names, or any of their words, start
+        with the given query, regardless of its case, accents and punctuation.
+
+        Args:
+            query: The search query
+            entities: The entity classes to search, defaults to all of them
+            state: The ID of a state to restrict the search to
+            limit: The maximum number of results
+
+        Returns:
+            A list with the best ranked results, each one a mapping with the
+            entity class, the territory record and the match kind
+        """
+        levels = None
+
+        if entities is not None:
+            levels = frozenset(schema.ENTITIES.index(entity)
+                               for entity in entities)
+
+        return types.List(
+            types.Map(entity=schema.ENTITIES[level],
+                      territory=self._index.findById(schema.ENTITIES[level],
+                                                     _id),
+                      match=kind)
+            for kind, level, _id in self._search(text.normalize(query),
+                                                 levels,
+                                                 state,
+                                                 limit))
+
+    def _search(self,
+                query: str,
+                levels: frozenset,
+                state: int,
+                limit: int) -> tuple:
+        """
+        Searches the territories matching a normalized query.
+
+        The results of the most recent queries are memoized, since the same
+        queries tend to be repeated over and over by batch jobs. They are kept
+        as immutable tuples, so callers never share the returned records.
+
+        Args:
+            query: The normalized search query
+            levels: The entity levels to search, or None for all of them
+            state: The ID of a state to restrict the search to
+            limit: The maximum number of results
+
+        Returns:
+            The match kind, entity level and territory ID of each one of the
+            best ranked results
+        """
+        if not query:
+            return ()
+
+        matches = {}
+        position = bisect.bisect_left(self._keys, query)
+
+        while (position < len(self._keys)
+               and self._keys[position].startswith(query)):
+            is_word, words, level, state_id, _id = self._entries[position]
+            key = self._keys[position]
+            position += 1
+
+            if ((levels is not None and level not in levels)
+                    or (state is not None and state_id != state)):
+                continue
+
+            if not is_word:
+                kind = MATCH_EXACT if key == query else MATCH_PREFIX
+            elif len(key) == len(query) or key[len(query)] == ' ':
+                kind = MATCH_WORD
+            else:
+                kind = MATCH_WORD_PREFIX
+
+            rank = (kind, level, words, _id)
+
+            # Keep the best match of each territory only
+            if (level, _id) not in matches or rank < matches[level, _id]:
+                matches[level, _id] = rank
+
+        return tuple((kind, level, _id)
+                     for kind, level, _, _id in heapq.nsmallest(
+                         limit, matches.values()))
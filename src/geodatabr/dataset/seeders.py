@@ -9,11 +9,24 @@ This module provides the seeders classes used to populate the datasets.
 """
 # Imports
 
+# Built-in dependencies
+
+import asyncio
+import collections
+import functools
+import itertools
+from concurrent import futures
+from typing import Iterator
+
 # Package dependencies
 
-from geodatabr.core import datasets
+from geodatabr.core import datasets, logging, types
 from geodatabr.dataset import repositories, schema, services as sidra
 
+# Settings
+
+SEED_BATCH_SIZE = 100
+
 # Classes
 
 
@@ -25,11 +38,254 @@ class Seeder(datasets.Seeder):
         db (geodatabr.core.datasets.Database): The database instance
         entity (geodatabr.core.datasets.Entity): The entity class
         repository (geodatabr.core.datasets.Repository): The repository class
+        parent_repository (geodatabr.core.datasets.Repository):
+            The parent territories repository class
+        level (int): The SIDRA territorial level of the seeded territories
+        parent_level (int): The SIDRA territorial level of their parents
         sidra_db (geodatabr.dataset.services.SidraDataset):
             The SIDRA dataset service instance
+        workers (int): The number of concurrent SIDRA requests
+        asynchronous (bool): Whether the SIDRA requests should be sent by an
+            asynchronous client instead of a pool of worker threads
+        strategy (str): The strategy used to find the children territories,
+            either "bulk" or "crawl"
     """
 
+    parent_repository = None
+    level = None
+    parent_level = None
     sidra_db = sidra.SidraDataset()
+    workers = 1
+    asynchronous = False
+    strategy = 'bulk'
+
+    @classmethod
+    def run(cls):
+        """
+        Runs the database seeder.
+
+        The parent territories are expanded in batches, each one committed
+        along with a checkpoint of its expanded parents, so an interrupted
+        seeding resumes from the parents not expanded yet. Parents whose
+        children could not be fetched are left to be expanded on a re-run.
+        Once all parents are expanded, the table checkpoints are removed, so
+        the table is taken as complete from then on.
+
+        Raises:
+            geodatabr.dataset.seeders.NothingToSeedError:
+                If all parent territories were already expanded
+        """
+        table_name = cls.entity.__table__.name
+        checkpoints = repositories.CheckpointRepository
+        expanded = checkpoints.findParentIds(table_name)
+
+        # Tables seeded without checkpoints are taken as complete
+        if not expanded and cls.repository.count():
+            raise NothingToSeedError
+
+        parents = [types.Map(parent.serialize())
+                   for parent in cls.parent_repository.findAll()
+                   if parent.id not in expanded]
+
+        if not parents:
+            cls._complete(table_name)
+
+            raise NothingToSeedError
+
+        territories = cls.resolve(parents,
+                                  cls.level,
+                                  cls.parent_level,
+                                  expanded)
+        failures = 0
+
+        for batch in iter(lambda: list(itertools.islice(territories,
+                                                        SEED_BATCH_SIZE)),
+                          []):
+            resolved = [(parent, children)
+                        for parent, children in batch
+                        if not children.failed]
+            failures += len(batch) - len(resolved)
+
+            with cls.db.transaction(cls.db.session()):
+                cls.repository.addMany(cls.build(parent, child)
+                                       for parent, children in resolved
+                                       for child in children)
+                checkpoints.addMany(dict(table_name=table_name,
+                                         parent_id=parent.id)
+                                    for parent, _ in resolved)
+
+        if failures:
+            logging.logger().warning(
+                'Failed to expand %d parent territories, run again to resume.',
+                failures)
+
+            return
+
+        cls._complete(table_name)
+
+    @classmethod
+    def _complete(cls, table_name: str):
+        """
+        Removes the checkpoints of a completely seeded table.
+
+        Args:
+            table_name: The seeded table name
+        """
+        with cls.db.transaction(cls.db.session()):
+            repositories.CheckpointRepository.deleteByTableName(table_name)
+
+    @classmethod
+    def build(cls, parent: types.Map, territory: types.Map) -> dict:
+        """
+        Builds the entity row of a seeded territory.
+
+        Args:
+            parent: The parent territory record
+            territory: The SIDRA territory record
+
+        Returns:
+            The entity row
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def resolve(cls,
+                parents: list,
+                child_level: int,
+                parent_level: int,
+                expanded: set = None) -> Iterator[tuple]:
+        """
+        Finds the children territories of each one of the given parents.
+
+        With the "bulk" strategy, the whole children territorial level is
+        fetched at once and each territory is linked to its parent by the code
+        prefix. Only the parents of territories that could not be linked this
+        way are then crawled one by one. The levels whose codes are not
+        prefixed by their parent codes at all, the microregions and the
+        municipalities, are always crawled.
+
+        Args:
+            parents: The parent territory records
+            child_level: The children territorial level
+            parent_level: The parent territorial level
+            expanded: The IDs of other parents already expanded, whose
+                children should be ignored
+
+        Yields:
+            A (parent, children) tuple for each given parent
+        """
+        parent_code = sidra.SidraDataset.parentCode
+        expanded = expanded or set()
+
+        if (cls.strategy != 'bulk'
+                or parent_code(0, child_level, parent_level) is None):
+            yield from cls.crawl(parents, child_level, parent_level)
+
+            return
+
+        territories = cls.sidra_db.findAll(child_level)
+
+        if not territories:
+            yield from cls.crawl(parents, child_level, parent_level)
+
+            return
+
+        children = collections.OrderedDict(
+            (parent.id, sidra.SidraDatasetResponse({})) for parent in parents)
+        unresolved_states = set()
+
+        for territory in territories:
+            parent_id = parent_code(territory.id, child_level, parent_level)
+
+            if parent_id in children:
+                children[parent_id].append(territory)
+            elif parent_id not in expanded:
+                unresolved_states.add(parent_code(territory.id,
+                                                  child_level,
+                                                  sidra.SIDRA_STATE))
+
+        # Fallback to crawl the parents that may hold unresolved territories
+        fallback_parents = [
+            parent for parent in parents
+            if parent_code(parent.id,
+                           parent_level,
+                           sidra.SIDRA_STATE) in unresolved_states]
+
+        for parent, _children in cls.crawl(fallback_parents,
+                                           child_level,
+                                           parent_level):
+            children[parent.id] = _children
+
+        for parent in parents:
+            yield parent, children[parent.id]
+
+    @classmethod
+    def crawl(cls,
+              parents: list,
+              child_level: int,
+              parent_level: int) -> Iterator[tuple]:
+        """
+        Crawls the children territories of each one of the given parents.
+
+        The requests are spread over a pool of worker threads, or sent at once
+        by an asynchronous client when enabled, all of them sharing the same
+        HTTP rate limiter, while the results are still yielded in the same
+        order of the given parents. Each worker thread sends its requests
+        through its own HTTP session.
+
+        Args:
+            parents: The parent territory records
+            child_level: The children territorial level
+            parent_level: The parent territorial level
+
+        Yields:
+            A (parent, children) tuple for each given parent
+        """
+        parent_ids = [parent.id for parent in parents]
+
+        if cls.asynchronous:
+            yield from zip(parents, cls._crawlAsync(child_level,
+                                                    parent_level,
+                                                    parent_ids))
+
+            return
+
+        find_children = functools.partial(cls.sidra_db.findChildren,
+                                          child_level,
+                                          parent_level)
+
+        with futures.ThreadPoolExecutor(max_workers=cls.workers) as executor:
+            yield from zip(parents, executor.map(find_children, parent_ids))
+
+    @classmethod
+    def _crawlAsync(cls,
+                    child_level: int,
+                    parent_level: int,
+                    parent_ids: list) -> list:
+        """
+        Finds the children territories of the given parents asynchronously.
+
+        Args:
+            child_level: The children territorial level
+            parent_level: The parent territorial level
+            parent_ids: The parent territories IDs
+
+        Returns:
+            The children territories of each parent, in the given order
+        """
+        async def find_children() -> list:
+            async with sidra.AsyncSidraDataset(limit_per_host=cls.workers) \
+                    as sidra_db:
+                return await sidra_db.findChildrenMany(child_level,
+                                                       parent_level,
+                                                       parent_ids)
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            return loop.run_until_complete(find_children())
+        finally:
+            loop.close()
 
 
 class StateSeeder(Seeder):
@@ -61,9 +317,8 @@ class StateSeeder(Seeder):
         states = cls.sidra_db.findAll(sidra.SIDRA_STATE)
 
         with cls.db.transaction(cls.db.session()):
-            for state in states:
-                cls.repository.add(cls.entity(id=state.id,
-                                              name=state.name))
+            cls.repository.addMany(dict(id=state.id, name=state.name)
+                                   for state in states)
 
 
 class MesoregionSeeder(Seeder):
@@ -82,32 +337,26 @@ class MesoregionSeeder(Seeder):
     entity = schema.Mesoregion
     repository = repositories.MesoregionRepository
     parent_repository = repositories.StateRepository
+    level = sidra.SIDRA_MESOREGION
+    parent_level = sidra.SIDRA_STATE
 
     @classmethod
-    def run(cls):
+    def build(cls,
+              parent: types.Map,
+              territory: types.Map) -> dict:
         """
-        Runs the database seeder.
-
-        Raises:
-            geodatabr.dataset.seeders.NothingToSeedError:
-                If the mesoregions table is not empty
-        """
-        if cls.repository.count():
-            raise NothingToSeedError
+        Builds the entity row of a seeded mesoregion.
 
-        states = cls.parent_repository.findAll()
+        Args:
+            parent: The parent state record
+            territory: The SIDRA mesoregion record
 
-        with cls.db.transaction(cls.db.session()):
-            for state in states:
-                mesoregions = cls.sidra_db \
-                    .findChildren(sidra.SIDRA_MESOREGION,
-                                  sidra.SIDRA_STATE,
-                                  state.id)
-
-                for mesoregion in mesoregions:
-                    cls.repository.add(cls.entity(id=mesoregion.id,
-                                                  state_id=state.id,
-                                                  name=mesoregion.name))
+        Returns:
+            The Mesoregion row
+        """
+        return dict(id=territory.id,
+                    state_id=parent.id,
+                    name=territory.name)
 
 
 class MicroregionSeeder(Seeder):
@@ -126,34 +375,27 @@ class MicroregionSeeder(Seeder):
     entity = schema.Microregion
     repository = repositories.MicroregionRepository
     parent_repository = repositories.MesoregionRepository
+    level = sidra.SIDRA_MICROREGION
+    parent_level = sidra.SIDRA_MESOREGION
 
     @classmethod
-    def run(cls):
+    def build(cls,
+              parent: types.Map,
+              territory: types.Map) -> dict:
         """
-        Runs the database seeder.
+        Builds the entity row of a seeded microregion.
 
-        Raises:
-            geodatabr.dataset.seeders.NothingToSeedError:
-                If the microregions table is not empty
-        """
-        if cls.repository.count():
-            raise NothingToSeedError
+        Args:
+            parent: The parent mesoregion record
+            territory: The SIDRA microregion record
 
-        mesoregions = cls.parent_repository.findAll()
-
-        with cls.db.transaction(cls.db.session()):
-            for mesoregion in mesoregions:
-                microregions = cls.sidra_db \
-                    .findChildren(sidra.SIDRA_MICROREGION,
-                                  sidra.SIDRA_MESOREGION,
-                                  mesoregion.id)
-
-                for microregion in microregions:
-                    cls.repository.add(
-                        cls.entity(id=microregion.id,
-                                   state_id=mesoregion.state_id,
-                                   mesoregion_id=mesoregion.id,
-                                   name=microregion.name))
+        Returns:
+            The Microregion row
+        """
+        return dict(id=territory.id,
+                    state_id=parent.state_id,
+                    mesoregion_id=parent.id,
+                    name=territory.name)
 
 
 class MunicipalitySeeder(Seeder):
@@ -172,35 +414,28 @@ class MunicipalitySeeder(Seeder):
     entity = schema.Municipality
     repository = repositories.MunicipalityRepository
     parent_repository = repositories.MicroregionRepository
+    level = sidra.SIDRA_MUNICIPALITY
+    parent_level = sidra.SIDRA_MICROREGION
 
     @classmethod
-    def run(cls):
+    def build(cls,
+              parent: types.Map,
+              territory: types.Map) -> dict:
         """
-        Runs the database seeder.
-
-        Raises:
-            geodatabr.dataset.seeders.NothingToSeedError:
-                If the municipalities table is not empty
-        """
-        if cls.repository.count():
-            raise NothingToSeedError
+        Builds the entity row of a seeded municipality.
 
-        microregions = cls.parent_repository.findAll()
+        Args:
+            parent: The parent microregion record
+            territory: The SIDRA municipality record
 
-        with cls.db.transaction(cls.db.session()):
-            for microregion in microregions:
-                municipalities = cls.sidra_db \
-                    .findChildren(sidra.SIDRA_MUNICIPALITY,
-                                  sidra.SIDRA_MICROREGION,
-                                  microregion.id)
-
-                for municipality in municipalities:
-                    cls.repository.add(
-                        cls.entity(id=municipality.id,
-                                   state_id=microregion.state_id,
-                                   mesoregion_id=microregion.mesoregion_id,
-                                   microregion_id=microregion.id,
-                                   name=municipality.name))
+        Returns:
+            The Municipality row
+        """
+        return dict(id=territory.id,
+                    state_id=parent.state_id,
+                    mesoregion_id=parent.mesoregion_id,
+                    microregion_id=parent.id,
+                    name=territory.name)
 
 
 class DistrictSeeder(Seeder):
@@ -219,36 +454,29 @@ class DistrictSeeder(Seeder):
     entity = schema.District
     repository = repositories.DistrictRepository
     parent_repository = repositories.MunicipalityRepository
+    level = sidra.SIDRA_DISTRICT
+    parent_level = sidra.SIDRA_MUNICIPALITY
 
     @classmethod
-    def run(cls):
-        """
-        Runs the database seeder.
-
-        Raises:
-            geodatabr.dataset.seeders.NothingToSeedError:
-                If the districts table is not empty
+    def build(cls,
+              parent: types.Map,
+              territory: types.Map) -> dict:
         """
-        if cls.repository.count():
-            raise NothingToSeedError
+        Builds the entity row of a seeded district.
 
-        municipalities = cls.parent_repository.findAll()
+        Args:
+            parent: The parent municipality record
+            territory: The SIDRA district record
 
-        with cls.db.transaction(cls.db.session()):
-            for municipality in municipalities:
-                districts = cls.sidra_db \
-                    .findChildren(sidra.SIDRA_DISTRICT,
-                                  sidra.SIDRA_MUNICIPALITY,
-                                  municipality.id)
-
-                for district in districts:
-                    cls.repository.add(
-                        cls.entity(id=district.id,
-                                   state_id=municipality.state_id,
-                                   mesoregion_id=municipality.mesoregion_id,
-                                   microregion_id=municipality.microregion_id,
-                                   municipality_id=municipality.id,
-                                   name=district.name))
+        Returns:
+            The District row
+        """
+        return dict(id=territory.id,
+                    state_id=parent.state_id,
+                    mesoregion_id=parent.mesoregion_id,
+                    microregion_id=parent.microregion_id,
+                    municipality_id=parent.id,
+                    name=territory.name)
 
 
 class SubdistrictSeeder(Seeder):
@@ -267,37 +495,30 @@ class SubdistrictSeeder(Seeder):
     entity = schema.Subdistrict
     repository = repositories.SubdistrictRepository
     parent_repository = repositories.DistrictRepository
+    level = sidra.SIDRA_SUBDISTRICT
+    parent_level = sidra.SIDRA_DISTRICT
 
     @classmethod
-    def run(cls):
+    def build(cls,
+              parent: types.Map,
+              territory: types.Map) -> dict:
         """
-        Runs the database seeder.
+        Builds the entity row of a seeded subdistrict.
 
-        Raises:
-            geodatabr.dataset.seeders.NothingToSeedError:
-                If the subdistricts table is not empty
-        """
-        if cls.repository.count():
-            raise NothingToSeedError
+        Args:
+            parent: The parent district record
+            territory: The SIDRA subdistrict record
 
-        districts = cls.parent_repository.findAll()
-
-        with cls.db.transaction(cls.db.session()):
-            for district in districts:
-                subdistricts = cls.sidra_db \
-                    .findChildren(sidra.SIDRA_SUBDISTRICT,
-                                  sidra.SIDRA_DISTRICT,
-                                  district.id)
-
-                for subdistrict in subdistricts:
-                    cls.repository.add(
-                        cls.entity(id=subdistrict.id,
-                                   state_id=district.state_id,
-                                   mesoregion_id=district.mesoregion_id,
-                                   microregion_id=district.microregion_id,
-                                   municipality_id=district.municipality_id,
-                                   district_id=district.id,
-                                   name=subdistrict.name))
+        Returns:
+            The Subdistrict row
+        """
+        return dict(id=territory.id,
+                    state_id=parent.state_id,
+                    mesoregion_id=parent.mesoregion_id,
+                    microregion_id=parent.microregion_id,
+                    municipality_id=parent.municipality_id,
+                    district_id=parent.id,
+                    name=territory.name)
 
 
 class NothingToSeedError(Exception):
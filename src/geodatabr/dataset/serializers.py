@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Datasets serializers module.
+
+This module provides the serializers used to export the datasets.
+"""
+# Imports
+
+# Built-in dependencies
+
+from typing import Iterable, Iterator
+
+# Package dependencies
+
+from geodatabr.core import datasets, types
+from geodatabr.dataset import repositories, schema  # noqa: F401
+
+# Classes
+
+
+class Serializer(datasets.Serializer):
+    """Implementation of the dataset serializer."""
+
+    def stream(self,
+               entities: Iterable[datasets.Entity] = None
+               ) -> Iterator[datasets.TableStream]:
+        """
+        Serializes the dataset rows lazily, without loading entity instances.
+
+        Args:
+            entities: The list of entities to serialize, defaults to all of
+                the dataset entities
+
+        Yields:
+            A rows stream of each non-empty table
+        """
+        yield from super().stream(entities or schema.ENTITIES)
+
+    def serialize(self,
+                  entities: Iterable[datasets.Entity] = None
+                  ) -> types.OrderedMap:
+        """
+        Serializes the dataset rows.
+
+        Args:
+            entities: The list of entities to serialize, defaults to all of
+                the dataset entities
+
+        Returns:
+            The serialized dataset rows mapping
+        """
+        return super().serialize(entities or schema.ENTITIES)
+
+    def streamDataset(self,
+                      entities: Iterable[datasets.Entity] = None
+                      ) -> datasets.DatasetStream:
+        """
+        Serializes the dataset rows lazily into a mapping of table streams.
+
+        Args:
+            entities: The list of entities to serialize, defaults to all of
+                the dataset entities
+
+        Returns:
+            The lazy mapping of the non-empty tables rows streams
+        """
+        return super().streamDataset(entities or schema.ENTITIES)
+
+
+class MemorySerializer(Serializer):
+    """
+    Dataset serializer reading the rows from an in-memory columnar dataset.
+
+    The raw rows are loaded once, on first use, and each serialization just
+    projects them with the serializer options, so many serializers with any
+    options and locales can share the same dataset, without querying the
+    database again. It can be pickled along with its dataset, to be shared
+    with other processes.
+    """
+
+    def __init__(self, dataset: datasets.ColumnarDataset = None, **options):
+        """
+        Setup the serializer.
+
+        Args:
+            dataset: The columnar dataset to serialize, defaults to a new
+                empty one
+            **options: The serialization options
+        """
+        super().__init__(**options)
+
+        self._dataset = dataset or datasets.ColumnarDataset()
+
+    @property
+    def dataset(self) -> datasets.ColumnarDataset:
+        """Gets the columnar dataset."""
+        return self._dataset
+
+    def stream(self,
+               entities: Iterable[datasets.Entity] = None
+               ) -> Iterator[datasets.TableStream]:
+        """
+        Serializes the in-memory dataset rows lazily, from the column values.
+
+        Args:
+            entities: The list of entities to serialize, defaults to all of
+                the dataset entities
+
+        Yields:
+            A rows stream of each non-empty table
+        """
+        for entity in entities or schema.ENTITIES:
+            if not self.hasRows(entity):
+                continue
+
+            columns = self.columnNames(entity)
+
+            yield datasets.TableStream(entity.__table__,
+                                       self.tableName(entity),
+                                       columns,
+                                       self._serializeColumns(
+                                           columns,
+                                           self._dataset.columns(entity)))
+
+    def load(self, entities: Iterable[datasets.Entity] = None):
+        """
+        Loads the given entities rows into memory.
+
+        Args:
+            entities: The list of entities to load, defaults to all of the
+                dataset entities
+        """
+        self._dataset.load(entities or schema.ENTITIES)
+
+    def hasRows(self, entity: datasets.Entity) -> bool:
+        """
+        Tells whether a given entity table has rows in memory or not.
+
+        Args:
+            entity: The entity class
+
+        Returns:
+            Whether the table has rows or not
+        """
+        return self._dataset.count(entity) > 0
+
+    def _fetchRows(self, entity: datasets.Entity) -> Iterator[tuple]:
+        """
+        Fetches the raw rows of a given entity table from memory.
+
+        Args:
+            entity: The entity to fetch
+
+        Returns:
+            The table rows iterator, with values in the table columns order
+        """
+        return self._dataset.rows(entity)
+
+    def _serializeColumns(self,
+                          columns: list,
+                          values: list) -> Iterator[types.OrderedMap]:
+        """
+        Serializes the given table column values into rows.
+
+        The values are coerced column by column, as they are consumed, so
+        each row is built straight from its already serialized values.
+
+        Args:
+            columns: The table column names
+            values: The values of each column, in the table columns order
+
+        Yields:
+            The serialized table rows
+        """
+        values = [map(str, column_values)
+                  if self._options.forceStr or column == 'name'
+                  else column_values
+                  for column, column_values in zip(columns, values)]
+
+        for row in zip(*values):
+            yield types.OrderedMap(zip(columns, row))
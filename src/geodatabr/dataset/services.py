@@ -11,20 +11,28 @@ This module provides the services that are used to create the dataset.
 
 # Built-in dependencies
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
 from urllib import parse
 
 # External dependencies
 
-import ratelimit
+import aiohttp
 import requests
-from requests import adapters, exceptions, models
+from requests import adapters, exceptions, models, structures
 from requests.packages.urllib3.util import retry
 
 # Package dependencies
 
 from geodatabr import __meta__
 from geodatabr.core import types
+from geodatabr.core.utils import io
 
 # Logging setup
 
@@ -36,11 +44,22 @@ HTTP_MAX_RETRIES = 5
 HTTP_BACKOFF_FACTOR = 0.5
 HTTP_RETRY_STATUSES = (500, 502, 503, 504)
 HTTP_THROTTLING_INTERVAL = 5
+HTTP_THROTTLING_BURST = 1
+HTTP_POOL_SIZE = 10
+HTTP_HOST_CONCURRENCY = 4
 HTTP_CONNECT_TIMEOUT = 3
 HTTP_READ_TIMEOUT = 5
+HTTP_CACHE_DIR = io.Path.CACHE_DIR / 'http'
+HTTP_CACHE_TTL = 7 * 24 * 60 * 60
+HTTP_CACHE_SIZE = 256 * 1024 * 1024
 
 # Constants
 
+CACHE_DEFAULT = 'default'
+CACHE_OFFLINE = 'offline'
+CACHE_REVALIDATE = 'revalidate'
+CACHE_TEMP_DIR = '.tmp'
+
 SIDRA_STATE = 3
 SIDRA_MESOREGION = 8
 SIDRA_MICROREGION = 9
@@ -48,11 +67,317 @@ SIDRA_MUNICIPALITY = 6
 SIDRA_DISTRICT = 10
 SIDRA_SUBDISTRICT = 11
 
+# Number of digits of the territory codes of each territorial level
+SIDRA_CODE_LENGTHS = {
+    SIDRA_STATE: 2,
+    SIDRA_MESOREGION: 4,
+    SIDRA_MICROREGION: 5,
+    SIDRA_MUNICIPALITY: 7,
+    SIDRA_DISTRICT: 9,
+    SIDRA_SUBDISTRICT: 11,
+}
+
+# Territorial levels whose codes are prefixed by their ancestor territory
+# codes. The microregion and municipality codes are not prefixed by their
+# direct parent codes, nor do the bulk responses link them to their parents,
+# so their parents are still crawled one by one.
+SIDRA_CODE_PREFIXES = {
+    SIDRA_MESOREGION: (SIDRA_STATE,),
+    SIDRA_MICROREGION: (SIDRA_STATE,),
+    SIDRA_MUNICIPALITY: (SIDRA_STATE,),
+    SIDRA_DISTRICT: (SIDRA_STATE, SIDRA_MUNICIPALITY),
+    SIDRA_SUBDISTRICT: (SIDRA_STATE, SIDRA_MUNICIPALITY, SIDRA_DISTRICT),
+}
+
 # Classes
 
 
+class RateLimiter(object):
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket is refilled continuously at the given rate until it reaches its
+    capacity, and each acquired call consumes one token from it.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Creates a new rate limiter instance.
+
+        Args:
+            rate: The number of calls allowed per second
+            capacity: The maximum number of calls allowed in a burst
+        """
+        self._lock = threading.Lock()
+        self._rate = None
+        self._capacity = None
+        self._tokens = 0.0
+        self._timestamp = time.monotonic()
+
+        self.configure(rate, capacity)
+
+    @property
+    def rate(self) -> float:
+        """Gets the number of calls allowed per second."""
+        return self._rate
+
+    @property
+    def capacity(self) -> int:
+        """Gets the maximum number of calls allowed in a burst."""
+        return self._capacity
+
+    def configure(self, rate: float = None, capacity: int = None):
+        """
+        Changes the rate limiter settings.
+
+        Args:
+            rate: The number of calls allowed per second
+            capacity: The maximum number of calls allowed in a burst
+
+        Raises:
+            ValueError: If the rate or the capacity is not a positive number
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError('The rate should be a positive number')
+
+        if capacity is not None and capacity < 1:
+            raise ValueError('The capacity should be a positive number')
+
+        with self._lock:
+            self._rate = float(rate or self._rate)
+            self._capacity = int(capacity or self._capacity or 1)
+            self._tokens = float(self._capacity)
+            self._timestamp = time.monotonic()
+
+    def _consume(self) -> float:
+        """
+        Tries to consume a token from the bucket.
+
+        Returns:
+            Zero if a token was consumed, or else the time in seconds to wait
+            until the next token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity,
+                               self._tokens
+                               + (now - self._timestamp) * self._rate)
+            self._timestamp = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+
+                return 0
+
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self):
+        """Blocks the calling thread until a call is allowed."""
+        delay = self._consume()
+
+        while delay:
+            time.sleep(delay)
+            delay = self._consume()
+
+    async def acquireAsync(self):
+        """Suspends the calling coroutine until a call is allowed."""
+        delay = self._consume()
+
+        while delay:
+            await asyncio.sleep(delay)
+            delay = self._consume()
+
+
+class ResponseCache(object):
+    """
+    Persistent HTTP response cache.
+
+    Each response body is stored on its own file, keyed by the request URL and
+    params. Entries older than the TTL are revalidated before being reused, and
+    the least recently used entries are evicted once the cache grows over its
+    size limit.
+
+    The cache supports the following modes:
+        default: Reuses fresh entries and revalidates stale ones
+        offline: Reuses any entry and never hits the network
+        revalidate: Revalidates every entry before reusing it
+    """
+
+    def __init__(self,
+                 directory: str,
+                 ttl: int = HTTP_CACHE_TTL,
+                 max_size: int = HTTP_CACHE_SIZE,
+                 mode: str = CACHE_DEFAULT):
+        """
+        Creates a new response cache instance.
+
+        Args:
+            directory: The cache directory
+            ttl: The time in seconds while an entry is fresh
+            max_size: The maximum cache size in bytes
+            mode: The cache mode
+        """
+        self._lock = threading.Lock()
+        self._size = None
+        self.directory = io.Directory(directory)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.mode = mode
+
+    @property
+    def offline(self) -> bool:
+        """Tells whether the cache is in offline mode or not."""
+        return self.mode == CACHE_OFFLINE
+
+    @property
+    def revalidate(self) -> bool:
+        """Tells whether the cache is in revalidate mode or not."""
+        return self.mode == CACHE_REVALIDATE
+
+    @staticmethod
+    def key(url: str, params: dict = None) -> str:
+        """
+        Computes the cache key of a given request.
+
+        Args:
+            url: The request URL
+            params: The request query params
+
+        Returns:
+            The cache key
+        """
+        query = parse.urlencode(sorted((params or {}).items()))
+
+        return hashlib.sha1('{}?{}'.format(url, query).encode()).hexdigest()
+
+    def get(self, url: str, params: dict = None) -> types.Map:
+        """
+        Retrieves a cached response.
+
+        Args:
+            url: The request URL
+            params: The request query params
+
+        Returns:
+            The cached response entry, with its body, headers and freshness,
+            or None if the response is not cached
+        """
+        cache_file = io.File(self.directory / self.key(url, params))
+
+        try:
+            with cache_file.open('rb') as cache_data:
+                metadata = json.loads(cache_data.readline().decode())
+                body = cache_data.read()
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            try:
+                os.utime(str(cache_file))
+            except OSError:
+                # The entry was evicted meanwhile
+                return None
+
+        return types.Map(body=body,
+                         headers=metadata['headers'],
+                         fresh=(not self.revalidate
+                                and metadata['timestamp'] + self.ttl
+                                > time.time()))
+
+    def set(self, url: str, params: dict, body: bytes, headers: dict):
+        """
+        Stores a response into the cache.
+
+        Args:
+            url: The request URL
+            params: The request query params
+            body: The response body
+            headers: The response headers
+        """
+        metadata = dict(url=url,
+                        params=params,
+                        timestamp=time.time(),
+                        headers={name: headers[name]
+                                 for name in ('Content-Type',
+                                              'ETag',
+                                              'Last-Modified')
+                                 if name in headers})
+        data = json.dumps(metadata).encode() + b'\n' + body
+        cache_file = self.directory / self.key(url, params)
+
+        # Unfinished entries are written apart, so they are neither counted
+        # nor evicted before they are moved into place
+        temp_dir = io.Directory(self.directory / CACHE_TEMP_DIR)
+        temp_dir.create(parents=True)
+
+        with tempfile.NamedTemporaryFile(dir=str(temp_dir),
+                                         delete=False) as temp_file:
+            temp_file.write(data)
+
+        with self._lock:
+            if self._size is not None and cache_file.exists():
+                self._size -= cache_file.stat().st_size
+
+            os.replace(temp_file.name, str(cache_file))
+
+            if self._size is not None:
+                self._size += len(data)
+
+        self.evict()
+
+    def touch(self, url: str, params: dict = None):
+        """
+        Marks a cached response as fresh again, after revalidating it.
+
+        Args:
+            url: The request URL
+            params: The request query params
+        """
+        entry = self.get(url, params)
+
+        if entry is not None:
+            self.set(url, params, entry.body, entry.headers)
+
+    def evict(self):
+        """Removes the least recently used entries exceeding the size limit."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(cache_file.size
+                                 for cache_file in self.directory.files())
+
+            if self._size <= self.max_size:
+                return
+
+            for cache_file in sorted(self.directory.files(),
+                                     key=lambda cache_file: cache_file.mtime):
+                if self._size <= self.max_size:
+                    break
+
+                self._size -= cache_file.size
+                cache_file.unlink()
+
+    def clear(self):
+        """Removes all cached responses."""
+        with self._lock:
+            for cache_file in self.directory.files():
+                cache_file.unlink()
+
+            self._size = 0
+
+
 class HttpSession(requests.Session):
-    """Custom HTTP session implementation."""
+    """
+    Custom HTTP session implementation.
+
+    Attributes:
+        limiter (geodatabr.dataset.services.RateLimiter):
+            The rate limiter shared by all HTTP sessions
+        cache (geodatabr.dataset.services.ResponseCache):
+            The response cache shared by all HTTP sessions
+    """
+
+    limiter = RateLimiter(1 / HTTP_THROTTLING_INTERVAL, HTTP_THROTTLING_BURST)
+    cache = ResponseCache(HTTP_CACHE_DIR)
 
     def __init__(self, base_url: str, *args, **kwargs):
         """
@@ -76,15 +401,14 @@ class HttpSession(requests.Session):
         # Automatic retries
         for protocol in ('http://', 'https://'):
             self.mount(protocol, adapters.HTTPAdapter(
+                pool_maxsize=HTTP_POOL_SIZE,
                 max_retries=retry.Retry(total=HTTP_MAX_RETRIES,
                                         backoff_factor=HTTP_BACKOFF_FACTOR,
                                         status_forcelist=HTTP_RETRY_STATUSES)))
 
-    @ratelimit.sleep_and_retry
-    @ratelimit.limits(calls=1, period=HTTP_THROTTLING_INTERVAL)
     def request(self, method: str, url: str, **kwargs) -> models.Response:
         """
-        HTTP throttled requests with custom timeouts.
+        HTTP throttled and cached requests with custom timeouts.
 
         Args:
             method: The HTTP method for this request
@@ -93,18 +417,259 @@ class HttpSession(requests.Session):
 
         Returns:
             The HTTP response object
+
+        Raises:
+            geodatabr.dataset.services.CacheMissError:
+                If the response is not cached while in offline mode
         """
         if kwargs.get('timeout') is None:
             kwargs.update(timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
 
-        response = super().request(method,
-                                   parse.urljoin(self._base_url, url),
-                                   **kwargs)
+        url = parse.urljoin(self._base_url, url)
+        params = kwargs.get('params')
+        entry = None
+
+        if method.upper() == 'GET':
+            entry = self.cache.get(url, params)
+
+            if entry is not None and (entry.fresh or self.cache.offline):
+                return self._cachedResponse(url, entry)
+
+            if self.cache.offline:
+                raise CacheMissError('Response not cached: ' + url)
+
+            if entry is not None:
+                kwargs['headers'] = dict(kwargs.get('headers') or {},
+                                         **self._validators(entry))
+
+        self.limiter.acquire()
+
+        response = super().request(method, url, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            self.cache.touch(url, params)
+
+            return self._cachedResponse(url, entry)
+
         response.raise_for_status()
 
+        if method.upper() == 'GET':
+            self.cache.set(url, params, response.content, response.headers)
+
+        return response
+
+    @staticmethod
+    def _validators(entry: types.Map) -> dict:
+        """
+        Builds the conditional request headers to revalidate a cache entry.
+
+        Args:
+            entry: The cached response entry
+
+        Returns:
+            The conditional request headers
+        """
+        headers = {}
+
+        if 'ETag' in entry.headers:
+            headers['If-None-Match'] = entry.headers['ETag']
+
+        if 'Last-Modified' in entry.headers:
+            headers['If-Modified-Since'] = entry.headers['Last-Modified']
+
+        return headers
+
+    @staticmethod
+    def _cachedResponse(url: str, entry: types.Map) -> models.Response:
+        """
+        Builds a HTTP response object from a cached response entry.
+
+        Args:
+            url: The request URL
+            entry: The cached response entry
+
+        Returns:
+            The HTTP response object
+        """
+        response = models.Response()
+        response.url = url
+        response.status_code = 200
+        response.headers = structures.CaseInsensitiveDict(entry.headers)
+        response._content = entry.body  # pylint: disable=protected-access
+
         return response
 
 
+class AsyncHttpSession(object):
+    """
+    Asynchronous HTTP session implementation.
+
+    Connections are kept alive and pooled by host, and the HTTP requests share
+    the same rate limiter of the blocking HTTP sessions.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 limit_per_host: int = HTTP_HOST_CONCURRENCY):
+        """
+        Creates a new asynchronous HTTP session instance.
+
+        Args:
+            base_url: The base URL for this HTTP session
+            limit_per_host: The maximum number of concurrent connections to
+                the same host
+        """
+        self._base_url = base_url
+        self._limit_per_host = limit_per_host
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncHttpSession':
+        """
+        Opens the HTTP session when entering an asynchronous context.
+
+        Returns:
+            This HTTP session instance
+        """
+        await self.open()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Closes the HTTP session when leaving an asynchronous context."""
+        await self.close()
+
+    async def open(self):
+        """Opens the HTTP session connection pool."""
+        if self._session is not None:
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=self._limit_per_host),
+            headers={
+                'User-Agent': 'geodatabr/{version} ({url})'
+                              .format(version=__meta__.__version__,
+                                      url=__meta__.__url__),
+            },
+            timeout=aiohttp.ClientTimeout(sock_connect=HTTP_CONNECT_TIMEOUT,
+                                          sock_read=HTTP_READ_TIMEOUT))
+
+    async def close(self):
+        """Closes the HTTP session connection pool."""
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+
+    async def request(self, method: str, url: str, **kwargs) -> bytes:
+        """
+        HTTP throttled and cached requests with automatic retries.
+
+        Failed requests are retried with the same exponential backoff used by
+        the blocking HTTP sessions. The response cache is read and written
+        from the default executor, so its disk I/O does not block the event
+        loop.
+
+        Args:
+            method: The HTTP method for this request
+            url: The target URL of this request
+            **kwargs: The optional request keyword arguments
+
+        Returns:
+            The HTTP response body
+
+        Raises:
+            aiohttp.ClientError: If the request fails after all retries
+            asyncio.TimeoutError: If the request times out after all retries
+            geodatabr.dataset.services.CacheMissError:
+                If the response is not cached while in offline mode
+        """
+        url = parse.urljoin(self._base_url, url)
+        params = kwargs.get('params')
+        cache = HttpSession.cache
+        entry = None
+        retries = 0
+
+        if method.upper() == 'GET':
+            entry = await self._run(cache.get, url, params)
+
+            if entry is not None and (entry.fresh or cache.offline):
+                return entry.body
+
+            if cache.offline:
+                raise CacheMissError('Response not cached: ' + url)
+
+            if entry is not None:
+                kwargs['headers'] = dict(kwargs.get('headers') or {},
+                                         **HttpSession._validators(entry))
+
+        await self.open()
+
+        while True:
+            await HttpSession.limiter.acquireAsync()
+
+            try:
+                async with self._session.request(method, url, **kwargs) \
+                        as response:
+                    if entry is not None and response.status == 304:
+                        await self._run(cache.touch, url, params)
+
+                        return entry.body
+
+                    if (response.status not in HTTP_RETRY_STATUSES
+                            or retries >= HTTP_MAX_RETRIES):
+                        response.raise_for_status()
+                        body = await response.read()
+
+                        if method.upper() == 'GET':
+                            await self._run(cache.set,
+                                            url,
+                                            params,
+                                            body,
+                                            response.headers)
+
+                        return body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if retries >= HTTP_MAX_RETRIES:
+                    raise
+
+            retries += 1
+
+            # Same backoff formula of urllib3's Retry class
+            if retries > 1:
+                await asyncio.sleep(HTTP_BACKOFF_FACTOR * 2 ** (retries - 1))
+
+    @staticmethod
+    async def _run(function, *args):
+        """
+        Runs a blocking function into the event loop default executor.
+
+        Args:
+            function: The blocking function to run
+            *args: The function positional arguments
+
+        Returns:
+            The function result
+        """
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(None, function, *args)
+
+    async def get(self, url: str, **kwargs) -> bytes:
+        """
+        Sends an asynchronous GET request.
+
+        Args:
+            url: The target URL of this request
+            **kwargs: The optional request keyword arguments
+
+        Returns:
+            The HTTP response body
+        """
+        return await self.request('GET', url, **kwargs)
+
+
 class SidraApi(object):
     """Main service to query the SIDRA API."""
 
@@ -125,6 +690,47 @@ class SidraApi(object):
         return SidraApiResponse(self._session.get('/values' + params).json())
 
 
+class AsyncSidraApi(object):
+    """Asynchronous service to query the SIDRA API."""
+
+    def __init__(self, base_url: str = 'http://api.sidra.ibge.gov.br'):
+        """
+        Creates a new AsyncSidraApi instance.
+
+        Args:
+            base_url: The SIDRA API base URL
+        """
+        self._session = AsyncHttpSession(base_url)
+
+    async def __aenter__(self) -> 'AsyncSidraApi':
+        """
+        Opens the service HTTP session when entering an asynchronous context.
+
+        Returns:
+            This service instance
+        """
+        await self._session.open()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Closes the service HTTP session when leaving the context."""
+        await self._session.close()
+
+    async def query(self, params: str) -> 'SidraApiResponse':
+        """
+        Runs a query over the API.
+
+        Args:
+            params: The query params
+
+        Returns:
+            The SidraApiResponse instance
+        """
+        return SidraApiResponse(
+            json.loads((await self._session.get('/values' + params)).decode()))
+
+
 class SidraApiResponse(object):
     """Response object returned by SidraApi service."""
 
@@ -170,11 +776,30 @@ class SidraApiResponse(object):
 
 
 class SidraDataset(object):
-    """Main service to query the SIDRA database of geographic territories."""
+    """
+    Main service to query the SIDRA database of geographic territories.
 
-    def __init__(self):
-        """Creates a new SidraDataset instance."""
-        self._session = HttpSession('https://sidra.ibge.gov.br')
+    Each thread sends its requests through its own HTTP session, so the
+    service can be shared by concurrent threads.
+    """
+
+    def __init__(self, base_url: str = 'https://sidra.ibge.gov.br'):
+        """
+        Creates a new SidraDataset instance.
+
+        Args:
+            base_url: The SIDRA database base URL
+        """
+        self._base_url = base_url
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> HttpSession:
+        """Gets the HTTP session of the calling thread."""
+        if not hasattr(self._local, 'session'):
+            self._local.session = HttpSession(self._base_url)
+
+        return self._local.session
 
     def findAll(self, level: int) -> 'SidraDatasetResponse':
         """
@@ -191,7 +816,7 @@ class SidraDataset(object):
                 .get('/Territorio/Unidades', params={'nivel': level}) \
                 .json()
         except exceptions.RequestException:
-            records = {}
+            records = None
 
         return SidraDatasetResponse(records)
 
@@ -218,22 +843,175 @@ class SidraDataset(object):
                              'unidade': parent_id}) \
                 .json()
         except exceptions.RequestException:
-            records = {}
+            records = None
+
+        return SidraDatasetResponse(records)
+
+    @staticmethod
+    def parentCode(code: int, level: int, parent_level: int) -> int:
+        """
+        Derives the parent territory code from a given territory code.
+
+        Args:
+            code: The territory code
+            level: The territory territorial level
+            parent_level: The parent territorial level
+
+        Returns:
+            The parent territory code, or None when the territory code of the
+            given territorial level is not prefixed by the parent code
+        """
+        if level == parent_level:
+            return code
+
+        if parent_level not in SIDRA_CODE_PREFIXES.get(level, ()):
+            return None
+
+        return code // 10 ** (SIDRA_CODE_LENGTHS[level]
+                              - SIDRA_CODE_LENGTHS[parent_level])
+
+
+class AsyncSidraDataset(object):
+    """
+    Asynchronous service to query the SIDRA database of geographic territories.
+    """
+
+    def __init__(self,
+                 base_url: str = 'https://sidra.ibge.gov.br',
+                 limit_per_host: int = HTTP_HOST_CONCURRENCY):
+        """
+        Creates a new AsyncSidraDataset instance.
+
+        Args:
+            base_url: The SIDRA database base URL
+            limit_per_host: The maximum number of concurrent requests
+        """
+        self._session = AsyncHttpSession(base_url, limit_per_host)
+        self._limit_per_host = limit_per_host
+
+    async def __aenter__(self) -> 'AsyncSidraDataset':
+        """
+        Opens the service HTTP session when entering an asynchronous context.
+
+        Returns:
+            This service instance
+        """
+        await self._session.open()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Closes the service HTTP session when leaving the context."""
+        await self._session.close()
+
+    async def _query(self, url: str, params: dict) -> 'SidraDatasetResponse':
+        """
+        Queries the SIDRA database.
+
+        Args:
+            url: The query URL
+            params: The query params
+
+        Returns:
+            The list of geographic territories
+        """
+        try:
+            records = json.loads(
+                (await self._session.get(url, params=params)).decode())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            records = None
 
         return SidraDatasetResponse(records)
 
+    async def findAll(self, level: int) -> 'SidraDatasetResponse':
+        """
+        Finds all geographic territories for a given territorial level.
+
+        Args:
+            level: The territorial level constant
+
+        Returns:
+            The list of geographic territories
+        """
+        return await self._query('/Territorio/Unidades', {'nivel': level})
+
+    async def findChildren(self,
+                           child_level: int,
+                           parent_level: int,
+                           parent_id: int) -> 'SidraDatasetResponse':
+        """
+        Finds all geographic territories belonging to a parent territory.
+
+        Args:
+            child_level: The children territorial level
+            parent_level: The parent territorial level
+            parent_id: The parent territory ID
+
+        Returns:
+            The list of geographic territories
+        """
+        return await self._query('/Territorio/UnidadesAbrangidas',
+                                 {'abrangido': child_level,
+                                  'abrangente': parent_level,
+                                  'unidade': parent_id})
+
+    async def findChildrenMany(self,
+                               child_level: int,
+                               parent_level: int,
+                               parent_ids: list) -> list:
+        """
+        Finds all geographic territories belonging to many parent territories.
+
+        The requests are sent by a fixed pool of worker tasks, as many as the
+        concurrent requests limit, so just as many requests wait for the HTTP
+        rate limiter and hold connections at a time.
+
+        Args:
+            child_level: The children territorial level
+            parent_level: The parent territorial level
+            parent_ids: The parent territories IDs
+
+        Returns:
+            The lists of geographic territories, in the parent IDs order
+        """
+        children = [None] * len(parent_ids)
+        pending = iter(enumerate(parent_ids))
+
+        async def worker():
+            for index, parent_id in pending:
+                children[index] = await self.findChildren(child_level,
+                                                          parent_level,
+                                                          parent_id)
+
+        await asyncio.gather(*[worker()
+                               for _ in range(min(self._limit_per_host,
+                                                  len(parent_ids)))])
+
+        return children
+
 
 class SidraDatasetResponse(list):
-    """Response object returned by SidraDataset service."""
+    """
+    Response object returned by SidraDataset service.
 
-    def __init__(self, data: dict):
+    Attributes:
+        failed (bool): Whether the request has failed or not
+    """
+
+    def __init__(self, data: dict = None):
         """
         Creates a new instance.
 
         Args:
-            data: The API JSON response
+            data: The API JSON response, or None if the request has failed
         """
         super().__init__([
             types.Map(id=_id, name=name)
-            for (_id, name) in zip(data['Codigos'], data['Nomes'])
+            for (_id, name) in zip((data or {}).get('Codigos', []),
+                                   (data or {}).get('Nomes', []))
         ])
+        self.failed = data is None
+
+
+class CacheMissError(Exception):
+    """Exception class raised when an offline request is not cached."""
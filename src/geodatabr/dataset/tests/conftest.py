@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset testing fixtures module."""
+# pylint: disable=redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import json
+import pathlib
+import threading
+from http import server
+from urllib import parse
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.dataset import indexes, schema, services
+
+# Constants
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / 'fixtures'
+
+# Classes
+
+
+class SidraStubHandler(server.BaseHTTPRequestHandler):
+    """Stub SIDRA request handler replaying recorded responses."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Replays a recorded /Territorio/UnidadesAbrangidas response."""
+        stub = self.server
+        url = parse.urlsplit(self.path)
+        query = parse.urlencode(sorted(
+            parse.parse_qsl(url.query),
+            key=lambda param: ['abrangido', 'abrangente', 'unidade']
+            .index(param[0])))
+
+        with stub.lock:
+            stub.connections.add(self.client_address)
+            stub.requests.append(query)
+            failing = stub.failures > 0
+            stub.failures -= 1
+
+        if failing:
+            self.reply(503, b'')
+        elif (url.path == '/Territorio/UnidadesAbrangidas'
+              and query in stub.responses):
+            self.reply(200, json.dumps(stub.responses[query]).encode())
+        else:
+            self.reply(404, b'')
+
+    def reply(self, status: int, body: bytes):
+        """
+        Sends a response.
+
+        Args:
+            status: The response status code
+            body: The response body
+        """
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Silences the request logging."""
+
+
+# Functions
+
+
+@pytest.fixture
+def territory_index():
+    """Builds a territory index with a few territories of each entity."""
+    return indexes.TerritoryIndex({
+        schema.State: [(11, 'Rondônia'), (35, 'São Paulo')],
+        schema.Mesoregion: [(1101, 11, 'Madeira-Guaporé'),
+                            (3501, 35, 'São José do Rio Preto')],
+        schema.Microregion: [(11001, 1101, 11, 'Porto Velho'),
+                             (35002, 3501, 35, 'Jales')],
+        schema.Municipality: [(1100015, 11001, 1101, 11,
+                               "Alta Floresta D'Oeste"),
+                              (1100205, 11001, 1101, 11, 'Porto Velho'),
+                              (3515202, 35002, 3501, 35, "Estrela d'Oeste"),
+                              (3524808, 35002, 3501, 35, 'Jales'),
+                              (3550308, 35002, 3501, 35, 'São Paulo')],
+        schema.District: [(110020505, 1100205, 11001, 1101, 11,
+                           'Porto Velho')],
+        schema.Subdistrict: [(11002050506, 110020505, 1100205, 11001, 1101,
+                              11, 'Zona 01'),
+                             (11002050507, 110020505, 1100205, 11001, 1101,
+                              11, 'Zona 02')],
+    })
+
+
+@pytest.fixture
+def sidra_stub(monkeypatch, tmp_path):
+    """Serves the recorded SIDRA responses from a local HTTP server."""
+    stub = server.ThreadingHTTPServer(('127.0.0.1', 0), SidraStubHandler)
+    stub.daemon_threads = True
+    stub.lock = threading.Lock()
+    stub.connections = set()
+    stub.requests = []
+    stub.failures = 0
+    stub.responses = json.loads(
+        (FIXTURES_DIR / 'UnidadesAbrangidas.json').read_text('utf-8'))
+    stub.url = 'http://127.0.0.1:{}'.format(stub.server_address[1])
+
+    monkeypatch.setattr(services.HttpSession, 'limiter',
+                        services.RateLimiter(1000, 100))
+    monkeypatch.setattr(services.HttpSession, 'cache',
+                        services.ResponseCache(str(tmp_path)))
+    monkeypatch.setattr(services, 'HTTP_BACKOFF_FACTOR', 0.01)
+
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+
+    yield stub
+
+    stub.shutdown()
+    stub.server_close()
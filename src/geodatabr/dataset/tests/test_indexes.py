@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset indexes testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Package dependencies
+
+from geodatabr.dataset import schema
+
+# Classes
+
+
+class TestTerritoryIndex(object):
+    """Tests TerritoryIndex class methods."""
+
+    def testFindById(self, territory_index):
+        """Tests if TerritoryIndex.findById() works as expected."""
+        municipality = territory_index.findById(schema.Municipality, 3524808)
+
+        assert municipality == dict(id=3524808,
+                                    microregion_id=35002,
+                                    mesoregion_id=3501,
+                                    state_id=35,
+                                    name='Jales')
+        assert municipality.name == 'Jales'
+        assert territory_index.findById(schema.Municipality, 3500000) is None
+
+    def testFindByName(self, territory_index):
+        """Tests if TerritoryIndex.findByName() works as expected."""
+        assert [municipality.id for municipality in territory_index
+                .findByName(schema.Municipality, 'ESTRELA DOESTE')] \
+            == [3515202]
+        assert [state.id for state in territory_index
+                .findByName(schema.State, 'sao paulo')] == [35]
+        assert territory_index.findByName(schema.State, 'Paulo') == []
+
+    def testFindAncestors(self, territory_index):
+        """Tests if TerritoryIndex.findAncestors() works as expected."""
+        ancestors = territory_index.findAncestors(schema.Subdistrict,
+                                                  11002050507)
+
+        assert list(ancestors) == list(schema.ENTITIES[:-1])
+        assert [ancestor.id for ancestor in ancestors.values()] \
+            == [11, 1101, 11001, 1100205, 110020505]
+
+    def testFindDescendants(self, territory_index):
+        """Tests if TerritoryIndex.findDescendants() works as expected."""
+        assert [municipality.id for municipality in territory_index
+                .findDescendants(schema.State, 35, schema.Municipality)] \
+            == [3515202, 3524808, 3550308]
+        assert [subdistrict.id for subdistrict in territory_index
+                .findDescendants(schema.Mesoregion, 1101,
+                                 schema.Subdistrict)] \
+            == [11002050506, 11002050507]
+        assert territory_index.findDescendants(schema.Subdistrict,
+                                               11002050506,
+                                               schema.State) == []
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset repositories testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import os
+import random
+import time
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import datasets
+from geodatabr.dataset import repositories, schema
+
+# Constants
+
+SYLLABLES = ('ba', 'ca', 'do', 'es', 'gua', 'ja', 'le', 'ma', 'ni', 'no',
+             'pa', 'po', 'ra', 're', 'ri', 'sa', 'ta', 'to', 'va', 'xi')
+
+# Functions
+
+
+@pytest.fixture(params=['numpy', 'array'])
+def repository(request, engine, monkeypatch):
+    """Builds a microregion repository over an in-memory database."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(datasets, 'numpy', None)
+
+    engine.execute(schema.Microregion.__table__.insert(),
+                   [dict(id=35002, mesoregion_id=3501, state_id=35,
+                         name='Jales'),
+                    dict(id=11001, mesoregion_id=1101, state_id=11,
+                         name='Porto Velho')])
+    repositories.MicroregionRepository._resolutionTable.cache_clear()
+    yield repositories.MicroregionRepository
+    repositories.MicroregionRepository._resolutionTable.cache_clear()
+
+
+@pytest.fixture
+def similarity(engine):
+    """Clears the municipality repository similarity caches."""
+    repository = repositories.MunicipalityRepository
+    repository._similarityIndex.cache_clear()
+    repository._findSimilar.cache_clear()
+    yield repository
+    repository._similarityIndex.cache_clear()
+    repository._findSimilar.cache_clear()
+
+
+def misspell(name: str, generator: random.Random) -> str:
+    """
+    Replaces a random character of a given name.
+
+    Args:
+        name: The name to misspell
+        generator: The random numbers generator
+
+    Returns:
+        The misspelled name
+    """
+    position = generator.randrange(len(name))
+
+    return name[:position] + generator.choice('aeiou') + name[position + 1:]
+
+
+# Classes
+
+
+class TestRepository(object):
+    """Tests Repository class methods."""
+
+    def testAddMany(self, engine, monkeypatch):
+        """Tests if Repository.addMany() inserts the rows in batches."""
+        repository = repositories.StateRepository
+        execute = repository.db.execute
+        batches = []
+
+        def execute_batch(statement, params=None):
+            batches.append(len(params))
+
+            return execute(statement, params)
+
+        monkeypatch.setattr(datasets, 'BULK_INSERT_SIZE', 2)
+        monkeypatch.setattr(repository.db, 'execute', execute_batch)
+        repository.addMany(dict(id=_id, name=str(_id))
+                           for _id in range(11, 16))
+
+        assert batches == [2, 2, 1]
+        assert [state.id for state in repository.findAll()] \
+            == list(range(11, 16))
+
+        batches.clear()
+        repository.addMany([dict(id=_id, name=str(_id))
+                            for _id in range(16, 18)])
+        repository.addMany(iter([]))
+        repository.addMany([])
+
+        assert batches == [2]
+        assert repository.count() == 7
+
+    def testResolveMany(self, repository):
+        """Tests if Repository.resolveMany() works as expected."""
+        resolved = repository.resolveMany([35002, 1, 11001, 35002])
+
+        assert list(resolved) == ['mesoregion_id', 'state_id', 'name']
+        assert list(resolved.name) == ['Jales', None, 'Porto Velho', 'Jales']
+        assert list(resolved.mesoregion_id) == [3501, 0, 1101, 3501]
+        assert list(resolved.state_id) == [35, 0, 11, 35]
+        assert list(repository.resolveMany(iter([99999])).name) == [None]
+        assert list(repository.resolveMany([]).name) == []
+
+    def testFindSimilar(self, similarity, monkeypatch):
+        """Tests if Repository.findSimilar() works as expected."""
+        similarity.addMany([
+            dict(id=3515202, microregion_id=35002, mesoregion_id=3501,
+                 state_id=35, name="Estrela d'Oeste"),
+            dict(id=3524808, microregion_id=35002, mesoregion_id=3501,
+                 state_id=35, name='Jales'),
+            dict(id=3550308, microregion_id=35002, mesoregion_id=3501,
+                 state_id=35, name='São Paulo')])
+        matches = similarity.findSimilar('SAO PAOLO')
+
+        assert matches == [dict(id=3550308, name='São Paulo', distance=1)]
+        assert similarity.findSimilar('Estrela Doest', 1)[0].id == 3515202
+        assert similarity.findSimilar('jales', limit=0) == []
+        assert similarity.findSimilar('curitiba') == []
+
+        # The index and the results are cached, so the database is not hit
+        # again, and the returned results can be changed safely
+        monkeypatch.setattr(similarity, 'db', None)
+        matches[0].name = 'Changed'
+        hits = similarity._findSimilar.cache_info().hits
+
+        assert similarity.findSimilar('São Paolo') \
+            == [dict(id=3550308, name='São Paulo', distance=1)]
+        assert similarity._findSimilar.cache_info().hits == hits + 1
+
+    @pytest.mark.skipif(not os.environ.get('GEODATABR_BENCHMARK'),
+                        reason='Set GEODATABR_BENCHMARK to run benchmarks')
+    def testFindSimilarBenchmark(self, similarity):
+        """Benchmarks matching a batch of names with typos."""
+        generator = random.Random(0)
+        names = {''.join(generator.choice(SYLLABLES)
+                         for _ in range(generator.randint(3, 6)))
+                 for _ in range(6000)}
+        names = sorted(names)[:5570]
+        similarity.addMany(dict(id=_id, microregion_id=0, mesoregion_id=0,
+                                state_id=0, name=name)
+                           for _id, name in enumerate(names, 1))
+
+        # User inputs repeat, with and without typos
+        inputs = names + [misspell(name, generator) for name in names]
+        batch = [generator.choice(inputs) for _ in range(100000)]
+        started = time.perf_counter()
+        matched = sum(bool(similarity.findSimilar(name, 1, 1))
+                      for name in batch)
+        elapsed = time.perf_counter() - started
+
+        print('Matched {} of {} names in {:.2f}s ({:.0f} names/s)'
+              .format(matched, len(batch), elapsed, len(batch) / elapsed))
+
+        assert matched == len(batch)
+        assert elapsed < 60
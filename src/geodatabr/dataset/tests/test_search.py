@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset search testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.dataset import schema, search
+
+# Functions
+
+
+@pytest.fixture
+def territory_search(territory_index):
+    """Builds a territory search over a few territories."""
+    return search.TerritorySearch(territory_index)
+
+
+# Classes
+
+
+class TestTerritorySearch(object):
+    """Tests TerritorySearch class methods."""
+
+    def testSearch(self, territory_search):
+        """Tests if TerritorySearch.search() works as expected."""
+        results = territory_search.search('SAO PAULO')
+
+        assert [(result.entity, result.territory.id, result.match)
+                for result in results] \
+            == [(schema.State, 35, search.MATCH_EXACT),
+                (schema.Municipality, 3550308, search.MATCH_EXACT)]
+        assert [result.territory.id
+                for result in territory_search.search('sao')] \
+            == [35, 3501, 3550308]
+        assert territory_search.search(' ') == []
+
+    def testSearchWords(self, territory_search):
+        """Tests if TerritorySearch.search() matches words as expected."""
+        results = territory_search.search("d'oest")
+
+        assert [(result.territory.id, result.match) for result in results] \
+            == [(3515202, search.MATCH_WORD_PREFIX),
+                (1100015, search.MATCH_WORD_PREFIX)]
+        assert [result.match for result in territory_search.search('Velho')] \
+            == [search.MATCH_WORD] * 3
+
+    def testSearchScope(self, territory_search):
+        """Tests if TerritorySearch.search() scopes results as expected."""
+        assert [result.territory.id
+                for result in territory_search.search(
+                    'doeste', entities=[schema.Municipality], state=35)] \
+            == [3515202]
+        assert [result.territory.id
+                for result in territory_search.search(
+                    'p', entities=[schema.State, schema.Microregion])] \
+            == [11001, 35]
+        assert len(territory_search.search('r', limit=2)) == 2
+
+    def testSearchCopies(self, territory_search):
+        """Tests if TerritorySearch.search() results can be changed safely."""
+        results = territory_search.search('jales')
+        results[0].territory.name = 'Changed'
+        results.clear()
+
+        assert [result.territory.name
+                for result in territory_search.search('jales')] \
+            == ['Jales', 'Jales']
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset seeders testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import functools
+import threading
+import time
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import datasets, types
+from geodatabr.dataset import repositories, seeders, services
+
+# Classes
+
+
+class FakeSidraDataset(object):
+    """Fake SIDRA service replying with the given territory codes."""
+
+    def __init__(self, territories: list, children: dict):
+        """
+        Creates a new fake SIDRA service.
+
+        Args:
+            territories: The codes of the whole territorial level, or None if
+                its request fails
+            children: The children codes of each parent code, None if its
+                request fails, or an exception to raise
+        """
+        self.territories = territories
+        self.children = children
+        self.findAllCalls = []
+        self.findChildrenCalls = []
+
+    @staticmethod
+    def _response(codes: list) -> services.SidraDatasetResponse:
+        """
+        Builds a SIDRA response with the given territory codes.
+
+        Args:
+            codes: The territory codes, or None if the request fails
+
+        Returns:
+            The SIDRA response
+        """
+        if codes is None:
+            return services.SidraDatasetResponse()
+
+        return services.SidraDatasetResponse(
+            dict(Codigos=codes, Nomes=[str(code) for code in codes]))
+
+    def findAll(self, level: int) -> services.SidraDatasetResponse:
+        """Finds the fake territories of the whole territorial level."""
+        self.findAllCalls.append(level)
+
+        return self._response(self.territories)
+
+    def findChildren(self,
+                     child_level: int,
+                     parent_level: int,
+                     parent_id: int) -> services.SidraDatasetResponse:
+        """Finds the fake children territories of a given parent."""
+        self.findChildrenCalls.append(parent_id)
+        children = self.children.get(parent_id, [])
+
+        if isinstance(children, BaseException):
+            raise children
+
+        return self._response(children)
+
+
+# Functions
+
+
+@pytest.fixture
+def database(states, monkeypatch):
+    """Binds the seeders to an in-memory database with a few states."""
+    session = repositories.StateRepository.db
+
+    monkeypatch.setattr(seeders.Seeder, 'db', types.Map(
+        session=lambda: session,
+        transaction=datasets.Database.transaction))
+    monkeypatch.setattr(seeders.Seeder, 'strategy', 'crawl')
+
+    return session
+
+
+class TestSeeder(object):
+    """Tests Seeder class methods."""
+
+    def testCrawl(self, monkeypatch):
+        """Tests if Seeder.crawl() keeps the parents order across threads."""
+        class SidraDataset(object):
+            """Fake SIDRA service answering the first parents last."""
+
+            def __init__(self):
+                """Creates a new fake SIDRA service."""
+                self.threads = set()
+
+            def findChildren(self, child_level, parent_level, parent_id):
+                """Finds the fake children of a given parent."""
+                self.threads.add(threading.get_ident())
+                time.sleep(0.01 * (8 - parent_id))
+
+                return [types.Map(id=parent_id * 10)]
+
+        sidra = SidraDataset()
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+        monkeypatch.setattr(seeders.Seeder, 'workers', 4)
+
+        parents = [types.Map(id=_id) for _id in range(8)]
+        crawled = list(seeders.Seeder.crawl(parents,
+                                            services.SIDRA_MESOREGION,
+                                            services.SIDRA_STATE))
+
+        assert [parent for parent, _ in crawled] == parents
+        assert [children[0].id for _, children in crawled] \
+            == [_id * 10 for _id in range(8)]
+        assert len(sidra.threads) > 1
+
+    def testResolve(self, monkeypatch):
+        """Tests if Seeder.resolve() links children by their code prefixes."""
+        districts = [110020505, 110020510, 350010505, 350020505, 530010805]
+        sidra = FakeSidraDataset(districts, {3500105: [350010505]})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+
+        # The parent of the 3500205 district is not given, so the parents of
+        # its state are crawled, while the already expanded ones are ignored
+        parents = [types.Map(id=_id) for _id in (1100205, 1100338, 3500105)]
+        resolved = list(seeders.Seeder.resolve(parents,
+                                               services.SIDRA_DISTRICT,
+                                               services.SIDRA_MUNICIPALITY,
+                                               {5300108}))
+
+        assert [parent for parent, _ in resolved] == parents
+        assert [[child.id for child in children]
+                for _, children in resolved] \
+            == [[110020505, 110020510], [], [350010505]]
+        assert sidra.findAllCalls == [services.SIDRA_DISTRICT]
+        assert sidra.findChildrenCalls == [3500105]
+
+    def testResolveCrawl(self, monkeypatch):
+        """Tests if Seeder.resolve() crawls the unprefixed levels."""
+        sidra = FakeSidraDataset([35001], {3501: [35001], 3502: [35002]})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+
+        parents = [types.Map(id=3501), types.Map(id=3502)]
+        resolved = list(seeders.Seeder.resolve(parents,
+                                               services.SIDRA_MICROREGION,
+                                               services.SIDRA_MESOREGION))
+
+        assert [[child.id for child in children]
+                for _, children in resolved] == [[35001], [35002]]
+        assert sidra.findAllCalls == []
+        assert sidra.findChildrenCalls == [3501, 3502]
+
+        # Failed bulk requests also fallback to crawl every parent
+        sidra = FakeSidraDataset(None, {11: [1101], 35: [3501]})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+
+        parents = [types.Map(id=11), types.Map(id=35)]
+        resolved = list(seeders.Seeder.resolve(parents,
+                                               services.SIDRA_MESOREGION,
+                                               services.SIDRA_STATE))
+
+        assert [[child.id for child in children]
+                for _, children in resolved] == [[1101], [3501]]
+        assert sidra.findChildrenCalls == [11, 35]
+
+    def testRun(self, database, monkeypatch):
+        """Tests if Seeder.run() retries the parents that failed."""
+        sidra = FakeSidraDataset(None, {11: [1101, 1102], 35: None})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+        seeders.MesoregionSeeder.run()
+
+        assert [mesoregion.id
+                for mesoregion in repositories.MesoregionRepository
+                .findAll()] == [1101, 1102]
+        assert repositories.CheckpointRepository.findParentIds('mesoregions') \
+            == {11}
+
+        sidra.children[35] = [3501]
+        sidra.findChildrenCalls = []
+        seeders.MesoregionSeeder.run()
+
+        assert sidra.findChildrenCalls == [35]
+        assert repositories.MesoregionRepository.count() == 3
+        assert repositories.CheckpointRepository.count() == 0
+
+    def testRunResume(self, database, monkeypatch):
+        """Tests if Seeder.run() resumes an interrupted seeding."""
+        sidra = FakeSidraDataset(None, {11: [1101], 35: KeyboardInterrupt()})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+        monkeypatch.setattr(seeders, 'SEED_BATCH_SIZE', 1)
+
+        with pytest.raises(KeyboardInterrupt):
+            seeders.MesoregionSeeder.run()
+
+        assert repositories.MesoregionRepository.count() == 1
+        assert repositories.CheckpointRepository.findParentIds('mesoregions') \
+            == {11}
+
+        sidra.children[35] = [3501, 3502]
+        sidra.findChildrenCalls = []
+        seeders.MesoregionSeeder.run()
+
+        assert sidra.findChildrenCalls == [35]
+        assert [(mesoregion.id, mesoregion.state_id)
+                for mesoregion in repositories.MesoregionRepository
+                .findAll()] == [(1101, 11), (3501, 35), (3502, 35)]
+        assert repositories.CheckpointRepository.count() == 0
+
+    def testRunComplete(self, database, monkeypatch):
+        """Tests if Seeder.run() skips the completely seeded tables."""
+        sidra = FakeSidraDataset(None, {11: [1101], 35: [3501]})
+        monkeypatch.setattr(seeders.Seeder, 'sidra_db', sidra)
+        seeders.MesoregionSeeder.run()
+        sidra.findChildrenCalls = []
+
+        with pytest.raises(seeders.NothingToSeedError):
+            seeders.MesoregionSeeder.run()
+
+        # Leftover checkpoints of expanded parents are cleared as well
+        repositories.CheckpointRepository.addMany(
+            dict(table_name='mesoregions', parent_id=_id) for _id in (11, 35))
+
+        with pytest.raises(seeders.NothingToSeedError):
+            seeders.MesoregionSeeder.run()
+
+        assert sidra.findChildrenCalls == []
+        assert repositories.MesoregionRepository.count() == 2
+        assert repositories.CheckpointRepository.count() == 0
+
+    def testCrawlAsync(self, sidra_stub, monkeypatch):
+        """Tests if Seeder.crawl() works as expected in asynchronous mode."""
+        monkeypatch.setattr(services, 'AsyncSidraDataset',
+                            functools.partial(services.AsyncSidraDataset,
+                                              sidra_stub.url))
+        monkeypatch.setattr(seeders.Seeder, 'asynchronous', True)
+        monkeypatch.setattr(seeders.Seeder, 'workers', 2)
+
+        mesoregions = [types.Map(id=1101), types.Map(id=1102)]
+        crawled = list(seeders.Seeder.crawl(mesoregions,
+                                            services.SIDRA_MICROREGION,
+                                            services.SIDRA_MESOREGION))
+
+        assert [mesoregion for mesoregion, _ in crawled] == mesoregions
+        assert [len(microregions) for _, microregions in crawled] == [2, 6]
+        assert len(sidra_stub.connections) <= 2
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset serializers testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import io
+import pickle
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.dataset import repositories, schema, serializers
+from geodatabr.encoders import json
+
+# Classes
+
+
+class TestSerializer(object):
+    """Tests Serializer class methods."""
+
+    def testStream(self, states):
+        """Tests if Serializer.stream() works as expected."""
+        tables = serializers.Serializer(localize=False, forceStr=True) \
+            .stream([schema.State, schema.Mesoregion])
+        table = next(tables)
+
+        assert (table.name, table.columns) == ('states', ['id', 'name'])
+        assert [dict(row) for row in table] \
+            == [dict(id='11', name='Rondônia'),
+                dict(id='35', name='São Paulo')]
+        assert list(table) == []
+        assert list(tables) == []
+
+    def testSerialize(self, states):
+        """Tests if Serializer.serialize() works as expected."""
+        dataset = serializers.Serializer(localize=False) \
+            .serialize([schema.State, schema.Mesoregion])
+
+        assert list(dataset) == ['states']
+        assert dataset.states.first() == dict(id=11, name='Rondônia')
+
+    def testStreamDataset(self, states, monkeypatch):
+        """Tests if Serializer.streamDataset() streams rows to encoders."""
+        serializer = serializers.Serializer(localize=False)
+        fetch_rows = serializer._fetchRows
+        fetched = []
+        writes = []
+
+        def fetch(entity):
+            for row in fetch_rows(entity):
+                fetched.append(row)
+                yield row
+
+        class Output(io.BytesIO):
+            """Output file recording the rows fetched at each write."""
+
+            def write(self, data: bytes) -> int:
+                writes.append((len(fetched), data))
+
+                return super().write(data)
+
+        monkeypatch.setattr(serializer, '_fetchRows', fetch)
+        dataset = serializer.streamDataset([schema.State, schema.Mesoregion])
+
+        assert (list(dataset), len(dataset)) == (['states'], 1)
+        assert fetched == []
+
+        output = Output()
+        json.JsonEncoder().encodeStream(dataset, output, compact=True)
+
+        assert output.getvalue().decode('utf-8') \
+            == ('{"states":[{"id":11,"name":"Rondônia"},'
+                '{"id":35,"name":"São Paulo"}]}')
+        # Each row is written before the next one is fetched
+        assert [count for count, data in writes if b'"id"' in data] == [1, 2]
+
+
+class TestMemorySerializer(object):
+    """Tests MemorySerializer class methods."""
+
+    def testStream(self, states, monkeypatch):
+        """Tests if MemorySerializer.stream() works as expected."""
+        serializer = serializers.MemorySerializer(localize=False)
+        serializer.load([schema.State, schema.Mesoregion])
+        checksum = serializer.dataset.checksum(schema.State)
+        serializer = pickle.loads(pickle.dumps(serializer))
+
+        # The rows are not fetched again from the database
+        monkeypatch.setattr(repositories.StateRepository, 'db', None)
+
+        for _ in range(2):
+            tables = list(serializer.stream([schema.State,
+                                             schema.Mesoregion]))
+
+            assert [(table.table, table.name) for table in tables] \
+                == [(schema.State.__table__, 'states')]
+            assert [dict(row) for row in tables[0]] \
+                == [dict(id=11, name='Rondônia'),
+                    dict(id=35, name='São Paulo')]
+            assert list(tables[0]) == []
+
+        assert serializer.dataset.count(schema.State) == 2
+        assert serializer.dataset.checksum(schema.State) == checksum
+        assert serializer.dataset.checksum(schema.Mesoregion) != checksum
+        assert serializers.MemorySerializer(serializer.dataset,
+                                            localize=False,
+                                            forceStr=True) \
+            .serialize([schema.State]).states.last() \
+            == dict(id='35', name='São Paulo')
+
+    @pytest.mark.parametrize('force_str', [False, True])
+    def testStreamColumns(self, states, force_str):
+        """Tests if MemorySerializer.stream() matches the database rows."""
+        serializer = serializers.MemorySerializer(localize=False,
+                                                  forceStr=force_str)
+        table = next(serializer.stream([schema.State]))
+        rows = iter(table)
+
+        assert next(rows) == dict(id='11' if force_str else 11,
+                                  name='Rondônia')
+        assert all(isinstance(row, types.OrderedMap) for row in rows)
+        assert serializer.serialize([schema.State]) \
+            == serializers.Serializer(localize=False, forceStr=force_str) \
+            .serialize([schema.State])
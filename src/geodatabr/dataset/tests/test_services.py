@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset services testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import asyncio
+import os
+import threading
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.dataset import services
+
+# Classes
+
+
+class FakeClock(object):
+    """Fake monotonic clock, advanced only by sleeping."""
+
+    def __init__(self):
+        """Creates a new fake clock, starting at zero."""
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        """Gets the current fake time."""
+        return self.now
+
+    def sleep(self, delay: float):
+        """Advances the fake time by a given delay."""
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+# Functions
+
+
+def run(coroutine):
+    """
+    Runs a coroutine into a new event loop.
+
+    Args:
+        coroutine: The coroutine to run
+
+    Returns:
+        The coroutine result
+    """
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the clock of the rate limiters by a fake one."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(services, 'time', fake_clock)
+
+    return fake_clock
+
+
+class TestRateLimiter(object):
+    """Tests RateLimiter class methods."""
+
+    def testBurst(self, clock):
+        """Tests if RateLimiter allows bursts up to its capacity."""
+        limiter = services.RateLimiter(2, 3)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert clock.sleeps == []
+
+        limiter.acquire()
+
+        assert clock.sleeps == [0.5]
+
+    def testRefill(self, clock):
+        """Tests if RateLimiter refills its bucket at the given rate."""
+        limiter = services.RateLimiter(2, 3)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        clock.now += 0.25
+        limiter.acquire()
+
+        assert clock.sleeps == [0.25]
+
+        # The bucket never holds more tokens than its capacity
+        clock.now += 100
+
+        for _ in range(4):
+            limiter.acquire()
+
+        assert clock.sleeps == [0.25, 0.5]
+        assert clock.now == 101.0
+
+    def testConfigure(self, clock):
+        """Tests if RateLimiter.configure() works as expected."""
+        limiter = services.RateLimiter(1)
+        limiter.acquire()
+        limiter.configure(capacity=2)
+
+        assert (limiter.rate, limiter.capacity) == (1.0, 2)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert clock.sleeps == [1.0]
+
+        with pytest.raises(ValueError):
+            limiter.configure(rate=0)
+
+        with pytest.raises(ValueError):
+            limiter.configure(capacity=0)
+
+
+class TestSidraDataset(object):
+    """Tests SidraDataset service methods."""
+
+    def testSessions(self):
+        """Tests if SidraDataset uses a HTTP session per thread."""
+        sidra = services.SidraDataset()
+        sessions = []
+
+        def get_session():
+            sessions.append(sidra._session)  # pylint: disable=W0212
+
+        threads = [threading.Thread(target=get_session) for _ in range(2)]
+
+        for thread in threads:
+            thread.start()
+            thread.join()
+
+        get_session()
+        get_session()
+
+        assert len({id(session) for session in sessions}) == 3
+        assert sessions[2] is sessions[3]
+
+    def testParentCode(self):
+        """Tests if SidraDataset.parentCode() works as expected."""
+        parent_code = services.SidraDataset.parentCode
+
+        assert parent_code(1101, services.SIDRA_MESOREGION,
+                           services.SIDRA_STATE) == 11
+        assert parent_code(3550308, services.SIDRA_MUNICIPALITY,
+                           services.SIDRA_STATE) == 35
+        assert parent_code(110020505, services.SIDRA_DISTRICT,
+                           services.SIDRA_MUNICIPALITY) == 1100205
+        assert parent_code(11002050506, services.SIDRA_SUBDISTRICT,
+                           services.SIDRA_DISTRICT) == 110020505
+        assert parent_code(11002050506, services.SIDRA_SUBDISTRICT,
+                           services.SIDRA_MUNICIPALITY) == 1100205
+        assert parent_code(35, services.SIDRA_STATE,
+                           services.SIDRA_STATE) == 35
+        assert parent_code(35002, services.SIDRA_MICROREGION,
+                           services.SIDRA_MESOREGION) is None
+        assert parent_code(3550308, services.SIDRA_MUNICIPALITY,
+                           services.SIDRA_MICROREGION) is None
+
+
+class TestAsyncSidraDataset(object):
+    """Tests AsyncSidraDataset service methods."""
+
+    def testFindChildren(self, sidra_stub):
+        """Tests if AsyncSidraDataset.findChildren() works as expected."""
+        async def find_children():
+            async with services.AsyncSidraDataset(sidra_stub.url) as sidra:
+                return await sidra.findChildren(services.SIDRA_SUBDISTRICT,
+                                                services.SIDRA_DISTRICT,
+                                                110020505)
+
+        subdistricts = run(find_children())
+
+        assert isinstance(subdistricts, services.SidraDatasetResponse)
+        assert [subdistrict.id for subdistrict in subdistricts] \
+            == list(range(11002050506, 11002050511))
+        assert subdistricts[0].name == 'Zona 01'
+
+    def testFindChildrenMany(self, sidra_stub):
+        """Tests if AsyncSidraDataset.findChildrenMany() works as expected."""
+        async def find_children():
+            async with services.AsyncSidraDataset(sidra_stub.url,
+                                                  limit_per_host=1) as sidra:
+                return await sidra.findChildrenMany(services.SIDRA_MICROREGION,
+                                                    services.SIDRA_MESOREGION,
+                                                    [1102, 1101, 1102])
+
+        microregions = run(find_children())
+
+        assert len(microregions) == 3
+        assert microregions[0] == microregions[2]
+        assert [microregion.id for microregion in microregions[1]] \
+            == [11001, 11002]
+        # The repeated parent is sent after the first one, hitting the cache
+        assert len(sidra_stub.requests) == 2
+        assert len(sidra_stub.connections) == 1
+
+    def testFindChildrenManyConcurrency(self, monkeypatch):
+        """Tests if AsyncSidraDataset.findChildrenMany() limits requests."""
+        active = []
+        peak = []
+
+        async def find_children(self, child_level, parent_level, parent_id):
+            active.append(parent_id)
+            peak.append(len(active))
+            await asyncio.sleep(0.001 * (parent_id % 3))
+            active.remove(parent_id)
+
+            return [types.Map(id=parent_id)]
+
+        monkeypatch.setattr(services.AsyncSidraDataset, 'findChildren',
+                            find_children)
+
+        async def find_children_many():
+            async with services.AsyncSidraDataset(limit_per_host=3) as sidra:
+                return await sidra.findChildrenMany(services.SIDRA_MICROREGION,
+                                                    services.SIDRA_MESOREGION,
+                                                    list(range(50)))
+
+        children = run(find_children_many())
+
+        assert [territories[0].id for territories in children] \
+            == list(range(50))
+        assert max(peak) == 3
+
+    def testCacheExecutor(self, sidra_stub, monkeypatch):
+        """Tests if AsyncSidraDataset reads and writes the cache off loop."""
+        cache = services.HttpSession.cache
+        threads = []
+
+        for method in ('get', 'set'):
+            def call(*args, _method=getattr(cache, method)):
+                threads.append(threading.get_ident())
+
+                return _method(*args)
+
+            monkeypatch.setattr(cache, method, call)
+
+        async def find_children():
+            async with services.AsyncSidraDataset(sidra_stub.url) as sidra:
+                return [await sidra.findChildren(services.SIDRA_MESOREGION,
+                                                 services.SIDRA_STATE,
+                                                 11)
+                        for _ in range(2)]
+
+        first, second = run(find_children())
+
+        assert first == second
+        assert len(sidra_stub.requests) == 1
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    def testRetries(self, sidra_stub):
+        """Tests if AsyncSidraDataset retries failing requests."""
+        sidra_stub.failures = services.HTTP_MAX_RETRIES
+
+        async def find_children():
+            async with services.AsyncSidraDataset(sidra_stub.url) as sidra:
+                return await sidra.findChildren(services.SIDRA_MESOREGION,
+                                                services.SIDRA_STATE,
+                                                11)
+
+        mesoregions = run(find_children())
+
+        assert [mesoregion.id for mesoregion in mesoregions] == [1101, 1102]
+        assert len(sidra_stub.requests) == services.HTTP_MAX_RETRIES + 1
+
+    def testFailures(self, sidra_stub):
+        """Tests if AsyncSidraDataset handles failing requests."""
+        sidra_stub.failures = services.HTTP_MAX_RETRIES + 1
+
+        async def find_children():
+            async with services.AsyncSidraDataset(sidra_stub.url) as sidra:
+                return (await sidra.findChildren(services.SIDRA_MESOREGION,
+                                                 services.SIDRA_STATE,
+                                                 11),
+                        await sidra.findChildren(services.SIDRA_MESOREGION,
+                                                 services.SIDRA_STATE,
+                                                 12))
+
+        failed, missing = run(find_children())
+
+        assert failed == [] and missing == []
+
+
+class TestResponseCache(object):
+    """Tests ResponseCache class methods."""
+
+    def testCachedRequests(self, sidra_stub):
+        """Tests if cached requests are served without network round trips."""
+        sidra = services.SidraDataset(sidra_stub.url)
+        mesoregions = sidra.findChildren(services.SIDRA_MESOREGION,
+                                         services.SIDRA_STATE,
+                                         11)
+
+        assert sidra.findChildren(services.SIDRA_MESOREGION,
+                                  services.SIDRA_STATE,
+                                  11) == mesoregions
+        assert len(sidra_stub.requests) == 1
+
+        services.HttpSession.cache.mode = services.CACHE_OFFLINE
+
+        assert sidra.findChildren(services.SIDRA_MESOREGION,
+                                  services.SIDRA_STATE,
+                                  11) == mesoregions
+        assert len(sidra_stub.requests) == 1
+
+        with pytest.raises(services.CacheMissError):
+            sidra.findChildren(services.SIDRA_MESOREGION,
+                               services.SIDRA_STATE,
+                               12)
+
+    def testEviction(self, tmp_path):
+        """Tests if ResponseCache.evict() works as expected."""
+        cache = services.ResponseCache(str(tmp_path), max_size=1024)
+
+        for code in range(16):
+            cache.set('http://sidra/{}'.format(code), None, b'0' * 128, {})
+
+        assert sum(cache_file.stat().st_size
+                   for cache_file in tmp_path.iterdir()
+                   if cache_file.is_file()) <= 1024
+        assert cache.get('http://sidra/0') is None
+        assert cache.get('http://sidra/15').body == b'0' * 128
+
+    def testEvictionRace(self, tmp_path, monkeypatch):
+        """Tests if ResponseCache survives entries evicted by other threads."""
+        cache = services.ResponseCache(str(tmp_path), max_size=1024)
+        cache.set('http://sidra/0', None, b'0' * 128, {})
+        # An unfinished entry written by another thread
+        temp_file = tmp_path / services.CACHE_TEMP_DIR / 'unfinished'
+        temp_file.write_bytes(b'1' * 2048)
+        cache._size = None
+        cache.evict()
+
+        assert cache.get('http://sidra/0').body == b'0' * 128
+
+        cache.clear()
+
+        assert temp_file.exists()
+        assert cache._size == 0
+
+        cache.set('http://sidra/1', None, b'1' * 128, {})
+        utime = os.utime
+
+        def utime_evicted(path):
+            os.unlink(path)
+
+            return utime(path)
+
+        monkeypatch.setattr(os, 'utime', utime_evicted)
+
+        assert cache.get('http://sidra/1') is None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Apache Arrow encoder module."""
+# Imports
+
+# Built-in dependencies
+
+from typing import BinaryIO
+
+# External dependencies
+
+try:
+    from pyarrow import ipc
+except ImportError:
+    ipc = None
+
+# Package dependencies
+
+from geodatabr.core import datasets, encoders
+from geodatabr.encoders.arrow import utils
+
+# Classes
+
+
+class ArrowFormat(encoders.EncoderFormat):
+    """Encoder format class for Apache Arrow file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'arrow'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'Apache Arrow'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.arrow'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Columnar'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/vnd.apache.arrow.file'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://en.wikipedia.org/wiki/Apache_Arrow'
+
+    @property
+    def isBinary(self) -> bool:
+        """Tells whether the encoder format is binary or not."""
+        return True
+
+    @property
+    def isFlatFile(self) -> bool:
+        """Tells whether the encoder format is a flat file or not."""
+        return True
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the encoder format dependencies are installed."""
+        return ipc is not None
+
+
+class ArrowEncoder(encoders.Encoder):
+    """
+    Apache Arrow encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.arrow.ArrowFormat): The encoder format class
+    """
+
+    format = ArrowFormat
+
+    @property
+    def options(self) -> dict:
+        """Gets the default encoding options."""
+        return dict(batch_size=utils.ARROW_BATCH_SIZE)
+
+    def encodeStream(self,
+                     data: datasets.TableStream,
+                     fileobj: BinaryIO,
+                     **options):
+        """
+        Encodes the table rows into an Arrow IPC file.
+
+        The file can be memory-mapped by the readers, with zero-copy reads of
+        its columns.
+
+        Args:
+            data: The table rows stream to encode
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            options = dict(self.options, **options)
+            table = utils.arrow_table(data, options.get('batch_size'))
+
+            with ipc.new_file(fileobj, table.schema) as writer:
+                writer.write_table(table, options.get('batch_size'))
+        except Exception:
+            raise encoders.EncodeError
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Apache Arrow encoder utilities module."""
+# Imports
+
+# Built-in dependencies
+
+import itertools
+from typing import Iterator
+
+# External dependencies
+
+from sqlalchemy import types
+from sqlalchemy.sql import schema
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Package dependencies
+
+from geodatabr.core import datasets
+
+# Settings
+
+ARROW_BATCH_SIZE = 65536
+
+# Functions
+
+
+def arrow_type(column: schema.Column) -> 'pyarrow.DataType':
+    """
+    Maps a table column type to its Arrow type.
+
+    The integer columns keep their widths, while the string columns are
+    dictionary-encoded.
+
+    Args:
+        column: The table column element
+
+    Returns:
+        The Arrow type
+
+    Raises:
+        TypeError: If the column type is not supported
+    """
+    if isinstance(column.type, types.String):
+        return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+    if isinstance(column.type, types.BigInteger):
+        return pyarrow.int64()
+
+    if isinstance(column.type, types.SmallInteger):
+        return pyarrow.int16()
+
+    if isinstance(column.type, types.Integer):
+        return pyarrow.int32()
+
+    raise TypeError('Unsupported column type: {}'.format(column.type))
+
+
+def arrow_schema(rows: datasets.TableStream) -> 'pyarrow.Schema':
+    """
+    Builds the Arrow schema of a table.
+
+    Args:
+        rows: The table rows stream
+
+    Returns:
+        The Arrow schema
+    """
+    return pyarrow.schema([pyarrow.field(name,
+                                         arrow_type(column),
+                                         nullable=bool(column.nullable))
+                           for name, column in zip(rows.columns,
+                                                   rows.table.columns)])
+
+
+def record_batches(rows: datasets.TableStream,
+                   table_schema: 'pyarrow.Schema',
+                   batch_size: int = ARROW_BATCH_SIZE
+                   ) -> Iterator['pyarrow.RecordBatch']:
+    """
+    Builds the Arrow record batches of a table, as its rows are consumed.
+
+    Args:
+        rows: The table rows stream
+        table_schema: The Arrow schema of the table
+        batch_size: The maximum number of rows of each record batch
+
+    Yields:
+        The Arrow record batches
+    """
+    rows = iter(rows)
+
+    for batch in iter(lambda: list(itertools.islice(rows, batch_size)), []):
+        arrays = []
+
+        for field in table_schema:
+            values = [row[field.name] for row in batch]
+
+            if pyarrow.types.is_dictionary(field.type):
+                arrays.append(pyarrow.array(values, field.type.value_type)
+                              .dictionary_encode())
+            else:
+                arrays.append(pyarrow.array(values, field.type))
+
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=table_schema)
+
+
+def arrow_table(rows: datasets.TableStream,
+                batch_size: int = ARROW_BATCH_SIZE) -> 'pyarrow.Table':
+    """
+    Builds the Arrow table of a table.
+
+    The dictionaries of all record batches are unified, so every chunk of
+    each dictionary-encoded column shares the same dictionary.
+
+    Args:
+        rows: The table rows stream
+        batch_size: The maximum number of rows of each record batch
+
+    Returns:
+        The Arrow table
+    """
+    table_schema = arrow_schema(rows)
+
+    return pyarrow.Table.from_batches(
+        list(record_batches(rows, table_schema, batch_size)),
+        table_schema).unify_dictionaries()
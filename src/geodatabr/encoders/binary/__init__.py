@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""geodatabr binary encoder module."""
+# Imports
+
+# Built-in dependencies
+
+import itertools
+import struct
+from typing import BinaryIO
+
+# External dependencies
+
+from sqlalchemy import types as db_types
+from sqlalchemy.sql import schema as db_schema
+
+# Package dependencies
+
+from geodatabr.core import encoders, types
+from geodatabr.dataset import schema
+from geodatabr.encoders.binary import utils
+
+# Functions
+
+
+def column_format(column: db_schema.Column) -> str:
+    """
+    Maps a table column type to its format character.
+
+    The integer columns keep their widths, while the string columns are
+    stored on a string table.
+
+    Args:
+        column: The table column element
+
+    Returns:
+        The format character
+
+    Raises:
+        TypeError: If the column type is not supported
+    """
+    if isinstance(column.type, db_types.String):
+        return 's'
+
+    if isinstance(column.type, db_types.BigInteger):
+        return 'q'
+
+    if isinstance(column.type, db_types.SmallInteger):
+        return 'h'
+
+    if isinstance(column.type, db_types.Integer):
+        return 'i'
+
+    raise TypeError('Unsupported column type: {}'.format(column.type))
+
+
+# Classes
+
+
+class BinaryFormat(encoders.EncoderFormat):
+    """Encoder format class for geodatabr binary file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'gdbr'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'geodatabr Binary'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.gdbr'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Columnar'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/octet-stream'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://github.com/paulofreitas/geodata-br'
+
+    @property
+    def isBinary(self) -> bool:
+        """Tells whether the encoder format is binary or not."""
+        return True
+
+
+class BinaryEncoder(encoders.Encoder):
+    """
+    geodatabr binary encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.binary.BinaryFormat):
+            The encoder format class
+    """
+
+    format = BinaryFormat
+
+    @property
+    def serializationOptions(self) -> dict:
+        """Gets the encoder serialization options."""
+        return dict(localize=False)
+
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
+        """
+        Encodes the data into a geodatabr binary file.
+
+        The file can be memory-mapped by the DatasetReader class, with
+        lookups answered straight from the mapped file.
+
+        Args:
+            data: The data to encode
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        # pylint: disable=protected-access
+        try:
+            tables = types.OrderedMap(
+                (entity.__table__.name,
+                 (entity.__table__,
+                  sorted(data.get(entity.__table__.name),
+                         key=lambda row: row['id'])))
+                for entity in schema.ENTITIES
+                if data.get(entity.__table__.name))
+            parent_tables = {'{}_id'.format(entity._name):
+                             entity.__table__.name
+                             for entity in schema.ENTITIES}
+            positions = {name: {row['id']: position
+                                for position, row in enumerate(rows)}
+                         for name, (_, rows) in tables.items()}
+            directory = types.Bytes()
+            section = types.Bytes()
+            directory.writeInt(len(tables))
+
+            for name, (table, rows) in tables.items():
+                links = [column for column in table.columns
+                         if parent_tables.get(column.name) in tables]
+                directory.writeString(name)
+                directory.writeInt(len(rows))
+                directory.writeInt(len(table.columns))
+
+                for column in table.columns:
+                    _format = column_format(column)
+                    values = [row[column.name] for row in rows]
+                    directory.writeString(column.name)
+                    directory.writeByte(ord(_format))
+                    directory.writeInt(section.tell())
+
+                    if _format == 's':
+                        values = [value.encode('utf-8') for value in values]
+                        self._writeArray(
+                            section,
+                            'i',
+                            itertools.accumulate(
+                                [0] + [len(value) for value in values]))
+                        section.write(b''.join(values))
+                    else:
+                        self._writeArray(section, _format, values)
+
+                directory.writeInt(len(links))
+
+                for column in links:
+                    parent = parent_tables[column.name]
+                    directory.writeString(column.name)
+                    directory.writeString(parent)
+                    directory.writeInt(section.tell())
+                    self._writeLink(section,
+                                    len(tables[parent][1]),
+                                    [positions[parent].get(row[column.name])
+                                     for row in rows])
+
+            fileobj.write(utils.HEADER.pack(utils.MAGIC,
+                                            utils.VERSION,
+                                            len(directory)))
+            fileobj.write(directory.getvalue())
+            fileobj.write(section.getvalue())
+        except Exception:
+            raise encoders.EncodeError
+
+    @staticmethod
+    def _writeArray(section: types.Bytes, _format: str, values):
+        """
+        Writes an array of fixed-width values.
+
+        Args:
+            section: The data section
+            _format: The values format character
+            values: The values to write
+        """
+        values = list(values)
+        section.write(struct.pack('!{:d}{}'.format(len(values), _format),
+                                  *values))
+
+    @classmethod
+    def _writeLink(cls,
+                   section: types.Bytes,
+                   parent_count: int,
+                   parent_positions: list):
+        """
+        Writes the row positions of a table grouped by their parent rows.
+
+        Args:
+            section: The data section
+            parent_count: The parent table row count
+            parent_positions: The parent row position of each row
+        """
+        counts = [0] * (parent_count + 1)
+
+        for parent_position in parent_positions:
+            if parent_position is not None:
+                counts[parent_position + 1] += 1
+
+        offsets = list(itertools.accumulate(counts))
+        cursors = offsets[:-1]
+        children = [0] * offsets[-1]
+
+        for position, parent_position in enumerate(parent_positions):
+            if parent_position is not None:
+                children[cursors[parent_position]] = position
+                cursors[parent_position] += 1
+
+        cls._writeArray(section, 'i', offsets)
+        cls._writeArray(section, 'i', children)
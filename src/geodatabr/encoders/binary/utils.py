@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+geodatabr binary format utilities module.
+
+A geodatabr binary file starts with the MAGIC bytes, followed by the format
+version and the directory length as integers, the directory itself and the
+data section. All numbers are big-endian, as written by types.Bytes.
+
+The directory holds the table count and, for each table, its name, row and
+column counts, then the name, format character and data offset of each
+column, and finally the count and the parent column name, parent table name
+and data offset of each hierarchy link. Offsets are relative to the data
+section start.
+
+In the data section, integer columns are fixed-width arrays sorted by ID.
+String columns are an array of row count + 1 offsets followed by the UTF-8
+encoded strings, so the string of row N spans from offsets[N] to
+offsets[N + 1]. Each hierarchy link is an array of parent row count + 1
+offsets followed by the row positions grouped by parent, so the children
+positions of the parent at row N span from positions[offsets[N]] to
+positions[offsets[N + 1]].
+"""
+# Imports
+
+# Built-in dependencies
+
+import mmap
+import struct
+from typing import Iterator
+
+# Package dependencies
+
+from geodatabr.core import types
+
+# Constants
+
+MAGIC = b'GDBR'
+VERSION = 1
+HEADER = struct.Struct('!4sii')
+OFFSET = struct.Struct('!i')
+
+# Classes
+
+
+class DatasetReader(object):
+    """
+    Reader of geodatabr binary files.
+
+    The file is memory-mapped and only its directory is parsed when opened.
+    Lookups binary search the IDs column straight from the mapped file, and
+    only the values of the matching rows are decoded.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Opens a geodatabr binary file.
+
+        Args:
+            filename: The file name
+
+        Raises:
+            geodatabr.encoders.binary.utils.DecodeError:
+                If the file is not a valid geodatabr binary file
+        """
+        self._map = None
+
+        with open(str(filename), 'rb') as binary_file:
+            try:
+                self._map = mmap.mmap(binary_file.fileno(),
+                                      0,
+                                      access=mmap.ACCESS_READ)
+                magic, version, directory_length = \
+                    HEADER.unpack_from(self._map)
+            except (ValueError, struct.error):
+                magic, version = None, None
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise DecodeError('Not a geodatabr binary file: {}'
+                              .format(filename))
+
+        directory = types.Bytes(
+            self._map[HEADER.size:HEADER.size + directory_length])
+        base = HEADER.size + directory_length
+        self._tables = types.OrderedMap()
+        self._links = {}
+
+        for _ in range(directory.readInt()):
+            table = types.Map(name=directory.readString(),
+                              rows=directory.readInt(),
+                              columns=types.OrderedMap())
+
+            for _ in range(directory.readInt()):
+                name = directory.readString()
+                _format = chr(directory.readByte())
+                table.columns[name] = (
+                    _format,
+                    struct.Struct('!' + (_format if _format != 's' else 'i')),
+                    base + directory.readInt())
+
+            for _ in range(directory.readInt()):
+                directory.readString()
+                parent = directory.readString()
+                self._links[parent, table.name] = base + directory.readInt()
+
+            self._tables[table.name] = table
+
+    def __enter__(self) -> 'DatasetReader':
+        """
+        Enters the reader context.
+
+        Returns:
+            The reader instance
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Exits the reader context, closing the file."""
+        self.close()
+
+    def close(self):
+        """Closes the file."""
+        if self._map is not None:
+            self._map.close()
+
+    @property
+    def tables(self) -> types.List:
+        """Gets the table names."""
+        return types.List(self._tables)
+
+    def count(self, table: str) -> int:
+        """
+        Returns the row count of a given table.
+
+        Args:
+            table: The table name
+
+        Returns:
+            The table row count
+        """
+        return self._tables[table].rows
+
+    def findById(self, table: str, _id: int) -> types.OrderedMap:
+        """
+        Retrieves a single row by ID.
+
+        Args:
+            table: The table name
+            _id: The row ID
+
+        Returns:
+            The row, or None if it is not found
+        """
+        position = self._position(self._tables[table], _id)
+
+        return self._row(self._tables[table], position) \
+            if position is not None else None
+
+    def findChildren(self,
+                     table: str,
+                     _id: int,
+                     child_table: str) -> types.List:
+        """
+        Retrieves the descendant rows of a given row.
+
+        Args:
+            table: The table name
+            _id: The row ID
+            child_table: The descendant table name
+
+        Returns:
+            A list with the descendant rows, sorted by ID
+        """
+        parent = self._tables[table]
+        position = self._position(parent, _id)
+        offset = self._links.get((table, child_table))
+
+        if position is None or offset is None:
+            return types.List()
+
+        start, end = struct.unpack_from('!ii',
+                                        self._map,
+                                        offset + position * OFFSET.size)
+        positions = offset + (parent.rows + 1) * OFFSET.size
+
+        return types.List(
+            self._row(self._tables[child_table],
+                      OFFSET.unpack_from(self._map,
+                                         positions + index * OFFSET.size)[0])
+            for index in range(start, end))
+
+    def rows(self, table: str) -> Iterator[types.OrderedMap]:
+        """
+        Yields all rows of a given table.
+
+        Args:
+            table: The table name
+
+        Yields:
+            The table rows, sorted by ID
+        """
+        for position in range(self._tables[table].rows):
+            yield self._row(self._tables[table], position)
+
+    def _position(self, table: types.Map, _id: int) -> int:
+        """
+        Binary searches the row position of a given ID.
+
+        Args:
+            table: The table directory entry
+            _id: The row ID
+
+        Returns:
+            The row position, or None if it is not found
+        """
+        _, column, offset = table.columns['id']
+        low, high = 0, table.rows
+
+        while low < high:
+            middle = (low + high) // 2
+            value = column.unpack_from(self._map,
+                                       offset + middle * column.size)[0]
+
+            if value < _id:
+                low = middle + 1
+            elif value > _id:
+                high = middle
+            else:
+                return middle
+
+        return None
+
+    def _row(self, table: types.Map, position: int) -> types.OrderedMap:
+        """
+        Decodes the row at a given position.
+
+        Args:
+            table: The table directory entry
+            position: The row position
+
+        Returns:
+            The row
+        """
+        return types.OrderedMap(
+            (name, self._value(table, _format, column, offset, position))
+            for name, (_format, column, offset) in table.columns.items())
+
+    def _value(self,
+               table: types.Map,
+               _format: str,
+               column: struct.Struct,
+               offset: int,
+               position: int):
+        """
+        Decodes a single column value.
+
+        Args:
+            table: The table directory entry
+            _format: The column format character
+            column: The column value packing structure
+            offset: The column data offset
+            position: The row position
+
+        Returns:
+            The column value
+        """
+        if _format != 's':
+            return column.unpack_from(self._map,
+                                      offset + position * column.size)[0]
+
+        start, end = struct.unpack_from('!ii',
+                                        self._map,
+                                        offset + position * OFFSET.size)
+        strings = offset + (table.rows + 1) * OFFSET.size
+
+        return self._map[strings + start:strings + end].decode('utf-8')
+
+
+class DecodeError(Exception):
+    """Exception class raised when a file fails to decode."""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""CBOR encoder module."""
+# Imports
+
+# Built-in dependencies
+
+from typing import BinaryIO, Mapping, Sized
+
+# External dependencies
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Package dependencies
+
+from geodatabr.core import encoders
+
+# Constants
+
+# CBOR major types
+MAJOR_TYPE_ARRAY = 4
+MAJOR_TYPE_MAP = 5
+
+# Classes
+
+
+class CborFormat(encoders.EncoderFormat):
+    """Encoder format class for CBOR file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'cbor'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'CBOR'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.cbor'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Data Interchange'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/cbor'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://en.wikipedia.org/wiki/CBOR'
+
+    @property
+    def isBinary(self) -> bool:
+        """Tells whether the encoder format is binary or not."""
+        return True
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the encoder format dependencies are installed."""
+        return cbor2 is not None
+
+
+class CborEncoder(encoders.Encoder):
+    """
+    CBOR encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.cbor.CborFormat): The encoder format class
+    """
+
+    format = CborFormat
+
+    @property
+    def acceptsStreams(self) -> bool:
+        """Tells whether the encoder accepts lazy table rows streams or not."""
+        return True
+
+    def encodeStream(self, data: Mapping, fileobj: BinaryIO, **options):
+        """
+        Encodes the data into a CBOR file, table by table and row by row.
+
+        The arrays lengths are written ahead of their items, so rows streams
+        are buffered, but just a single table at a time.
+
+        Args:
+            data: The data to encode, a mapping of rows iterables by table
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            encoder = cbor2.CBOREncoder(fileobj,
+                                        **dict(self.options, **options))
+            encoder.encode_length(MAJOR_TYPE_MAP, len(data))
+
+            for table_name, rows in data.items():
+                if not isinstance(rows, Sized):
+                    rows = list(rows)
+
+                encoder.encode(table_name)
+                encoder.encode_length(MAJOR_TYPE_ARRAY, len(rows))
+
+                for row in rows:
+                    encoder.encode(row)
+        except Exception:
+            raise encoders.EncodeError
@@ -7,12 +7,14 @@
 
 # Built-in dependencies
 
+import codecs
 import csv
+import itertools
+from typing import BinaryIO, Iterable
 
 # Package dependencies
 
 from geodatabr.core import encoders
-from geodatabr.core.utils import io
 
 # Classes
 
@@ -76,29 +78,28 @@ class CsvEncoder(encoders.Encoder):
                     quoting=csv.QUOTE_MINIMAL,
                     extrasaction='ignore')
 
-    def encode(self, data: list, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: Iterable, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a CSV file-like stream.
+        Encodes the data into a CSV file.
+
+        The rows are consumed as they are written, so the data can be any
+        iterable of rows, such as a table rows stream.
 
         Args:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A CSV file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            csv_data = io.FileStream()
-            csv_writer = csv.DictWriter(csv_data,
-                                        data.last().keys(),
+            rows = iter(data)
+            first_row = next(rows)
+            csv_writer = csv.DictWriter(codecs.getwriter('utf-8')(fileobj),
+                                        first_row.keys(),
                                         **dict(self.options, **options))
             csv_writer.writeheader()
-            csv_writer.writerows(data)
-            csv_data.seek(0)
-
-            return io.BinaryFileStream(csv_data.getvalue().encode('utf-8'))
+            csv_writer.writerows(itertools.chain([first_row], rows))
         except Exception:
             raise encoders.EncodeError
@@ -7,12 +7,13 @@
 
 # Built-in dependencies
 
+import codecs
 import json
+from typing import BinaryIO, Iterable, Mapping
 
 # Package dependencies
 
 from geodatabr.core import encoders
-from geodatabr.core.utils import io
 
 # Classes
 
@@ -66,25 +67,82 @@ class JsonEncoder(encoders.Encoder):
         """Gets the default encoding options."""
         return dict(indent=2,
                     separators=(',', ': '),
-                    ensure_ascii=False)
+                    ensure_ascii=False,
+                    compact=False)
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    @property
+    def acceptsStreams(self) -> bool:
+        """Tells whether the encoder accepts lazy table rows streams or not."""
+        return True
+
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a JSON file-like stream.
+        Encodes the data into a JSON file, table by table and row by row.
+
+        The output is the same as dumping the whole data at once, but only a
+        single row is held in memory, so the table rows can be streamed. The
+        compact option drops the indentation and the whitespace after the
+        separators.
 
         Args:
-            data: The data to encode
+            data: The data to encode, a mapping of rows iterables by table
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A JSON file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            return io.BinaryFileStream(
-                json.dumps(data, **dict(self.options, **options))
-                .encode('utf-8'))
+            options = dict(self.options, **options)
+
+            if options.pop('compact'):
+                options.update(indent=None, separators=(',', ':'))
+
+            indent = options.get('indent')
+            item_separator, key_separator = options.get('separators')
+            encode = json.JSONEncoder(**options).encode
+            writer = codecs.getwriter('utf-8')(fileobj)
+
+            if indent is None:
+                newline = table_indent = row_indent = ''
+            else:
+                if isinstance(indent, int):
+                    indent = ' ' * indent
+
+                newline = '\n'
+                table_indent = newline + indent
+                row_indent = table_indent + indent
+
+            if not isinstance(data, Mapping):
+                writer.write(encode(data))
+                return
+
+            writer.write('{')
+
+            for table_index, (table_name, rows) in enumerate(data.items()):
+                writer.write('{}{}{}{}'.format(
+                    item_separator if table_index else '',
+                    table_indent,
+                    encode(table_name),
+                    key_separator))
+
+                if isinstance(rows, (str, Mapping)) \
+                        or not isinstance(rows, Iterable):
+                    writer.write(encode(rows).replace('\n', table_indent))
+                    continue
+
+                writer.write('[')
+                row_index = -1
+
+                for row_index, row in enumerate(rows):
+                    writer.write('{}{}{}'.format(
+                        item_separator if row_index else '',
+                        row_indent,
+                        encode(row).replace('\n', row_indent)))
+
+                writer.write('{}]'.format(table_indent
+                                          if row_index >= 0 else ''))
+
+            writer.write('{}}}'.format(newline if data else ''))
         except Exception:
             raise encoders.EncodeError
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""JSON Lines encoder module."""
+# Imports
+
+# Built-in dependencies
+
+import codecs
+import json
+from typing import BinaryIO, Iterable
+
+# Package dependencies
+
+from geodatabr.core import encoders
+
+# Classes
+
+
+class JsonLinesFormat(encoders.EncoderFormat):
+    """Encoder format class for JSON Lines file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'jsonl'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'JSON Lines'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.jsonl'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Data Interchange'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/x-ndjson'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://en.wikipedia.org/wiki/JSON_streaming' \
+            '#Line-delimited_JSON'
+
+    @property
+    def isFlatFile(self) -> bool:
+        """Tells whether the encoder format is a flat file or not."""
+        return True
+
+
+class JsonLinesEncoder(encoders.Encoder):
+    """
+    JSON Lines encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.jsonl.JsonLinesFormat):
+            The encoder format class
+    """
+
+    format = JsonLinesFormat
+
+    @property
+    def options(self) -> dict:
+        """Gets the default encoding options."""
+        return dict(separators=(',', ':'),
+                    ensure_ascii=False)
+
+    def encodeStream(self, data: Iterable, fileobj: BinaryIO, **options):
+        """
+        Encodes the data into a JSON Lines file, with a JSON object per row.
+
+        The rows are consumed as they are written, so the data can be any
+        iterable of rows, such as a table rows stream.
+
+        Args:
+            data: The data to encode
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            encode = json.JSONEncoder(**dict(self.options, **options)).encode
+            writer = codecs.getwriter('utf-8')(fileobj)
+
+            for row in data:
+                writer.write(encode(row) + '\n')
+        except Exception:
+            raise encoders.EncodeError
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""MessagePack encoder module."""
+# Imports
+
+# Built-in dependencies
+
+from typing import BinaryIO, Mapping, Sized
+
+# External dependencies
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Package dependencies
+
+from geodatabr.core import encoders
+
+# Classes
+
+
+class MessagePackFormat(encoders.EncoderFormat):
+    """Encoder format class for MessagePack file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'msgpack'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'MessagePack'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.msgpack'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Data Interchange'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/x-msgpack'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://en.wikipedia.org/wiki/MessagePack'
+
+    @property
+    def isBinary(self) -> bool:
+        """Tells whether the encoder format is binary or not."""
+        return True
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the encoder format dependencies are installed."""
+        return msgpack is not None
+
+
+class MessagePackEncoder(encoders.Encoder):
+    """
+    MessagePack encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.msgpack.MessagePackFormat):
+            The encoder format class
+    """
+
+    format = MessagePackFormat
+
+    @property
+    def acceptsStreams(self) -> bool:
+        """Tells whether the encoder accepts lazy table rows streams or not."""
+        return True
+
+    def encodeStream(self, data: Mapping, fileobj: BinaryIO, **options):
+        """
+        Encodes the data into a MessagePack file, table by table and row by
+        row.
+
+        The arrays lengths are written ahead of their items, so rows streams
+        are buffered, but just a single table at a time.
+
+        Args:
+            data: The data to encode, a mapping of rows iterables by table
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            packer = msgpack.Packer(**dict(self.options, **options))
+            fileobj.write(packer.pack_map_header(len(data)))
+
+            for table_name, rows in data.items():
+                if not isinstance(rows, Sized):
+                    rows = list(rows)
+
+                fileobj.write(packer.pack(table_name))
+                fileobj.write(packer.pack_array_header(len(rows)))
+
+                for row in rows:
+                    fileobj.write(packer.pack(row))
+        except Exception:
+            raise encoders.EncodeError
@@ -5,6 +5,10 @@
 """OpenDocument Spreadsheet file encoder module."""
 # Imports
 
+# Built-in dependencies
+
+from typing import BinaryIO
+
 # External dependencies
 
 import pyexcel_ods
@@ -12,7 +16,6 @@ import pyexcel_ods
 # Package dependencies
 
 from geodatabr.core import encoders, types
-from geodatabr.core.utils import io
 
 # Classes
 
@@ -67,31 +70,30 @@ class OpenDocumentSpreadsheetEncoder(encoders.Encoder):
 
     format = OpenDocumentSpreadsheetFormat
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    @property
+    def isStreamable(self) -> bool:
+        """Tells whether the encoder writes its output sequentially or not."""
+        return False
+
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a OpenDocument Spreadsheet file-like stream.
+        Encodes the data into a OpenDocument Spreadsheet file.
 
         Arguments:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            An OpenDocument Spreadsheet file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            ods_file = io.BinaryFileStream()
             ods_data = types.OrderedMap()
 
             for entity, records in data.items():
                 ods_data[entity] = [list(records.first().keys())] \
                     + [list(record.values()) for record in records]
 
-            pyexcel_ods.save_data(ods_file, ods_data)
-            ods_file.seek(0)
-
-            return ods_file
+            pyexcel_ods.save_data(fileobj, ods_data)
         except Exception:
             raise encoders.EncodeError
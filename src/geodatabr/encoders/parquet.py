@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Apache Parquet encoder module."""
+# Imports
+
+# Built-in dependencies
+
+from typing import BinaryIO
+
+# External dependencies
+
+try:
+    from pyarrow import parquet
+except ImportError:
+    parquet = None
+
+# Package dependencies
+
+from geodatabr.core import datasets, encoders
+from geodatabr.encoders.arrow import utils
+
+# Settings
+
+# Small enough to split the larger tables (municipalities, districts and
+# subdistricts) into row groups spanning a few states each
+PARQUET_ROW_GROUP_SIZE = 1024
+
+# Columns the rows are sorted by, so each row group covers a narrow range of
+# their values
+PARQUET_SORTING_COLUMNS = ('state_id', 'id')
+
+# Classes
+
+
+class ParquetFormat(encoders.EncoderFormat):
+    """Encoder format class for Apache Parquet file format."""
+
+    @property
+    def name(self) -> str:
+        """Gets the encoder format name."""
+        return 'parquet'
+
+    @property
+    def friendlyName(self) -> str:
+        """Gets the encoder format friendly name."""
+        return 'Apache Parquet'
+
+    @property
+    def extension(self) -> str:
+        """Gets the encoder format extension."""
+        return '.parquet'
+
+    @property
+    def type(self) -> str:
+        """Gets the encoder format type."""
+        return 'Columnar'
+
+    @property
+    def mimeType(self) -> str:
+        """Gets the encoder format media type."""
+        return 'application/vnd.apache.parquet'
+
+    @property
+    def info(self) -> str:
+        """Gets the encoder format reference info."""
+        return 'https://en.wikipedia.org/wiki/Apache_Parquet'
+
+    @property
+    def isBinary(self) -> bool:
+        """Tells whether the encoder format is binary or not."""
+        return True
+
+    @property
+    def isFlatFile(self) -> bool:
+        """Tells whether the encoder format is a flat file or not."""
+        return True
+
+    @property
+    def isAvailable(self) -> bool:
+        """Tells whether the encoder format dependencies are installed."""
+        return parquet is not None
+
+
+class ParquetEncoder(encoders.Encoder):
+    """
+    Apache Parquet encoder class.
+
+    Attributes:
+        format (geodatabr.encoders.parquet.ParquetFormat):
+            The encoder format class
+    """
+
+    format = ParquetFormat
+
+    @property
+    def options(self) -> dict:
+        """Gets the default encoding options."""
+        return dict(compression='zstd',
+                    row_group_size=PARQUET_ROW_GROUP_SIZE)
+
+    def encodeStream(self,
+                     data: datasets.TableStream,
+                     fileobj: BinaryIO,
+                     **options):
+        """
+        Encodes the table rows into a Parquet file.
+
+        The rows are sorted by state and ID, and split into row groups with
+        statistics on the ID columns, so the readers can skip the row groups
+        not matching their filters, as the ones of other states.
+
+        Args:
+            data: The table rows stream to encode
+            fileobj: The writable binary file
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            options = dict(self.options, **options)
+            columns = dict(zip((column.name for column in data.table.columns),
+                               data.columns))
+            table = utils.arrow_table(data).sort_by(
+                [(columns[column], 'ascending')
+                 for column in PARQUET_SORTING_COLUMNS
+                 if column in columns])
+            parquet.write_table(
+                table,
+                fileobj,
+                write_statistics=[column
+                                  for column, table_column
+                                  in zip(data.columns, data.table.columns)
+                                  if table_column.name.endswith('id')],
+                **options)
+        except Exception:
+            raise encoders.EncodeError
@@ -5,10 +5,14 @@
 """SQL encoder module."""
 # Imports
 
+# Built-in dependencies
+
+import codecs
+from typing import BinaryIO
+
 # Package dependencies
 
 from geodatabr.core import encoders
-from geodatabr.core.utils import io
 from geodatabr.dataset import schema
 from geodatabr.encoders.sql import utils as sql_utils
 
@@ -69,22 +73,21 @@ class SqlEncoder(encoders.Encoder):
         """Gets the encoder serialization options."""
         return dict(localize=False)
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a SQL file-like stream.
+        Encodes the data into a SQL file, table by table.
 
         Args:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A SQL file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
             sql_schema = sql_utils.Schema(**dict(self.options, **options))
+            sql_writer = codecs.getwriter('utf-8')(fileobj)
 
             for entity in schema.ENTITIES:
                 rows = data.get(entity.__table__.name)
@@ -92,6 +95,11 @@ class SqlEncoder(encoders.Encoder):
                 if rows:
                     sql_schema.addTable(entity.__table__, rows)
 
-            return io.BinaryFileStream(sql_schema.compile().encode('utf-8'))
+            for index, table in enumerate(sql_schema.tables):
+                if index:
+                    sql_writer.write('\n\n')
+
+                sql_writer.write(str(sql_utils.Table(
+                    table, dialect=sql_schema.dialect.name)))
         except Exception:
             raise encoders.EncodeError
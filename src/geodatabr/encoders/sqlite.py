@@ -7,8 +7,10 @@
 
 # Built-in dependencies
 
+import shutil
 import sqlite3
 import tempfile
+from typing import BinaryIO
 
 # Package dependencies
 
@@ -74,22 +76,23 @@ class SqliteEncoder(sql.SqlEncoder, encoders.Encoder):
         """Gets the default encoding options."""
         return dict(dialect='sqlite')
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a SQLite file-like stream.
+        Encodes the data into a SQLite file.
 
         Args:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A SQLite file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            sql_data = super().encode(data, **dict(self.options, **options))
+            sql_data = io.BinaryFileStream()
+            super().encodeStream(data,
+                                 sql_data,
+                                 **dict(self.options, **options))
 
             with tempfile.NamedTemporaryFile() as sqlite_file:
                 with sqlite3.connect(sqlite_file.name) as sqlite_con:
@@ -97,8 +100,9 @@ class SqliteEncoder(sql.SqlEncoder, encoders.Encoder):
                     sqlite_cursor.execute('PRAGMA page_size = 1024')
                     sqlite_cursor.execute('PRAGMA foreign_keys = ON')
                     sqlite_cursor.executescript(
-                        'BEGIN; {} COMMIT'.format(sql_data.read().decode()))
+                        'BEGIN; {} COMMIT'.format(
+                            sql_data.getvalue().decode()))
 
-                return io.BinaryFileStream(sqlite_file.read())
+                shutil.copyfileobj(sqlite_file, fileobj)
         except Exception:
             raise encoders.EncodeError
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Apache Arrow encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import datasets, encoders, types
+from geodatabr.dataset import schema
+from geodatabr.encoders import arrow
+
+# Classes
+
+
+class TestArrowEncoder(object):
+    """Tests ArrowEncoder class methods."""
+
+    def testEncode(self):
+        """Tests if ArrowEncoder.encode() works as expected."""
+        pyarrow = pytest.importorskip('pyarrow')
+        rows = datasets.TableStream(
+            schema.Mesoregion.__table__,
+            'mesoregions',
+            ['id', 'state_id', 'name'],
+            iter([types.OrderedMap(id=1101, state_id=11, name='Leste'),
+                  types.OrderedMap(id=3501, state_id=35, name='Leste'),
+                  types.OrderedMap(id=3502, state_id=35, name='Oeste')]))
+        table = pyarrow.ipc.open_file(
+            arrow.ArrowEncoder().encode(rows, batch_size=2)).read_all()
+
+        assert table.schema.types \
+            == [pyarrow.int16(), pyarrow.int16(),
+                pyarrow.dictionary(pyarrow.int32(), pyarrow.string())]
+        assert table.column('name').num_chunks == 2
+        assert table.to_pydict() \
+            == dict(id=[1101, 3501, 3502],
+                    state_id=[11, 35, 35],
+                    name=['Leste', 'Leste', 'Oeste'])
+
+    def testAvailability(self, monkeypatch):
+        """Tests if the format is only offered with its dependencies."""
+        monkeypatch.setattr(arrow, 'ipc', None)
+
+        assert 'arrow' not in encoders.EncoderFormatRepository.listNames()
+
+        with pytest.raises(encoders.UnknownEncoderError):
+            encoders.EncoderFactory.fromFormat('arrow')
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""geodatabr binary encoder testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.encoders import binary
+from geodatabr.encoders.binary import utils
+
+# Functions
+
+
+@pytest.fixture
+def reader(tmp_path):
+    """Encodes a small dataset and opens it."""
+    filename = str(tmp_path / 'dataset.gdbr')
+    dataset = types.OrderedMap(
+        states=[types.OrderedMap(id=35, name='São Paulo'),
+                types.OrderedMap(id=11, name='Rondônia')],
+        mesoregions=[types.OrderedMap(id=3501, state_id=35, name='Oeste'),
+                     types.OrderedMap(id=3502, state_id=35, name='Leste'),
+                     types.OrderedMap(id=1101, state_id=11, name='Leste')])
+    binary.BinaryEncoder().encodeToFile(dataset, filename)
+
+    with utils.DatasetReader(filename) as dataset_reader:
+        yield dataset_reader
+
+
+# Classes
+
+
+class TestDatasetReader(object):
+    """Tests DatasetReader class methods."""
+
+    def testFind(self, reader):
+        """Tests if DatasetReader find methods work as expected."""
+        assert reader.tables == ['states', 'mesoregions']
+        assert reader.count('mesoregions') == 3
+        assert reader.findById('states', 35) == dict(id=35, name='São Paulo')
+        assert reader.findById('states', 12) is None
+        assert [row.id for row in reader.rows('states')] == [11, 35]
+        assert reader.findChildren('states', 35, 'mesoregions') \
+            == [dict(id=3501, state_id=35, name='Oeste'),
+                dict(id=3502, state_id=35, name='Leste')]
+        assert reader.findChildren('states', 12, 'mesoregions') == []
+
+    def testInvalidFile(self, tmp_path):
+        """Tests if DatasetReader rejects invalid files."""
+        filename = tmp_path / 'dataset.gdbr'
+        filename.write_bytes(b'')
+
+        with pytest.raises(utils.DecodeError):
+            utils.DatasetReader(str(filename))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""CBOR encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.encoders import cbor
+
+# Classes
+
+
+class TestCborEncoder(object):
+    """Tests CborEncoder class methods."""
+
+    def testEncode(self):
+        """Tests if CborEncoder.encode() works as expected."""
+        cbor2 = pytest.importorskip('cbor2')
+        dataset = types.OrderedMap(
+            states=types.List([types.OrderedMap(id=11, name='Rondônia'),
+                               types.OrderedMap(id=35, name='São Paulo')]),
+            mesoregions=iter([types.OrderedMap(id=3501,
+                                               state_id=35,
+                                               name='Oeste')]))
+
+        assert cbor2.loads(cbor.CborEncoder().encode(dataset).read()) \
+            == dict(states=[dict(id=11, name='Rondônia'),
+                            dict(id=35, name='São Paulo')],
+                    mesoregions=[dict(id=3501, state_id=35, name='Oeste')])
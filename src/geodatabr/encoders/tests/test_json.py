@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""JSON encoder testing module."""
+# pylint: disable=no-self-use, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import io
+import json as json_
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import datasets, types
+from geodatabr.encoders import json
+
+# Functions
+
+
+@pytest.fixture
+def dataset():
+    """Builds a small dataset."""
+    return types.OrderedMap([
+        ('states', types.List([
+            types.OrderedMap(id=11, name='Rondônia'),
+            types.OrderedMap(id=35, name='São Paulo "SP"\n')])),
+        ('mesoregions', types.List()),
+        ('municipalities', types.List([
+            types.OrderedMap(id=3550308, state_id=35, name="Estrela d'Oeste",
+                             area=None, capital=True)])),
+    ])
+
+
+# Classes
+
+
+class TestJsonEncoder(object):
+    """Tests JsonEncoder class methods."""
+
+    def testEncode(self, dataset):
+        """Tests if JsonEncoder.encode() works as expected."""
+        encoder = json.JsonEncoder()
+
+        assert encoder.encode(dataset).read().decode('utf-8') \
+            == json_.dumps(dataset, indent=2, separators=(',', ': '),
+                           ensure_ascii=False)
+        assert encoder.encode(types.OrderedMap()).read() == b'{}'
+
+    def testEncodeCompact(self, dataset):
+        """Tests if JsonEncoder.encode() compact mode works as expected."""
+        encoder = json.JsonEncoder()
+
+        assert encoder.encode(dataset, compact=True).read().decode('utf-8') \
+            == json_.dumps(dataset, separators=(',', ':'), ensure_ascii=False)
+        assert encoder.encode(dataset, indent=4).read().decode('utf-8') \
+            == json_.dumps(dataset, indent=4, separators=(',', ': '),
+                           ensure_ascii=False)
+
+    def testEncodeStream(self):
+        """Tests if JsonEncoder.encode() consumes row iterators lazily."""
+        rows = (types.OrderedMap(id=_id) for _id in range(3))
+
+        assert json.JsonEncoder().encode(dict(states=rows),
+                                         compact=True).read() \
+            == b'{"states":[{"id":0},{"id":1},{"id":2}]}'
+
+    def testEncodeTableStreams(self, dataset):
+        """Tests if JsonEncoder.encodeStream() streams table rows lazily."""
+        fetched = []
+        writes = []
+
+        def rows(table_rows):
+            for row in table_rows:
+                fetched.append(row)
+                yield row
+
+        class Output(io.BytesIO):
+            """Output file recording the rows fetched at each write."""
+
+            def write(self, data: bytes) -> int:
+                writes.append((len(fetched), data))
+
+                return super().write(data)
+
+        streams = types.OrderedMap(
+            (table_name, datasets.TableStream(None,
+                                              table_name,
+                                              ['id', 'name'],
+                                              rows(table_rows)))
+            for table_name, table_rows in dataset.items())
+        output = Output()
+        json.JsonEncoder().encodeStream(streams, output)
+
+        assert output.getvalue().decode('utf-8') \
+            == json_.dumps(dataset, indent=2, separators=(',', ': '),
+                           ensure_ascii=False)
+        # Each row is written before the next one is fetched
+        assert [count for count, data in writes if b'"id"' in data] \
+            == [1, 2, 3]
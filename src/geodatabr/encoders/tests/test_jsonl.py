@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""JSON Lines encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.encoders import jsonl
+
+# Classes
+
+
+class TestJsonLinesEncoder(object):
+    """Tests JsonLinesEncoder class methods."""
+
+    def testEncode(self):
+        """Tests if JsonLinesEncoder.encode() works as expected."""
+        rows = (types.OrderedMap(id=_id, name=name)
+                for _id, name in [(11, 'Rondônia'), (35, 'São Paulo')])
+
+        assert jsonl.JsonLinesEncoder().encode(rows).read().decode('utf-8') \
+            == ('{"id":11,"name":"Rondônia"}\n'
+                '{"id":35,"name":"São Paulo"}\n')
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""MessagePack encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.encoders import msgpack
+
+# Classes
+
+
+class TestMessagePackEncoder(object):
+    """Tests MessagePackEncoder class methods."""
+
+    def testEncode(self):
+        """Tests if MessagePackEncoder.encode() works as expected."""
+        msgpack_ = pytest.importorskip('msgpack')
+        dataset = types.OrderedMap(
+            states=types.List([types.OrderedMap(id=11, name='Rondônia'),
+                               types.OrderedMap(id=35, name='São Paulo')]),
+            mesoregions=iter([types.OrderedMap(id=3501,
+                                               state_id=35,
+                                               name='Oeste')]))
+        encoded = msgpack.MessagePackEncoder().encode(dataset).read()
+
+        assert msgpack_.unpackb(encoded) \
+            == dict(states=[dict(id=11, name='Rondônia'),
+                            dict(id=35, name='São Paulo')],
+                    mesoregions=[dict(id=3501, state_id=35, name='Oeste')])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Apache Parquet encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import datasets, types
+from geodatabr.dataset import schema
+from geodatabr.encoders import parquet
+
+# Classes
+
+
+class TestParquetEncoder(object):
+    """Tests ParquetEncoder class methods."""
+
+    def testEncode(self):
+        """Tests if ParquetEncoder.encode() works as expected."""
+        pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+        rows = datasets.TableStream(
+            schema.Mesoregion.__table__,
+            'mesorregioes',
+            ['id', 'uf_id', 'nome'],
+            iter([types.OrderedMap(id=3502, uf_id=35, nome='Oeste'),
+                  types.OrderedMap(id=1101, uf_id=11, nome='Leste'),
+                  types.OrderedMap(id=5201, uf_id=52, nome='Norte'),
+                  types.OrderedMap(id=3501, uf_id=35, nome='Leste')]))
+        parquet_file = pyarrow_parquet.ParquetFile(
+            parquet.ParquetEncoder().encode(rows, row_group_size=2))
+        row_groups = [parquet_file.metadata.row_group(row_group)
+                      for row_group in range(2)]
+
+        assert parquet_file.metadata.num_row_groups == 2
+        assert [(row_group.column(1).statistics.min,
+                 row_group.column(1).statistics.max)
+                for row_group in row_groups] == [(11, 35), (35, 52)]
+        assert row_groups[1].column(2).statistics is None
+        assert parquet_file.read().to_pydict() \
+            == dict(id=[1101, 3501, 3502, 5201],
+                    uf_id=[11, 35, 35, 52],
+                    nome=['Leste', 'Leste', 'Oeste', 'Norte'])
+
+    def testRowGroupSize(self):
+        """Tests if the larger tables are split into many row groups."""
+        pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+        rows = datasets.TableStream(
+            schema.Municipality.__table__,
+            'municipalities',
+            ['id', 'microregion_id', 'mesoregion_id', 'state_id', 'name'],
+            iter([types.OrderedMap(id=_id,
+                                   microregion_id=_id // 1000,
+                                   mesoregion_id=_id // 10000,
+                                   state_id=_id // 100000,
+                                   name=str(_id))
+                  for _id in range(5300000, 1100000, -800)]))
+        parquet_file = pyarrow_parquet.ParquetFile(
+            parquet.ParquetEncoder().encode(rows))
+        states = [parquet_file.metadata.row_group(row_group).column(3)
+                  .statistics for row_group
+                  in range(parquet_file.metadata.num_row_groups)]
+
+        assert parquet_file.metadata.num_row_groups == 6
+        assert all(previous.max <= following.min
+                   for previous, following in zip(states, states[1:]))
@@ -5,10 +5,13 @@
 """TSV encoder module."""
 # Imports
 
+# Built-in dependencies
+
+from typing import BinaryIO, Iterable
+
 # Package dependencies
 
 from geodatabr.core import encoders
-from geodatabr.core.utils import io
 from geodatabr.encoders import csv
 
 # Classes
@@ -70,22 +73,21 @@ class TsvEncoder(encoders.Encoder):
         """Gets the default encoding options."""
         return dict(delimiter='\t')
 
-    def encode(self, data: list, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: Iterable, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a TSV file-like stream.
+        Encodes the data into a TSV file.
 
         Args:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A TSV file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            return csv.CsvEncoder().encode(data,
-                                           **dict(self.options, **options))
+            csv.CsvEncoder().encodeStream(data,
+                                          fileobj,
+                                          **dict(self.options, **options))
         except Exception:
             raise encoders.EncodeError
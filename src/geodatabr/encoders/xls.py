@@ -5,6 +5,10 @@
 """Microsoft Excel Spreadsheet file encoder module."""
 # Imports
 
+# Built-in dependencies
+
+from typing import BinaryIO
+
 # External dependencies
 
 import pyexcel_xls
@@ -12,7 +16,6 @@ import pyexcel_xls
 # Package dependencies
 
 from geodatabr.core import encoders, types
-from geodatabr.core.utils import io
 
 # Classes
 
@@ -67,31 +70,25 @@ class MicrosoftExcelEncoder(encoders.Encoder):
 
     format = MicrosoftExcelFormat
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a Microsoft Excel Spreadsheet file-like stream.
+        Encodes the data into a Microsoft Excel Spreadsheet file.
 
         Arguments:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A Microsoft Excel Spreadsheet file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            xls_file = io.BinaryFileStream()
             xls_data = types.OrderedMap()
 
             for entity, records in data.items():
                 xls_data[entity] = [list(records.first().keys())] \
                     + [list(record.values()) for record in records]
 
-            pyexcel_xls.save_data(xls_file, xls_data)
-            xls_file.seek(0)
-
-            return xls_file
+            pyexcel_xls.save_data(fileobj, xls_data)
         except Exception:
             raise encoders.EncodeError
@@ -5,6 +5,10 @@
 """Office Open XML Workbook file encoder module."""
 # Imports
 
+# Built-in dependencies
+
+from typing import BinaryIO
+
 # External dependencies
 
 import pyexcel_xlsx
@@ -12,7 +16,6 @@ import pyexcel_xlsx
 # Package dependencies
 
 from geodatabr.core import encoders, types
-from geodatabr.core.utils import io
 
 # Classes
 
@@ -67,31 +70,30 @@ class OfficeOpenXmlWorkbookEncoder(encoders.Encoder):
 
     format = OfficeOpenXmlWorkbookFormat
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    @property
+    def isStreamable(self) -> bool:
+        """Tells whether the encoder writes its output sequentially or not."""
+        return False
+
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a Office Open XML Workbook file-like stream.
+        Encodes the data into a Office Open XML Workbook file.
 
         Arguments:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A Office Open XML Workbook file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            xlsx_file = io.BinaryFileStream()
             xlsx_data = types.OrderedMap()
 
             for entity, records in data.items():
                 xlsx_data[entity] = [list(records.first().keys())] \
                     + [list(record.values()) for record in records]
 
-            pyexcel_xlsx.save_data(xlsx_file, xlsx_data)
-            xlsx_file.seek(0)
-
-            return xlsx_file
+            pyexcel_xlsx.save_data(fileobj, xlsx_data)
         except Exception:
             raise encoders.EncodeError
@@ -5,6 +5,11 @@
 """YAML encoder module."""
 # Imports
 
+# Built-in dependencies
+
+import codecs
+from typing import BinaryIO
+
 # External dependencies
 
 import yaml
@@ -12,7 +17,6 @@ import yaml
 # Package dependencies
 
 from geodatabr.core import encoders
-from geodatabr.core.utils import io
 from geodatabr.encoders.yaml import utils
 
 # Classes
@@ -68,25 +72,22 @@ class YamlEncoder(encoders.Encoder):
         return dict(allow_unicode=True,
                     default_flow_style=False)
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    def encodeStream(self, data: dict, fileobj: BinaryIO, **options):
         """
-        Encodes the data into a YAML file-like stream.
+        Encodes the data into a YAML file.
 
         Args:
             data: The data to encode
+            fileobj: The writable binary file
             **options: The encoding options
 
-        Returns:
-            A YAML file-like stream
-
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
             utils.register_representers()
-
-            return io.BinaryFileStream(
-                yaml.dump(data, **dict(self.options, **options))
-                .encode('utf-8'))
+            yaml.dump(data,
+                      codecs.getwriter('utf-8')(fileobj),
+                      **dict(self.options, **options))
         except Exception:
             raise encoders.EncodeError
@@ -15,8 +15,8 @@ import setuptools
 
 # Compatibility check
 
-if sys.version_info[:2] < (3, 4):
-    raise RuntimeError('Python version >= 3.4 required')
+if sys.version_info[:2] < (3, 5):
+    raise RuntimeError('Python version >= 3.5 required')
 
 # Routines
 
@@ -49,11 +49,11 @@ setuptools.setup(
     },
 
     # Package dependencies
-    python_requires='>=3.4',
+    python_requires='>=3.5',
     install_requires=[
         # geodatabr package
+        'aiohttp',
         'pytest',
-        'ratelimit',
         'requests',
         # geodatabr.core package
         'datapackage',
@@ -66,4 +66,13 @@ setuptools.setup(
         'pyexcel-xls',
         'pyexcel-xlsx',
     ],
+    extras_require={
+        # geodatabr.encoders package
+        'arrow': ['pyarrow'],
+        'cbor': ['cbor2'],
+        'msgpack': ['msgpack'],
+        'parquet': ['pyarrow'],
+        # geodatabr.core.utils.compression module
+        'zstd': ['zstandard'],
+    },
 )